@@ -1,6 +1,9 @@
 """Parse docstrings as per Sphinx notation."""
 
+from .batch import parse_many, parse_many_unordered
+from .cache import CacheInfo, ParseCache, SqliteParseCache
 from .common import (
+    DeadlineExceededError,
     Docstring,
     DocstringDeprecated,
     DocstringMeta,
@@ -8,10 +11,19 @@ from .common import (
     DocstringRaises,
     DocstringReturns,
     DocstringStyle,
+    InputTooLongError,
     ParseError,
+    ParseLimitError,
     RenderingStyle,
 )
-from .parser import compose, parse, parse_from_object
+from .extract import ExtractedDocstring, extract_from_source
+from .parser import (
+    compose,
+    get_parse_cache,
+    parse,
+    parse_from_object,
+    set_parse_cache,
+)
 from .util import combine_docstrings
 
 Style = DocstringStyle  # backwards compatibility
@@ -19,9 +31,21 @@ Style = DocstringStyle  # backwards compatibility
 __all__ = [
     "parse",
     "parse_from_object",
+    "extract_from_source",
+    "parse_many",
+    "parse_many_unordered",
     "combine_docstrings",
     "compose",
+    "set_parse_cache",
+    "get_parse_cache",
+    "ParseCache",
+    "SqliteParseCache",
+    "CacheInfo",
+    "ExtractedDocstring",
     "ParseError",
+    "ParseLimitError",
+    "InputTooLongError",
+    "DeadlineExceededError",
     "Docstring",
     "DocstringMeta",
     "DocstringParam",
@@ -0,0 +1,242 @@
+"""Command line interface, dumping the docstrings of a package as JSON."""
+
+import argparse
+import importlib.util
+import json
+import os
+import pathlib
+import sys
+import typing as T
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .common import DocstringStyle
+from .extract import extract_from_source
+
+_Record = T.Dict[str, T.Any]
+
+
+# Directories holding no sources of the package itself, besides the hidden
+# ones such as ".git" or ".venv", and the virtualenvs of any name.
+_SKIPPED_DIRS = {"__pycache__", "site-packages", "dist-packages"}
+
+
+def _is_skipped_dir(path: pathlib.Path) -> bool:
+    return (
+        path.name.startswith(".")
+        or path.name in _SKIPPED_DIRS
+        or (path / "pyvenv.cfg").is_file()
+    )
+
+
+def _find_package_sources(
+    root: pathlib.Path, package: str
+) -> T.Iterator[T.Tuple[pathlib.Path, str]]:
+    for dirpath, dirnames, filenames in os.walk(root):
+        directory = pathlib.Path(dirpath)
+        # Skipped directories are pruned from the walk, not just filtered.
+        dirnames[:] = [
+            name for name in dirnames if not _is_skipped_dir(directory / name)
+        ]
+        for filename in filenames:
+            if not filename.endswith(".py"):
+                continue
+            path = directory / filename
+            parts = list(path.relative_to(root).with_suffix("").parts)
+            if parts[-1] == "__init__":
+                parts.pop()
+            yield path, ".".join([package] + parts)
+
+
+def find_sources(target: str) -> T.List[T.Tuple[pathlib.Path, str]]:
+    """Find the source files of a package.
+
+    Only the packages themselves are imported when given by name, to locate
+    them, but not their modules.
+
+    The hidden directories, virtualenvs and installed packages found in the
+    package directories are skipped.
+
+    :param target: path to a source file or a directory, or the name of a
+        module or package
+    :returns: paths of the source files along with their module names,
+        sorted by the module names
+    :raises ValueError: if nothing can be found
+    """
+    path = pathlib.Path(target)
+    if path.is_dir():
+        sources = list(_find_package_sources(path, path.resolve().name))
+    elif path.is_file():
+        sources = [(path, path.stem)]
+    else:
+        try:
+            spec = importlib.util.find_spec(target)
+        except (ImportError, ValueError):
+            spec = None
+        if spec is None:
+            raise ValueError(f"No such file, directory or module: {target}")
+        if spec.submodule_search_locations:
+            sources = [
+                source
+                for root in spec.submodule_search_locations
+                for source in _find_package_sources(pathlib.Path(root), target)
+            ]
+        elif spec.origin and spec.origin.endswith(".py"):
+            sources = [(pathlib.Path(spec.origin), target)]
+        else:
+            raise ValueError(f"No Python sources of module: {target}")
+    return sorted(sources, key=lambda source: (source[1], source[0]))
+
+
+def extract_records(
+    path: pathlib.Path, module: str, style: DocstringStyle
+) -> T.List[_Record]:
+    """Extract the docstrings of a source file as JSON records.
+
+    :param path: path to the source file
+    :param module: name of the module
+    :param style: docstring style
+    :returns: a record for each docstring, or a single record with the error
+        that prevented reading the file; the errors of malformed docstrings
+        are listed in their diagnostics instead
+    """
+    try:
+        return [
+            {
+                "path": str(path),
+                "module": module,
+                "qualname": qualname,
+                "kind": kind,
+                "docstring": docstring.to_dict(),
+            }
+            for qualname, kind, docstring in extract_from_source(
+                path, style, errors="collect"
+            )
+        ]
+    except (OSError, SyntaxError, UnicodeDecodeError) as ex:
+        return [
+            {
+                "path": str(path),
+                "module": module,
+                "error": f"{type(ex).__name__}: {ex}",
+            }
+        ]
+
+
+def _dump_records(
+    path: pathlib.Path, module: str, style: DocstringStyle
+) -> T.List[T.Tuple[T.Optional[str], str]]:
+    # The records are sent back from the worker processes already dumped,
+    # which is much faster than pickling them.
+    return [
+        (record.get("error"), json.dumps(record))
+        for record in extract_records(path, module, style)
+    ]
+
+
+def _iter_records(
+    sources: T.List[T.Tuple[pathlib.Path, str]],
+    style: DocstringStyle,
+    jobs: int,
+    unordered: bool,
+) -> T.Iterator[T.Tuple[str, T.Optional[str], str]]:
+    if jobs == 1:
+        for path, module in sources:
+            for error, line in _dump_records(path, module, style):
+                yield str(path), error, line
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(_dump_records, path, module, style): path
+            for path, module in sources
+        }
+        for future in as_completed(futures) if unordered else futures:
+            for error, line in future.result():
+                yield str(futures[future]), error, line
+
+
+def _parse_args(argv: T.Optional[T.List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m docstring_parser",
+        description="Parse the docstrings of Python source files, without "
+        "importing them, and print them as JSON.",
+    )
+    parser.add_argument(
+        "target",
+        help="source file, directory, or the name of a module or package",
+    )
+    parser.add_argument(
+        "-s",
+        "--style",
+        choices=[style.name.lower() for style in DocstringStyle],
+        default="auto",
+        help="docstring style (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of processes parsing the files (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=["jsonl", "json"],
+        default="jsonl",
+        help="print a record per line or a single JSON array "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "-u",
+        "--unordered",
+        action="store_true",
+        help="print the records of each file as soon as it's parsed",
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("the number of jobs must be positive")
+    return args
+
+
+def main(argv: T.Optional[T.List[str]] = None) -> int:
+    """Print a JSON record for every docstring of a package.
+
+    Each record has the path and name of the module, and the qualified name,
+    kind and parsed docstring of the documented object. Files that can't be
+    parsed result in records with an error message instead.
+
+    :param argv: command line arguments
+    :returns: exit code, 1 if some files couldn't be parsed
+    """
+    args = _parse_args(argv)
+    try:
+        sources = find_sources(args.target)
+    except ValueError as ex:
+        print(f"error: {ex}", file=sys.stderr)
+        return 2
+
+    errors = 0
+    style = DocstringStyle[args.style.upper()]
+    separator = ""
+    if args.format == "json":
+        sys.stdout.write("[")
+        separator = "\n"
+    for path, error, line in _iter_records(
+        sources, style, args.jobs, args.unordered
+    ):
+        if error:
+            errors += 1
+            print(f"{path}: {error}", file=sys.stderr)
+        if args.format == "json":
+            sys.stdout.write(separator + line)
+            separator = ",\n"
+        else:
+            sys.stdout.write(line + "\n")
+    if args.format == "json":
+        sys.stdout.write("\n]\n")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
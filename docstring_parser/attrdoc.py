@@ -5,6 +5,9 @@
 
 import ast
 import inspect
+import linecache
+import os
+import sys
 import textwrap
 import typing as T
 from types import ModuleType
@@ -57,6 +60,9 @@ def ast_get_attribute(
     return None
 
 
+_AttrDocs = T.Dict[str, T.Tuple[str, T.Optional[str], T.Optional[str]]]
+
+
 class AttributeDocstrings(ast.NodeVisitor):
     """An ast.NodeVisitor that collects attribute docstrings."""
 
@@ -80,10 +86,21 @@ class AttributeDocstrings(ast.NodeVisitor):
     ) -> T.Dict[str, T.Tuple[str, T.Optional[str], T.Optional[str]]]:
         """Get attribute docstrings from the given component.
 
+        The source files are parsed once and the results are cached, see
+        ``clear_cache``.
+
         :param component: component to process (class or module)
         :returns: for each attribute docstring, a tuple with (description,
             type, default)
         """
+        source_file = _get_source_file(component)
+        if source_file is not None:
+            if inspect.ismodule(component):
+                return dict(source_file.module_docs)
+            attr_docs = source_file.get_class_docs(component.__qualname__)
+            if attr_docs is not None:
+                return dict(attr_docs)
+
         self.attr_docs = {}
         self.prev_attr = None
         try:
@@ -100,20 +117,163 @@ class AttributeDocstrings(ast.NodeVisitor):
                 self.visit(tree.body[0])
         return self.attr_docs
 
+    def collect(self, node: ast.AST, nested: bool = True) -> _AttrDocs:
+        """Get attribute docstrings from the given AST node.
 
-def add_attribute_docstrings(
-    obj: T.Union[type, ModuleType], docstring: Docstring
-) -> None:
-    """Add attribute docstrings found in the object's source code.
+        :param node: module or class definition to process
+        :param nested: include the attributes of nested classes, like
+            ``get_attr_docs`` does
+        :returns: for each attribute docstring, a tuple with (description,
+            type, default)
+        """
+        self.attr_docs = {}
+        self.prev_attr = None
+        if nested:
+            self.visit(node)
+        else:
+            for child in getattr(node, "body", ()):
+                if isinstance(child, ast.ClassDef):
+                    self.prev_attr = None
+                else:
+                    self.visit(child)
+        return self.attr_docs
 
-    :param obj: object from which to parse attribute docstrings
-    :param docstring: Docstring object where found attributes are added
-    :returns: list with names of added attributes
+
+class _ClassIndex(ast.NodeVisitor):
+    """An ast.NodeVisitor that finds the first line of every class, by its
+    qualified name.
+
+    Follows ``inspect.getsource``, with None marking the qualified names of
+    more than one class.
+    """
+
+    def __init__(self) -> None:
+        self.stack: T.List[str] = []
+        self.first_lines: T.Dict[str, T.Optional[int]] = {}
+
+    def visit_FunctionDef(  # pylint: disable=invalid-name
+        self, node: T.Union[ast.FunctionDef, ast.AsyncFunctionDef]
+    ) -> None:
+        """Enter the local scope of a function."""
+        self.stack.append(node.name)
+        self.stack.append("<locals>")
+        self.generic_visit(node)
+        self.stack.pop()
+        self.stack.pop()
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(  # pylint: disable=invalid-name
+        self, node: ast.ClassDef
+    ) -> None:
+        """Record the class and enter its scope."""
+        self.stack.append(node.name)
+        qualname = ".".join(self.stack)
+        if qualname in self.first_lines:
+            self.first_lines[qualname] = None
+        elif node.decorator_list:
+            self.first_lines[qualname] = node.decorator_list[0].lineno - 1
+        else:
+            self.first_lines[qualname] = node.lineno - 1
+        self.generic_visit(node)
+        self.stack.pop()
+
+
+class _SourceFile:
+    """Attribute docstrings of a source file."""
+
+    __slots__ = ("stat", "lines", "module_docs", "first_lines", "class_docs")
+
+    def __init__(self, stat: T.Tuple[int, int], lines: T.List[str]) -> None:
+        self.stat = stat
+        self.lines = lines
+        tree = ast.parse(textwrap.dedent("".join(lines)))
+        self.module_docs = AttributeDocstrings().collect(tree)
+        index = _ClassIndex()
+        index.visit(tree)
+        self.first_lines = index.first_lines
+        self.class_docs: T.Dict[str, _AttrDocs] = {}
+
+    def get_class_docs(self, qualname: str) -> T.Optional[_AttrDocs]:
+        """Get attribute docstrings of the class with the given qualified
+        name.
+
+        :param qualname: qualified name of the class
+        :returns: attribute docstrings or None if the class can't be told
+            apart from others by its name
+        """
+        attr_docs = self.class_docs.get(qualname)
+        if attr_docs is not None:
+            return attr_docs
+        if qualname not in self.first_lines:
+            # Like inspect.getsource, give up on classes defined elsewhere.
+            return {}
+        first_line = self.first_lines[qualname]
+        if first_line is None:
+            return None
+        source = "".join(inspect.getblock(self.lines[first_line:]))
+        tree = ast.parse(textwrap.dedent(source))
+        attr_docs = {}
+        if isinstance(tree.body[0], ast.ClassDef):
+            attr_docs = AttributeDocstrings().collect(tree.body[0])
+        self.class_docs[qualname] = attr_docs
+        return attr_docs
+
+
+_SOURCE_FILES: T.Dict[str, _SourceFile] = {}
+
+
+def _get_source_file(component: T.Any) -> T.Optional[_SourceFile]:
+    """Get the cached source file that defines the component.
+
+    :param component: class or module
+    :returns: the source file or None if it needs to be looked up by
+        ``inspect.getsource``
+    """
+    if hasattr(component, "__wrapped__"):
+        return None
+    if inspect.ismodule(component):
+        module = component
+    else:
+        module = sys.modules.get(component.__module__)
+    try:
+        path = inspect.getsourcefile(component)
+        if not path or module is None:
+            return None
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    source_file = _SOURCE_FILES.get(path)
+    if source_file is None or source_file.stat != key:
+        linecache.checkcache(path)
+        lines = linecache.getlines(path, module.__dict__)
+        if not lines:
+            return None
+        source_file = _SourceFile(key, lines)
+        _SOURCE_FILES[path] = source_file
+    return source_file
+
+
+def clear_cache() -> None:
+    """Forget the source files parsed for attribute docstrings.
+
+    The cached files are also reparsed whenever their modification time or
+    size changes.
+    """
+    _SOURCE_FILES.clear()
+
+
+def add_attribute_params(docstring: Docstring, attr_docs: _AttrDocs) -> None:
+    """Add attribute docstrings as params, unless already documented.
+
+    :param docstring: Docstring object where the attributes are added
+    :param attr_docs: attribute docstrings, as returned by
+        ``AttributeDocstrings.get_attr_docs``
     """
     params = set(p.arg_name for p in docstring.params)
-    for arg_name, (description, type_name, default) in (
-        AttributeDocstrings().get_attr_docs(obj).items()
-    ):
+    for arg_name, (description, type_name, default) in attr_docs.items():
         if arg_name not in params:
             param = DocstringParam(
                 args=["attribute", arg_name],
@@ -124,3 +284,15 @@ def add_attribute_docstrings(
                 default=default,
             )
             docstring.meta.append(param)
+
+
+def add_attribute_docstrings(
+    obj: T.Union[type, ModuleType], docstring: Docstring
+) -> None:
+    """Add attribute docstrings found in the object's source code.
+
+    :param obj: object from which to parse attribute docstrings
+    :param docstring: Docstring object where found attributes are added
+    :returns: list with names of added attributes
+    """
+    add_attribute_params(docstring, AttributeDocstrings().get_attr_docs(obj))
@@ -0,0 +1,172 @@
+"""Parsing of many docstrings at once."""
+
+import itertools
+import typing as T
+
+from .common import Docstring, DocstringStyle
+from .parser import parse
+from .serialize import Payload, decode, encode
+
+# The pools are imported only when used, as the process pools pull in
+# multiprocessing, which is slow to import.
+if T.TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+EXECUTORS = {"serial", "thread", "process"}
+
+
+def _parse_chunk(
+    texts: T.List[T.Optional[str]], style: DocstringStyle
+) -> T.List[Docstring]:
+    return [parse(text, style=style) for text in texts]
+
+
+def _parse_chunk_encoded(
+    texts: T.List[T.Optional[str]], style: DocstringStyle
+) -> Payload:
+    # Sending the docstrings back from a process in the compact encoding is
+    # faster than pickling them.
+    return encode(_parse_chunk(texts, style))
+
+
+def _chunk_parser(
+    pool: "Executor",
+) -> T.Tuple[T.Callable[..., T.Any], T.Callable[[T.Any], T.List[Docstring]]]:
+    from concurrent.futures import (  # pylint: disable=import-outside-toplevel
+        ProcessPoolExecutor,
+    )
+
+    if isinstance(pool, ProcessPoolExecutor):
+        return _parse_chunk_encoded, decode
+    return _parse_chunk, list
+
+
+def _chunks(
+    texts: T.Iterable[T.Optional[str]], chunksize: int
+) -> T.Iterator[T.List[T.Optional[str]]]:
+    iterator = iter(texts)
+    while True:
+        chunk = list(itertools.islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _new_executor(executor: str, max_workers: T.Optional[int]) -> "Executor":
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers)
+    if executor == "process":
+        return ProcessPoolExecutor(max_workers=max_workers)
+    raise ValueError(f"Unknown executor: {executor!r}.")
+
+
+def _check_args(executor: T.Union[str, "Executor"], chunksize: int) -> None:
+    if isinstance(executor, str) and executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor: {executor!r}.")
+    if chunksize < 1:
+        raise ValueError("Chunk size must be positive.")
+
+
+def parse_many(
+    texts: T.Iterable[T.Optional[str]],
+    style: DocstringStyle = DocstringStyle.AUTO,
+    executor: T.Union[str, "Executor"] = "serial",
+    chunksize: int = 64,
+    max_workers: T.Optional[int] = None,
+) -> T.List[Docstring]:
+    """Parse many docstrings, possibly in parallel.
+
+    The texts are sent to the workers in chunks, which keeps the overhead
+    of dispatching the work low compared to parsing every text separately.
+
+    :param texts: docstring texts to parse
+    :param style: docstring style
+    :param executor: "serial" to parse in the current thread, "thread" or
+        "process" to parse in a pool of threads or processes, or an existing
+        ``concurrent.futures.Executor`` to use
+    :param chunksize: number of texts sent to a worker at once
+    :param max_workers: size of the pool created for "thread" or "process"
+    :returns: parsed docstrings in the same order as the texts
+    """
+    _check_args(executor, chunksize)
+    if executor == "serial":
+        return [parse(text, style=style) for text in texts]
+
+    if isinstance(executor, str):
+        with _new_executor(executor, max_workers) as pool:
+            return _parse_ordered(texts, style, pool, chunksize)
+    return _parse_ordered(texts, style, executor, chunksize)
+
+
+def _parse_ordered(
+    texts: T.Iterable[T.Optional[str]],
+    style: DocstringStyle,
+    pool: "Executor",
+    chunksize: int,
+) -> T.List[Docstring]:
+    ret: T.List[Docstring] = []
+    parse_chunk, load_chunk = _chunk_parser(pool)
+    chunks = _chunks(texts, chunksize)
+    for result in pool.map(parse_chunk, chunks, itertools.repeat(style)):
+        ret.extend(load_chunk(result))
+    return ret
+
+
+def parse_many_unordered(
+    texts: T.Iterable[T.Optional[str]],
+    style: DocstringStyle = DocstringStyle.AUTO,
+    executor: T.Union[str, "Executor"] = "serial",
+    chunksize: int = 64,
+    max_workers: T.Optional[int] = None,
+) -> T.Iterator[T.Tuple[int, Docstring]]:
+    """Parse many docstrings, yielding them as soon as they are ready.
+
+    Takes the same arguments as ``parse_many``.
+
+    A pool created for "thread" or "process" is shut down once the iterator
+    is exhausted or closed. Iterators that are abandoned before that keep
+    the pool until they are garbage collected, so they should be closed,
+    for example with ``contextlib.closing``.
+
+    :returns: pairs of the index of the text and its parsed docstring, in
+        the order of completion
+    """
+    _check_args(executor, chunksize)
+    if executor == "serial":
+        return ((i, parse(text, style=style)) for i, text in enumerate(texts))
+    return _parse_unordered(texts, style, executor, chunksize, max_workers)
+
+
+def _parse_unordered(
+    texts: T.Iterable[T.Optional[str]],
+    style: DocstringStyle,
+    executor: T.Union[str, "Executor"],
+    chunksize: int,
+    max_workers: T.Optional[int],
+) -> T.Iterator[T.Tuple[int, Docstring]]:
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import as_completed
+
+    owned = isinstance(executor, str)
+    pool = _new_executor(executor, max_workers) if owned else executor
+    futures = {}
+    try:
+        parse_chunk, load_chunk = _chunk_parser(pool)
+        start = 0
+        for chunk in _chunks(texts, chunksize):
+            futures[pool.submit(parse_chunk, chunk, style)] = start
+            start += len(chunk)
+        for future in as_completed(futures):
+            start = futures.pop(future)
+            for i, docstring in enumerate(load_chunk(future.result()), start):
+                yield i, docstring
+    finally:
+        # The chunks left behind when the iteration stops early aren't
+        # parsed anymore.
+        for future in futures:
+            future.cancel()
+        if owned:
+            pool.shutdown()
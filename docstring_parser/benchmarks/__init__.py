@@ -0,0 +1,8 @@
+"""Performance benchmarks of the parsers and composers.
+
+Run them with ``python -m docstring_parser.benchmarks``.
+"""
+
+from .runner import Regression, compare, run_benchmarks
+
+__all__ = ["run_benchmarks", "compare", "Regression"]
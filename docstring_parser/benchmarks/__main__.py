@@ -0,0 +1,113 @@
+"""Command line interface of the benchmarks."""
+
+import argparse
+import json
+import sys
+import typing as T
+
+from .corpus import SYNTHETIC_SIZES
+from .runner import compare, run_benchmarks
+
+
+def _parse_args(argv: T.Optional[T.List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m docstring_parser.benchmarks",
+        description="Measure the performance of docstring_parser.",
+    )
+    parser.add_argument(
+        "-o", "--output", help="write the results to this JSON file"
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        help="compare the results with the ones saved in this JSON file",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="tolerated relative slowdown against the baseline "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "-r",
+        "--rounds",
+        type=int,
+        default=5,
+        help="number of times each benchmark processes its inputs "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "-n",
+        "--limit",
+        type=int,
+        help="maximum number of standard library docstrings to use",
+    )
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=list(SYNTHETIC_SIZES),
+        help="comma separated sizes of the synthetic docstrings "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "-k", "--select", help="run only the benchmarks containing this name"
+    )
+    parser.add_argument(
+        "-m",
+        "--memory",
+        action="store_true",
+        help="also measure the memory used by parsed docstrings",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: T.Optional[T.List[str]] = None) -> int:
+    """Run the benchmarks and report the results.
+
+    :param argv: command line arguments
+    :returns: exit code, 1 if some benchmarks got slower than the baseline
+    """
+    args = _parse_args(argv)
+    results = run_benchmarks(
+        rounds=args.rounds,
+        stdlib_limit=args.limit,
+        sizes=args.sizes,
+        select=args.select,
+        memory=args.memory,
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+            handle.write("\n")
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as handle:
+        baseline = json.load(handle)
+    if baseline.get("python") != results["python"]:
+        print(
+            f"warning: the baseline was recorded with Python "
+            f"{baseline.get('python')}, whose standard library docstrings "
+            f"may differ",
+            file=sys.stderr,
+        )
+    regressions = compare(baseline, results, threshold=args.threshold)
+    for regression in regressions:
+        print(
+            f"{regression.name}: {regression.slowdown:.1%} slower "
+            f"({regression.baseline:.1f} -> {regression.current:.1f} ops/s)",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+"""Reproducible inputs for the benchmarks."""
+
+import importlib
+import inspect
+import typing as T
+
+from docstring_parser.common import DocstringStyle
+
+# Modules whose docstrings make up the real-world part of the corpus. They
+# are plain Python modules, so their source is available for attribute
+# docstrings too.
+STDLIB_MODULES = (
+    "argparse",
+    "ast",
+    "asyncio.tasks",
+    "calendar",
+    "collections",
+    "concurrent.futures._base",
+    "configparser",
+    "csv",
+    "dataclasses",
+    "difflib",
+    "email.message",
+    "enum",
+    "fractions",
+    "functools",
+    "http.client",
+    "inspect",
+    "json",
+    "logging",
+    "pathlib",
+    "shutil",
+    "string",
+    "subprocess",
+    "tarfile",
+    "textwrap",
+    "threading",
+    "typing",
+    "unittest.case",
+    "urllib.parse",
+    "zipfile",
+)
+
+SYNTHETIC_SIZES = (1, 4, 16, 64)
+
+
+def stdlib_objects(limit: T.Optional[int] = None) -> T.List[T.Any]:
+    """Collect the documented modules, classes and functions of the standard
+    library modules from ``STDLIB_MODULES``.
+
+    The objects are listed in a stable order: each module is followed by the
+    objects defined in it sorted by name, and each class by its methods.
+
+    :param limit: maximum number of objects to collect
+    :returns: list of objects with a docstring
+    """
+    ret: T.List[T.Any] = []
+    seen: T.Set[int] = set()
+
+    def add(obj: T.Any) -> None:
+        if id(obj) not in seen and isinstance(obj.__doc__, str):
+            seen.add(id(obj))
+            ret.append(obj)
+
+    for module_name in STDLIB_MODULES:
+        module = importlib.import_module(module_name)
+        add(module)
+        for name, obj in sorted(vars(module).items()):
+            if not (inspect.isclass(obj) or inspect.isfunction(obj)):
+                continue
+            # Skip aliases and objects imported from elsewhere.
+            if obj.__name__ != name or obj.__module__ != module.__name__:
+                continue
+            add(obj)
+            if inspect.isclass(obj):
+                for _attr_name, attr in sorted(vars(obj).items()):
+                    if inspect.isfunction(attr):
+                        add(attr)
+
+    return ret[:limit]
+
+
+def stdlib_docstrings(limit: T.Optional[int] = None) -> T.List[str]:
+    """Collect the distinct docstrings of the standard library objects.
+
+    :param limit: maximum number of docstrings to collect
+    :returns: list of raw docstrings, as found in ``__doc__``
+    """
+    texts = dict.fromkeys(obj.__doc__ for obj in stdlib_objects())
+    return list(texts)[:limit]
+
+
+def _param_names(size: int) -> T.List[str]:
+    return [f"arg{i}" for i in range(size)]
+
+
+def synthetic_docstring(style: DocstringStyle, size: int) -> str:
+    """Generate a docstring in the given style.
+
+    The docstring documents ``size`` parameters and has a long description of
+    ``size`` lines, a return value and ``size // 4 + 1`` exceptions.
+
+    :param style: docstring style, other than AUTO
+    :param size: number of documented parameters
+    :returns: docstring text
+    """
+    names = _param_names(size)
+    errors = [f"Error{i}" for i in range(size // 4 + 1)]
+    lines = [f"Compute the result of {size} arguments.", ""]
+    lines += [
+        f"Line {i} of the long description, which is long enough to wrap."
+        for i in range(size)
+    ]
+    lines.append("")
+
+    if style == DocstringStyle.REST:
+        for i, name in enumerate(names):
+            lines.append(f":param int {name}: description of {name},")
+            lines.append(f"    defaults to {i}.")
+        lines.append(":returns: description of the result")
+        lines.append(":rtype: int")
+        lines += [f":raises {error}: if {error} happens" for error in errors]
+    elif style == DocstringStyle.GOOGLE:
+        lines.append("Args:")
+        for i, name in enumerate(names):
+            lines.append(
+                f"    {name} (int, optional): description of {name}. "
+                f"Defaults to {i}."
+            )
+            lines.append("        Must be valid.")
+        lines += ["", "Returns:", "    int: description of the result", ""]
+        lines.append("Raises:")
+        lines += [f"    {error}: if {error} happens" for error in errors]
+    elif style == DocstringStyle.NUMPYDOC:
+        lines += ["Parameters", "----------"]
+        for i, name in enumerate(names):
+            lines.append(f"{name} : int, optional")
+            lines.append(f"    description of {name}.")
+            lines.append(f"    Default is {i}.")
+        lines += ["", "Returns", "-------", "int", "    description", ""]
+        lines += ["Raises", "------"]
+        for error in errors:
+            lines += [error, f"    if {error} happens"]
+    elif style == DocstringStyle.EPYDOC:
+        for i, name in enumerate(names):
+            lines.append(f"@param {name}: description of {name},")
+            lines.append(f"    defaults to {i}.")
+            lines.append(f"@type {name}: int")
+        lines.append("@return: description of the result")
+        lines.append("@rtype: int")
+        lines += [f"@raise {error}: if {error} happens" for error in errors]
+    else:
+        raise ValueError(f"Cannot generate a docstring in {style} style.")
+
+    return "\n".join(lines)
+
+
+def synthetic_docstrings(
+    style: DocstringStyle, sizes: T.Iterable[int] = SYNTHETIC_SIZES
+) -> T.List[str]:
+    """Generate docstrings of growing size in the given style.
+
+    :param style: docstring style, other than AUTO
+    :param sizes: numbers of documented parameters
+    :returns: list of docstring texts
+    """
+    return [synthetic_docstring(style, size) for size in sizes]
+
+
+def synthetic_function(
+    doc: T.Optional[str], names: T.Iterable[str]
+) -> T.Callable[..., T.Any]:
+    """Create a function with the given docstring and parameter names.
+
+    :param doc: docstring of the function
+    :param names: names of the parameters in the function's signature
+    :returns: the function
+    """
+
+    def func(*_args: T.Any, **_kwargs: T.Any) -> None:
+        pass
+
+    func.__doc__ = doc
+    func.__signature__ = inspect.Signature(  # type: ignore
+        [
+            inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+            for name in names
+        ]
+    )
+    return func
@@ -0,0 +1,295 @@
+"""Running the benchmarks and comparing their results."""
+
+import gc
+import platform
+import sys
+import time
+import tracemalloc
+import typing as T
+from collections import namedtuple
+
+from docstring_parser import epydoc, google, numpydoc, rest
+from docstring_parser.common import DocstringStyle, ParseError, RenderingStyle
+from docstring_parser.parser import parse, parse_from_object
+from docstring_parser.util import combine_docstrings
+
+from . import corpus
+
+FORMAT_VERSION = 1
+
+STYLE_MODULES = {
+    DocstringStyle.REST: rest,
+    DocstringStyle.GOOGLE: google,
+    DocstringStyle.NUMPYDOC: numpydoc,
+    DocstringStyle.EPYDOC: epydoc,
+}
+
+# A function timed on every one of its inputs. The inputs are passed to the
+# function one at a time; strings among them count towards the bytes parsed.
+Benchmark = namedtuple("Benchmark", "name func inputs")
+
+Regression = namedtuple("Regression", "name baseline current slowdown")
+
+
+def _style_name(style: T.Any) -> str:
+    return style.name.lower()
+
+
+def _parses(module: T.Any, text: str) -> bool:
+    try:
+        module.parse(text)
+    except ParseError:
+        return False
+    return True
+
+
+def _composes(module: T.Any, text: str) -> bool:
+    try:
+        docstring = module.parse(text)
+        for rendering_style in RenderingStyle:
+            module.compose(docstring, rendering_style=rendering_style)
+    except (ParseError, ValueError, TypeError, AttributeError):
+        return False
+    return True
+
+
+def _combine(args: T.Tuple[T.Any, ...]) -> None:
+    others, func, doc = args
+    func.__doc__ = doc
+    combine_docstrings(*others)(func)
+
+
+def _combine_inputs(sizes: T.Iterable[int]) -> T.List[T.Tuple[T.Any, ...]]:
+    ret = []
+    for style in STYLE_MODULES:
+        for size in sizes:
+            names = [f"arg{i}" for i in range(size)]
+            others = [
+                corpus.synthetic_function(
+                    corpus.synthetic_docstring(style, size), names
+                ),
+                corpus.synthetic_function(
+                    corpus.synthetic_docstring(style, size // 2 + 1),
+                    names[::2],
+                ),
+            ]
+            func = corpus.synthetic_function(None, names + ["extra"])
+            doc = corpus.synthetic_docstring(style, 1)
+            ret.append((others, func, doc))
+    return ret
+
+
+def collect_benchmarks(
+    stdlib_limit: T.Optional[int] = None,
+    sizes: T.Iterable[int] = corpus.SYNTHETIC_SIZES,
+) -> T.List[Benchmark]:
+    """Build the benchmarks along with their inputs.
+
+    Every style's parser runs on the standard library docstrings it accepts
+    and on the synthetic docstrings of its own style. Every composer runs on
+    those of the docstrings it can render.
+
+    :param stdlib_limit: maximum number of standard library docstrings and
+        objects to use
+    :param sizes: sizes of the synthetic docstrings
+    :returns: list of benchmarks
+    """
+    sizes = list(sizes)
+    stdlib_texts = corpus.stdlib_docstrings(stdlib_limit)
+    synthetic = {
+        style: corpus.synthetic_docstrings(style, sizes)
+        for style in STYLE_MODULES
+    }
+
+    ret = []
+    for style, module in STYLE_MODULES.items():
+        texts = [
+            text for text in stdlib_texts if _parses(module, text)
+        ] + synthetic[style]
+        ret.append(
+            Benchmark(f"parse.{_style_name(style)}", module.parse, texts)
+        )
+
+    all_texts = stdlib_texts + [
+        text for texts in synthetic.values() for text in texts
+    ]
+    ret.append(Benchmark("parse.auto", parse, all_texts))
+
+    for style, module in STYLE_MODULES.items():
+        docstrings = [
+            module.parse(text)
+            for text in stdlib_texts + synthetic[style]
+            if _composes(module, text)
+        ]
+        for rendering_style in RenderingStyle:
+            ret.append(
+                Benchmark(
+                    f"compose.{_style_name(style)}."
+                    f"{_style_name(rendering_style)}",
+                    lambda docstring, module=module, rs=rendering_style: (
+                        module.compose(docstring, rendering_style=rs)
+                    ),
+                    docstrings,
+                )
+            )
+
+    ret.append(
+        Benchmark(
+            "parse_from_object",
+            parse_from_object,
+            corpus.stdlib_objects(stdlib_limit),
+        )
+    )
+    ret.append(
+        Benchmark("combine_docstrings", _combine, _combine_inputs(sizes))
+    )
+    return ret
+
+
+def _percentile(samples: T.List[int], percent: float) -> int:
+    # Nearest-rank percentile of sorted samples.
+    index = max(0, -(-len(samples) * percent // 100) - 1)
+    return samples[int(index)]
+
+
+def time_benchmark(benchmark: Benchmark, rounds: int) -> T.Dict[str, T.Any]:
+    """Time the benchmark's function on each of its inputs.
+
+    All inputs are processed once before the measurements start, to warm up
+    any caches the function relies on. The garbage collector is disabled
+    while timing.
+
+    :param benchmark: benchmark to run
+    :param rounds: number of times to process all the inputs
+    :returns: statistics of the measured latencies, in microseconds
+    """
+    func = benchmark.func
+    inputs = benchmark.inputs
+    for item in inputs:
+        func(item)
+
+    samples = []
+    timer = time.perf_counter_ns
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            for item in inputs:
+                start = timer()
+                func(item)
+                samples.append(timer() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    total = sum(samples)
+    size = sum(len(item) for item in inputs if isinstance(item, str))
+    samples.sort()
+    ret: T.Dict[str, T.Any] = {
+        "items": len(inputs),
+        "rounds": rounds,
+        "total_s": total / 1e9,
+        "ops_per_s": len(samples) / total * 1e9 if total else None,
+        "bytes_per_s": size * rounds / total * 1e9 if total and size else None,
+    }
+    if samples:
+        ret["mean_us"] = total / len(samples) / 1e3
+        for percent in (50, 90, 99):
+            ret[f"p{percent}_us"] = _percentile(samples, percent) / 1e3
+        ret["max_us"] = samples[-1] / 1e3
+    return ret
+
+
+def measure_memory(texts: T.List[str]) -> T.Dict[str, T.Any]:
+    """Measure the memory held by the docstrings parsed from the texts.
+
+    :param texts: docstring texts to parse
+    :returns: counts of the docstrings and their meta items, and the average
+        number of bytes held by a docstring along with its meta items
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        docstrings = [parse(text) for text in texts]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    metas = sum(len(docstring.meta) for docstring in docstrings)
+    return {
+        "docstrings": len(docstrings),
+        "meta": metas,
+        "bytes_per_docstring": (after - before) / max(len(docstrings), 1),
+        "meta_per_docstring": metas / max(len(docstrings), 1),
+    }
+
+
+def run_benchmarks(
+    rounds: int = 5,
+    stdlib_limit: T.Optional[int] = None,
+    sizes: T.Iterable[int] = corpus.SYNTHETIC_SIZES,
+    select: T.Optional[str] = None,
+    memory: bool = False,
+) -> T.Dict[str, T.Any]:
+    """Run the benchmarks.
+
+    :param rounds: number of times each benchmark processes its inputs
+    :param stdlib_limit: maximum number of standard library docstrings and
+        objects to use
+    :param sizes: sizes of the synthetic docstrings
+    :param select: run only the benchmarks whose names contain this string
+    :param memory: also measure the memory used by parsed docstrings
+    :returns: JSON-serializable results
+    """
+    sizes = list(sizes)
+    benchmarks = collect_benchmarks(stdlib_limit, sizes)
+    ret: T.Dict[str, T.Any] = {
+        "format": FORMAT_VERSION,
+        "python": platform.python_version(),
+        "implementation": sys.implementation.name,
+        "platform": platform.platform(),
+        "rounds": rounds,
+        "stdlib_limit": stdlib_limit,
+        "sizes": sizes,
+        "benchmarks": {},
+    }
+    for benchmark in benchmarks:
+        if select is None or select in benchmark.name:
+            ret["benchmarks"][benchmark.name] = time_benchmark(
+                benchmark, rounds
+            )
+
+    if memory:
+        texts = next(b.inputs for b in benchmarks if b.name == "parse.auto")
+        ret["memory"] = {"parse.auto": measure_memory(texts)}
+    return ret
+
+
+def compare(
+    baseline: T.Dict[str, T.Any],
+    current: T.Dict[str, T.Any],
+    threshold: float = 0.1,
+) -> T.List[Regression]:
+    """Find the benchmarks that got slower than in the baseline.
+
+    The benchmarks are compared by their throughput; benchmarks missing from
+    either of the results are ignored.
+
+    :param baseline: results of an earlier run
+    :param current: results of the current run
+    :param threshold: tolerated relative slowdown, e.g. 0.1 for 10%
+    :returns: list of the benchmarks that slowed down more than tolerated
+    """
+    ret = []
+    for name, result in current["benchmarks"].items():
+        base_result = baseline["benchmarks"].get(name)
+        if not base_result:
+            continue
+        base_ops = base_result.get("ops_per_s")
+        ops = result.get("ops_per_s")
+        if not base_ops or not ops:
+            continue
+        slowdown = base_ops / ops - 1
+        if slowdown > threshold:
+            ret.append(Regression(name, base_ops, ops, slowdown))
+    return ret
@@ -0,0 +1,409 @@
+"""Caching of parsed docstrings."""
+
+import abc
+import contextlib
+import copy
+import enum
+import os
+import threading
+import time
+import typing as T
+from collections import OrderedDict, namedtuple
+
+from . import serialize
+from .common import Docstring
+
+# The modules used by the persistent cache alone are imported only when it's
+# used, to keep importing the package fast, and possible on the Python builds
+# without SQLite.
+if T.TYPE_CHECKING:
+    import sqlite3
+
+CacheInfo = namedtuple("CacheInfo", "hits misses evictions maxsize currsize")
+CacheKey = T.Tuple[T.Hashable, ...]
+
+
+def _copy_docstring(docstring: Docstring) -> Docstring:
+    """Copy the docstring so that the cached instance can't be modified.
+
+    The parsers only produce meta objects whose attributes are immutable,
+    except for the ``args`` lists, so along with the diagnostics this is
+    enough to decouple the copy.
+    """
+    ret = copy.copy(docstring)
+    ret.meta = [copy.copy(meta) for meta in docstring.meta]
+    ret.diagnostics = list(docstring.diagnostics)
+    for meta in ret.meta:
+        meta.args = list(meta.args)
+    return ret
+
+
+class BaseParseCache(abc.ABC):
+    """Interface of the caches of parsed docstrings."""
+
+    @abc.abstractmethod
+    def get(self, key: CacheKey) -> T.Optional[Docstring]:
+        """Look up a parsed docstring.
+
+        :param key: text and parser configuration the docstring was parsed
+            with
+        :returns: copy of the cached docstring or None if it isn't cached
+        """
+
+    @abc.abstractmethod
+    def put(self, key: CacheKey, docstring: Docstring) -> None:
+        """Store a parsed docstring.
+
+        :param key: text and parser configuration the docstring was parsed
+            with
+        :param docstring: parsed docstring to store
+        """
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove all cached docstrings and reset the statistics."""
+
+    @abc.abstractmethod
+    def info(self) -> CacheInfo:
+        """Report the cache statistics.
+
+        :returns: numbers of hits, misses and evictions so far, along with
+            the maximum and current number of cached docstrings
+        """
+
+
+class ParseCache(BaseParseCache):
+    """Bounded cache of parsed docstrings with least recently used eviction.
+
+    The cache stores copies of the docstrings and hands out copies, so the
+    callers are free to modify the returned objects.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Initialize self.
+
+        :param maxsize: maximum number of cached docstrings
+        """
+        if maxsize < 1:
+            raise ValueError("Cache size must be positive.")
+        self.maxsize = maxsize
+        self._entries: T.Dict[CacheKey, Docstring] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: CacheKey) -> T.Optional[Docstring]:
+        """Look up a parsed docstring.
+
+        :param key: text and parser configuration the docstring was parsed
+            with
+        :returns: copy of the cached docstring or None if it isn't cached
+        """
+        with self._lock:
+            docstring = self._entries.get(key)
+            if docstring is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return _copy_docstring(docstring)
+
+    def put(self, key: CacheKey, docstring: Docstring) -> None:
+        """Store a parsed docstring, evicting the least recently used one
+        if the cache is full.
+
+        :param key: text and parser configuration the docstring was parsed
+            with
+        :param docstring: parsed docstring to store
+        """
+        docstring = _copy_docstring(docstring)
+        with self._lock:
+            self._entries[key] = docstring
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all cached docstrings and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Report the cache statistics.
+
+        :returns: numbers of hits, misses and evictions so far, along with
+            the maximum and current number of cached docstrings
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                len(self._entries),
+            )
+
+
+def _library_version() -> str:
+    import importlib.metadata  # pylint: disable=import-outside-toplevel
+
+    try:
+        return importlib.metadata.version("docstring_parser")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _key_digest(key: CacheKey) -> bytes:
+    import hashlib  # pylint: disable=import-outside-toplevel
+
+    parts = [
+        (
+            f"{type(part).__name__}.{part.name}"
+            if isinstance(part, enum.Enum)
+            else repr(part)
+        )
+        for part in key
+    ]
+    return hashlib.sha256(
+        "\0".join(parts).encode("utf-8", "surrogatepass")
+    ).digest()
+
+
+class SqliteParseCache(BaseParseCache):
+    """Persistent cache of parsed docstrings, stored in a SQLite database.
+
+    The database can be shared by many processes at once. Its entries are
+    keyed by a SHA-256 hash of the text and parser configuration, and are
+    dropped whenever the database is opened by another version of the
+    library. When the cache is full, the least recently used entries are
+    pruned. The number of entries is kept in the database along with them,
+    so that the processes sharing it enforce the maximum size together.
+    """
+
+    # The attributes are the settings of the cache, the connection to the
+    # database, and the statistics reported by ``info``.
+    # pylint: disable=too-many-instance-attributes
+
+    SCHEMA_VERSION = 2
+
+    def __init__(
+        self,
+        path: T.Union[str, "os.PathLike[str]"],
+        maxsize: int = 1_000_000,
+        timeout: float = 30.0,
+    ) -> None:
+        """Initialize self.
+
+        :param path: path to the database file, created if missing
+        :param maxsize: maximum number of cached docstrings
+        :param timeout: seconds to wait for other processes writing to the
+            database
+        """
+        if maxsize < 1:
+            raise ValueError("Cache size must be positive.")
+        self.path = os.fspath(path)
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.version = (
+            f"{self.SCHEMA_VERSION}:{_library_version()}:"
+            f"{serialize.FORMAT_VERSION}"
+        )
+        self._lock = threading.Lock()
+        self._connection: T.Optional["sqlite3.Connection"] = None
+        self._pid = -1
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        with self._lock:
+            self._connect()
+
+    def _connect(self) -> "sqlite3.Connection":
+        # Connections can't be shared with forked processes.
+        if self._connection is not None and self._pid == os.getpid():
+            return self._connection
+        import sqlite3  # pylint: disable=import-outside-toplevel
+
+        connection = sqlite3.connect(
+            self.path,
+            timeout=self.timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        with _transaction(connection):
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS info"
+                " (name TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries"
+                " (key BLOB PRIMARY KEY, value TEXT NOT NULL,"
+                " accessed INTEGER NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed"
+                " ON entries (accessed)"
+            )
+            row = connection.execute(
+                "SELECT value FROM info WHERE name = 'version'"
+            ).fetchone()
+            if row is None or row[0] != self.version:
+                connection.execute("DELETE FROM entries")
+                connection.execute(
+                    "INSERT OR REPLACE INTO info VALUES ('version', ?)",
+                    (self.version,),
+                )
+                connection.execute(
+                    "INSERT OR REPLACE INTO info VALUES ('size', 0)"
+                )
+        self._connection = connection
+        self._pid = os.getpid()
+        return connection
+
+    def get(self, key: CacheKey) -> T.Optional[Docstring]:
+        """Look up a parsed docstring.
+
+        :param key: text and parser configuration the docstring was parsed
+            with
+        :returns: the cached docstring or None if it isn't cached
+        """
+        import json  # pylint: disable=import-outside-toplevel
+        import sqlite3  # pylint: disable=import-outside-toplevel
+
+        digest = _key_digest(key)
+        with self._lock:
+            connection = self._connect()
+            try:
+                row = connection.execute(
+                    "SELECT value FROM entries WHERE key = ?", (digest,)
+                ).fetchone()
+                if row is not None:
+                    connection.execute(
+                        "UPDATE entries SET accessed = ? WHERE key = ?",
+                        (time.time_ns(), digest),
+                    )
+            except sqlite3.OperationalError:
+                # The database is locked by other processes for too long.
+                row = None
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        return Docstring.from_dict(json.loads(row[0]))
+
+    def put(self, key: CacheKey, docstring: Docstring) -> None:
+        """Store a parsed docstring, pruning the least recently used ones if
+        the cache is full.
+
+        :param key: text and parser configuration the docstring was parsed
+            with
+        :param docstring: parsed docstring to store
+        """
+        import json  # pylint: disable=import-outside-toplevel
+        import sqlite3  # pylint: disable=import-outside-toplevel
+
+        digest = _key_digest(key)
+        value = json.dumps(docstring.to_dict())
+        accessed = time.time_ns()
+        with self._lock:
+            connection = self._connect()
+            try:
+                with _transaction(connection):
+                    # Only new entries count towards the size.
+                    added = connection.execute(
+                        "INSERT OR IGNORE INTO entries VALUES (?, ?, ?)",
+                        (digest, value, accessed),
+                    ).rowcount
+                    if not added:
+                        connection.execute(
+                            "UPDATE entries SET value = ?, accessed = ?"
+                            " WHERE key = ?",
+                            (value, accessed, digest),
+                        )
+                    else:
+                        size = _resize(connection, added)
+                        if size > self.maxsize:
+                            self._prune(connection, size)
+            except sqlite3.OperationalError:
+                # Skip caching rather than wait for other processes.
+                pass
+
+    def _prune(self, connection: "sqlite3.Connection", size: int) -> None:
+        # Prune a tenth of the entries at once, to do it only once in a while.
+        removed = connection.execute(
+            "DELETE FROM entries WHERE key IN"
+            " (SELECT key FROM entries ORDER BY accessed LIMIT ?)",
+            (size - self.maxsize + self.maxsize // 10,),
+        ).rowcount
+        _resize(connection, -removed)
+        self._evictions += removed
+
+    def clear(self) -> None:
+        """Remove all cached docstrings and reset the statistics."""
+        with self._lock:
+            connection = self._connect()
+            with _transaction(connection):
+                connection.execute("DELETE FROM entries")
+                connection.execute(
+                    "UPDATE info SET value = 0 WHERE name = 'size'"
+                )
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Report the cache statistics.
+
+        :returns: numbers of hits, misses and evictions so far in this
+            process, along with the maximum and current number of cached
+            docstrings
+        """
+        with self._lock:
+            connection = self._connect()
+            size = connection.execute(
+                "SELECT COUNT(*) FROM entries"
+            ).fetchone()[0]
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                size,
+            )
+
+    def close(self) -> None:
+        """Close the database. It's reopened when the cache is used again."""
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+
+@contextlib.contextmanager
+def _transaction(connection: "sqlite3.Connection") -> T.Iterator[None]:
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+
+def _resize(connection: "sqlite3.Connection", change: int) -> int:
+    """Update the number of entries stored in the database.
+
+    :param connection: connection to the database, within a transaction
+    :param change: number of entries added, or removed if negative
+    :returns: the new number of entries
+    """
+    connection.execute(
+        "UPDATE info SET value = value + ? WHERE name = 'size'", (change,)
+    )
+    return int(
+        connection.execute(
+            "SELECT value FROM info WHERE name = 'size'"
+        ).fetchone()[0]
+    )
@@ -1,7 +1,12 @@
 """Common methods for parsing."""
 
 import enum
+import re
+import sys
+import time
 import typing as T
+from contextvars import ContextVar
+from types import MappingProxyType
 
 PARAM_KEYWORDS = {
     "param",
@@ -19,10 +24,171 @@ YIELDS_KEYWORDS = {"yield", "yields"}
 EXAMPLES_KEYWORDS = {"example", "examples"}
 
 
+# Characters of the indentation removed by ``inspect.cleandoc``: only spaces
+# since Python 3.13, any whitespace before.
+_INDENT_CHARS = " " if sys.version_info >= (3, 13) else None
+
+_MARGIN_REGEX = re.compile(
+    r"\n( *)[^ \n]" if _INDENT_CHARS else r"\n([^\S\n]*)\S"
+)
+_DEDENT_REGEXES: T.Dict[int, T.Pattern[str]] = {}
+
+
+def _cleandoc(text: str) -> str:
+    """Clean up the indentation of a docstring.
+
+    The result is the same as of ``inspect.cleandoc``, which splits the text
+    into lines and processes them one by one. The lines are handled all at
+    once here instead, with regexes, which saves most of the work per line.
+
+    :param text: docstring text
+    :returns: cleaned text
+    """
+    if "\t" in text:
+        text = text.expandtabs()
+    end = text.find("\n")
+    if end < 0:
+        return text.lstrip(_INDENT_CHARS)
+
+    first_line = text[:end].lstrip(_INDENT_CHARS)
+    indents = _MARGIN_REGEX.findall(text, end)
+    margin = min(map(len, indents)) if indents else 0
+    if not margin:
+        other_lines = text[end:]
+    else:
+        regex = _DEDENT_REGEXES.get(margin)
+        if regex is None:
+            regex = _DEDENT_REGEXES[margin] = re.compile(
+                rf"\n[^\n]{{0,{margin}}}"
+            )
+        other_lines = regex.sub("\n", text[end:])
+    # Blank lines are empty by now, so the leading and trailing ones are
+    # just line breaks.
+    return (first_line + other_lines).strip("\n")
+
+
+def _meta_hint_search(pattern: str) -> T.Callable[[str], bool]:
+    """Create a function checking whether any line of a raw docstring starts
+    with the pattern, once indented as by ``inspect.cleandoc``.
+
+    :param pattern: pattern matching the start of the line after its
+        indentation
+    :returns: function taking the docstring text
+    """
+    first_line = re.compile(rf"[^\S\n]*(?:{pattern})", flags=re.M)
+    # Starting with a line break lets the regex engine skip quickly to the
+    # lines.
+    other_lines = re.compile(rf"\n[^\S\n]*(?:{pattern})", flags=re.M)
+
+    def search(text: str) -> bool:
+        return bool(first_line.match(text) or other_lines.search(text))
+
+    return search
+
+
+def _described_default(desc: str) -> T.Optional[str]:
+    """Find the default value mentioned last in a description, as in "...,
+    defaults to 1.".
+
+    This is what matching ``.*defaults to (.+)`` with DOTALL finds, but
+    without backtracking through the whole description.
+
+    :param desc: description of a parameter
+    :returns: the default value, or None if there's none
+    """
+    start = desc.rfind("defaults to ", 0, len(desc) - 1)
+    if start < 0:
+        return None
+    return desc[start + len("defaults to ") :].rstrip(".")
+
+
+def _iter_fields(meta_chunk: str, marker: str) -> T.Iterator[str]:
+    """Split the meta information into fields, each running from a line
+    starting with the marker up to the next one.
+
+    :param meta_chunk: meta information, starting with the marker
+    :param marker: character starting the fields, like ":" or "@"
+    :returns: iterator of the fields, along with their line breaks
+    """
+    separator = "\n" + marker
+    if meta_chunk.startswith(marker):
+        start = 0
+    else:
+        start = meta_chunk.find(separator) + 1
+        if not start:
+            return
+    while True:
+        end = meta_chunk.find(separator, start) + 1
+        if not end:
+            yield meta_chunk[start:]
+            return
+        yield meta_chunk[start:end]
+        start = end
+
+
 class ParseError(RuntimeError):
     """Base class for all parsing related errors."""
 
 
+class ParseLimitError(ParseError):
+    """Base class for the errors of parsing that goes over its limits."""
+
+
+class InputTooLongError(ParseLimitError):
+    """The docstring is longer than the limit of its parsing."""
+
+
+class DeadlineExceededError(ParseLimitError):
+    """Parsing the docstring took longer than its time budget."""
+
+
+# Time at which the current parsing must stop, along with its budget.
+_DEADLINE: ContextVar[T.Optional[T.Tuple[float, float]]] = ContextVar(
+    "_DEADLINE", default=None
+)
+
+
+def _check_deadline() -> None:
+    """Stop parsing if it's past the deadline of the current call.
+
+    The parsers call this between the fields or sections they parse.
+
+    :raises DeadlineExceededError: if the deadline has passed
+    """
+    deadline = _DEADLINE.get()
+    if deadline is not None and time.monotonic() > deadline[0]:
+        raise DeadlineExceededError(
+            f"Parsing took longer than {deadline[1]:g} seconds."
+        )
+
+
+def _diagnostics_list(errors: str) -> T.Optional[T.List[str]]:
+    """Prepare the list collecting the parse errors, if they're collected.
+
+    :param errors: "raise" to raise the first error or "collect" to collect
+        all of them
+    :returns: an empty list or None if the errors are raised
+    :raises ValueError: if the errors mode is unknown
+    """
+    if errors == "raise":
+        return None
+    if errors == "collect":
+        return []
+    raise ValueError(f"Unknown errors mode: {errors!r}.")
+
+
+def _report(diagnostics: T.Optional[T.List[str]], message: str) -> None:
+    """Raise a parse error, or record it if the errors are collected.
+
+    :param diagnostics: list collecting the errors or None to raise them
+    :param message: error message
+    :raises ParseError: if the errors aren't collected
+    """
+    if diagnostics is None:
+        raise ParseError(message)
+    diagnostics.append(message)
+
+
 class DocstringStyle(enum.Enum):
     """Docstring style."""
 
@@ -50,6 +216,8 @@ class DocstringMeta:
         :raises ValueError: if something happens
     """
 
+    __slots__ = ("args", "description")
+
     def __init__(
         self, args: T.List[str], description: T.Optional[str]
     ) -> None:
@@ -63,10 +231,38 @@ class DocstringMeta:
         self.args = args
         self.description = description
 
+    def to_dict(self) -> T.Dict[str, T.Any]:
+        """Convert to a JSON-serializable dictionary.
+
+        :returns: dictionary with the kind of the meta information and its
+            attributes
+        """
+        ret = {"kind": _META_KIND_NAMES[_meta_kind(type(self))]}
+        for name in _slot_names(type(self)):
+            value = getattr(self, name)
+            ret[name] = list(value) if name == "args" else value
+        return ret
+
+    @staticmethod
+    def from_dict(data: T.Mapping[str, T.Any]) -> "DocstringMeta":
+        """Create the meta information from a dictionary.
+
+        :param data: dictionary as returned by ``to_dict``
+        :returns: meta information of the recorded kind
+        """
+        cls = META_KINDS[data["kind"]]
+        ret = cls.__new__(cls)
+        for name in _slot_names(cls):
+            value = data.get(name)
+            setattr(ret, name, list(value) if name == "args" else value)
+        return ret
+
 
 class DocstringParam(DocstringMeta):
     """DocstringMeta symbolizing :param metadata."""
 
+    __slots__ = ("arg_name", "type_name", "is_optional", "default")
+
     def __init__(
         self,
         args: T.List[str],
@@ -87,6 +283,8 @@ class DocstringParam(DocstringMeta):
 class DocstringReturns(DocstringMeta):
     """DocstringMeta symbolizing :returns or :yields metadata."""
 
+    __slots__ = ("type_name", "is_generator", "return_name")
+
     def __init__(
         self,
         args: T.List[str],
@@ -105,6 +303,8 @@ class DocstringReturns(DocstringMeta):
 class DocstringRaises(DocstringMeta):
     """DocstringMeta symbolizing :raises metadata."""
 
+    __slots__ = ("type_name",)
+
     def __init__(
         self,
         args: T.List[str],
@@ -120,6 +320,8 @@ class DocstringRaises(DocstringMeta):
 class DocstringDeprecated(DocstringMeta):
     """DocstringMeta symbolizing deprecation metadata."""
 
+    __slots__ = ("version",)
+
     def __init__(
         self,
         args: T.List[str],
@@ -135,6 +337,8 @@ class DocstringDeprecated(DocstringMeta):
 class DocstringExample(DocstringMeta):
     """DocstringMeta symbolizing example metadata."""
 
+    __slots__ = ("snippet",)
+
     def __init__(
         self,
         args: T.List[str],
@@ -147,9 +351,132 @@ class DocstringExample(DocstringMeta):
         self.description = description
 
 
+# Serialized names of the kinds of meta information.
+META_KINDS: T.Dict[str, T.Type[DocstringMeta]] = {
+    "meta": DocstringMeta,
+    "param": DocstringParam,
+    "returns": DocstringReturns,
+    "raises": DocstringRaises,
+    "deprecated": DocstringDeprecated,
+    "example": DocstringExample,
+}
+_META_KIND_NAMES = {cls: name for name, cls in META_KINDS.items()}
+
+
+def _meta_kind(cls: type) -> T.Type[DocstringMeta]:
+    """Return the class of the kind of meta information, for subclasses
+    defined outside of this module.
+    """
+    return next(kind for kind in cls.__mro__ if kind in _META_KIND_NAMES)
+
+
+def _slot_names(cls: type) -> T.List[str]:
+    """Return the attribute names of the kind of meta information, base
+    classes first.
+    """
+    return [
+        name
+        for kind in reversed(_meta_kind(cls).__mro__)
+        for name in getattr(kind, "__slots__", ())
+    ]
+
+
+_INDEXED_KINDS = (
+    DocstringParam,
+    DocstringRaises,
+    DocstringReturns,
+    DocstringDeprecated,
+    DocstringExample,
+)
+
+
+class _MetaIndex:
+    """Meta information of a docstring grouped by kind."""
+
+    __slots__ = ("by_kind", "params_by_name")
+
+    def __init__(self, meta: T.Iterable[DocstringMeta]) -> None:
+        self.by_kind: T.Dict[type, T.List[DocstringMeta]] = {
+            kind: [] for kind in _INDEXED_KINDS
+        }
+        self.params_by_name: T.Dict[str, DocstringParam] = {}
+        for item in meta:
+            for kind, items in self.by_kind.items():
+                if isinstance(item, kind):
+                    items.append(item)
+            if isinstance(item, DocstringParam):
+                self.params_by_name.setdefault(item.arg_name, item)
+
+
+class _MetaList(list):
+    """List of meta information that keeps an index of its items.
+
+    The index is built on first use and dropped whenever the list changes.
+    """
+
+    __slots__ = ("_index",)
+
+    def __init__(self, *args: T.Any) -> None:
+        super().__init__(*args)
+        self._index: T.Optional[_MetaIndex] = None
+
+    def __reduce__(self) -> T.Tuple[T.Any, ...]:
+        return (type(self), (list(self),))
+
+    def get_index(self) -> _MetaIndex:
+        """Return the index of the items, building it if needed."""
+        if self._index is None:
+            self._index = _MetaIndex(self)
+        return self._index
+
+
+def _drop_index(name: str) -> T.Callable[..., T.Any]:
+    method = getattr(list, name)
+
+    def wrapper(self: _MetaList, *args: T.Any, **kwargs: T.Any) -> T.Any:
+        self._index = None  # pylint: disable=protected-access
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "remove",
+    "pop",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(_MetaList, _name, _drop_index(_name))
+
+
 class Docstring:
     """Docstring object representation."""
 
+    # The attributes are the parts of the docstring, along with the deferred
+    # meta information and the parse errors.
+    # pylint: disable=too-many-instance-attributes
+
+    __slots__ = (
+        "short_description",
+        "long_description",
+        "blank_after_short_description",
+        "blank_after_long_description",
+        "_meta",
+        "_meta_loader",
+        "style",
+        "diagnostics",
+    )
+
     def __init__(
         self,
         style=None,  # type: T.Optional[DocstringStyle]
@@ -161,6 +488,101 @@ class Docstring:
         self.blank_after_long_description = False
         self.meta = []  # type: T.List[DocstringMeta]
         self.style = style  # type: T.Optional[DocstringStyle]
+        self.diagnostics = []  # type: T.List[str]
+
+    def __getstate__(self) -> T.Dict[str, T.Any]:
+        state = {"meta": self.meta}
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if not name.startswith("_"):
+                    state[name] = getattr(self, name)
+        state.update(getattr(self, "__dict__", {}))
+        return state
+
+    def __setstate__(self, state: T.Dict[str, T.Any]) -> None:
+        self._meta_loader = None
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    @property
+    def meta(self) -> T.List[DocstringMeta]:
+        """Return a list of all meta information.
+
+        The list can be freely modified. Assigning a new list stores a copy
+        of it.
+
+        If parsing of the meta information was deferred, it happens on the
+        first access and any ``ParseError`` is raised from here, or added to
+        the diagnostics if the errors are collected.
+        """
+        if self._meta_loader is not None:
+            meta = _MetaList(self._meta_loader())
+            self._meta_loader = None
+            self._meta = meta
+        return self._meta
+
+    @meta.setter
+    def meta(self, value: T.Iterable[DocstringMeta]) -> None:
+        if not isinstance(value, _MetaList):
+            value = _MetaList(value)
+        self._meta = value
+        self._meta_loader = None
+
+    def defer_meta(
+        self, loader: T.Callable[[], T.Iterable[DocstringMeta]]
+    ) -> None:
+        """Parse the meta information only when it's first accessed.
+
+        :param loader: callable returning the meta information
+        """
+        self._meta = _MetaList()
+        self._meta_loader = loader
+
+    @property
+    def is_meta_deferred(self) -> bool:
+        """Return whether the meta information is yet to be parsed."""
+        return self._meta_loader is not None
+
+    def to_dict(self) -> T.Dict[str, T.Any]:
+        """Convert to a JSON-serializable dictionary.
+
+        :returns: dictionary with the descriptions, the style name, the meta
+            information and the diagnostics
+        """
+        # The meta information goes first, as parsing it may add diagnostics.
+        meta = [meta.to_dict() for meta in self.meta]
+        return {
+            "short_description": self.short_description,
+            "long_description": self.long_description,
+            "blank_after_short_description": (
+                self.blank_after_short_description
+            ),
+            "blank_after_long_description": self.blank_after_long_description,
+            "style": self.style.name if self.style else None,
+            "meta": meta,
+            "diagnostics": list(self.diagnostics),
+        }
+
+    @classmethod
+    def from_dict(cls, data: T.Mapping[str, T.Any]) -> "Docstring":
+        """Create the docstring from a dictionary.
+
+        :param data: dictionary as returned by ``to_dict``
+        :returns: docstring representation
+        """
+        style = data.get("style")
+        ret = cls(style=DocstringStyle[style] if style else None)
+        ret.short_description = data.get("short_description")
+        ret.long_description = data.get("long_description")
+        ret.blank_after_short_description = data.get(
+            "blank_after_short_description", False
+        )
+        ret.blank_after_long_description = data.get(
+            "blank_after_long_description", False
+        )
+        ret.meta = [DocstringMeta.from_dict(meta) for meta in data["meta"]]
+        ret.diagnostics = list(data.get("diagnostics", ()))
+        return ret
 
     @property
     def description(self) -> T.Optional[str]:
@@ -184,16 +606,33 @@ class Docstring:
     @property
     def params(self) -> T.List[DocstringParam]:
         """Return a list of information on function params."""
-        return [item for item in self.meta if isinstance(item, DocstringParam)]
+        return list(self.meta.get_index().by_kind[DocstringParam])
+
+    @property
+    def params_by_name(self) -> T.Mapping[str, DocstringParam]:
+        """Return a read-only mapping of param names to their information.
+
+        Takes the first information for each name. The mapping reflects the
+        names the params had when it was first requested after the last
+        change to ``meta``.
+        """
+        return MappingProxyType(self.meta.get_index().params_by_name)
+
+    def param(self, name: str) -> T.Optional[DocstringParam]:
+        """Return a single information on the function param of the given
+        name.
+
+        :param name: name of the param
+        :returns: the first information on the param or None if missing
+        """
+        return self.meta.get_index().params_by_name.get(name)
 
     @property
     def raises(self) -> T.List[DocstringRaises]:
         """Return a list of information on the exceptions that the function
         may raise.
         """
-        return [
-            item for item in self.meta if isinstance(item, DocstringRaises)
-        ]
+        return list(self.meta.get_index().by_kind[DocstringRaises])
 
     @property
     def returns(self) -> T.Optional[DocstringReturns]:
@@ -201,29 +640,66 @@ class Docstring:
 
         Takes the first return information.
         """
-        for item in self.meta:
-            if isinstance(item, DocstringReturns):
-                return item
-        return None
+        items = self.meta.get_index().by_kind[DocstringReturns]
+        return items[0] if items else None
 
     @property
     def many_returns(self) -> T.List[DocstringReturns]:
         """Return a list of information on function return."""
-        return [
-            item for item in self.meta if isinstance(item, DocstringReturns)
-        ]
+        return list(self.meta.get_index().by_kind[DocstringReturns])
 
     @property
     def deprecation(self) -> T.Optional[DocstringDeprecated]:
         """Return a single information on function deprecation notes."""
-        for item in self.meta:
-            if isinstance(item, DocstringDeprecated):
-                return item
-        return None
+        items = self.meta.get_index().by_kind[DocstringDeprecated]
+        return items[0] if items else None
 
     @property
     def examples(self) -> T.List[DocstringExample]:
         """Return a list of information on function examples."""
-        return [
-            item for item in self.meta if isinstance(item, DocstringExample)
-        ]
+        return list(self.meta.get_index().by_kind[DocstringExample])
+
+
+class PreparedText:
+    """Docstring text prepared once to be parsed in any style.
+
+    Cleaning the text and splitting the description are the same for every
+    style, so the automatic style detection does them only once.
+    """
+
+    __slots__ = ("text", "_description")
+
+    def __init__(self, raw: T.Optional[str]) -> None:
+        """Initialize self.
+
+        :param raw: docstring text, cleaned here as per PEP-0257
+        """
+        self.text = _cleandoc(raw) if raw else ""
+        self._description: T.Optional[T.Tuple[T.Any, ...]] = None
+
+    def describe(self, docstring: Docstring, end: int) -> None:
+        """Set the short and long descriptions of a docstring.
+
+        :param docstring: docstring to fill in
+        :param end: offset in the cleaned text where the description ends and
+            the meta information starts
+        """
+        if self._description is None or self._description[0] != end:
+            parts = self.text[:end].split("\n", 1)
+            short = parts[0] or None
+            blank_short = blank_long = False
+            long = None
+            if len(parts) > 1:
+                long_desc_chunk = parts[1] or ""
+                blank_short = long_desc_chunk.startswith("\n")
+                blank_long = long_desc_chunk.endswith("\n\n")
+                long = long_desc_chunk.strip() or None
+            self._description = (end, short, blank_short, blank_long, long)
+
+        (
+            _end,
+            docstring.short_description,
+            docstring.blank_after_short_description,
+            docstring.blank_after_long_description,
+            docstring.long_description,
+        ) = self._description
@@ -3,10 +3,11 @@
 .. seealso:: http://epydoc.sourceforge.net/manual-fields.html
 """
 
-import inspect
+import functools
 import re
 import typing as T
 
+from . import stats
 from .common import (
     Docstring,
     DocstringMeta,
@@ -14,8 +15,15 @@ from .common import (
     DocstringRaises,
     DocstringReturns,
     DocstringStyle,
-    ParseError,
+    PreparedText,
     RenderingStyle,
+    _check_deadline,
+    _cleandoc,
+    _described_default,
+    _diagnostics_list,
+    _iter_fields,
+    _meta_hint_search,
+    _report,
 )
 
 
@@ -26,184 +34,261 @@ def _clean_str(string: str) -> T.Optional[str]:
     return None
 
 
-def parse(text: T.Optional[str]) -> Docstring:
+_has_meta_hint = _meta_hint_search("@")
+
+_NAME_REGEX = re.compile(r"[_A-z][_A-z0-9]*\??")
+# The keyword of other meta at the end of a word, tried from the start of
+# its run of letters and digits only so that long words are read once.
+_KEY_REGEX = re.compile(r"(?<![_A-z0-9])[0-9]*([_A-z][_A-z0-9]+)\Z")
+
+# Keywords of the kinds of fields followed by a name, by ending of the word.
+_NAMED_KEYWORDS = (
+    ("param", ("param", "keyword", "type")),
+    ("attribute", ("ivar", "cvar", "var")),
+    ("raise", ("raise",)),
+)
+_RETURN_KEYWORDS = ("return", "rtype", "yield", "ytype")
+_BASES = ("param", "attribute", "raise", "return", "meta")
+
+# Keywords which can't be used for other meta, if their field is malformed.
+_RESERVED_KEYWORDS = {
+    "param",
+    "ivar",
+    "cvar",
+    "var",
+    "keyword",
+    "type",
+    "return",
+    "rtype",
+    "yield",
+    "ytype",
+}
+
+
+def _ending(word: str, keywords: T.Tuple[str, ...]) -> T.Optional[str]:
+    for keyword in keywords:
+        if word.endswith(keyword):
+            return keyword
+    return None
+
+
+def _match_words(
+    words: T.List[str],
+) -> T.Iterator[T.Tuple[str, str, T.List[str]]]:
+    """Find the kinds of fields that the words before a colon can name.
+
+    :param words: words in the field, up to a colon right after the last one
+    :returns: the kinds with their keywords and arguments, in any order
+    """
+    last = words[-1]
+    is_name = bool(_NAME_REGEX.fullmatch(last))
+    for base, keywords in _NAMED_KEYWORDS:
+        key = _ending(words[-2], keywords) if len(words) > 1 else None
+        if key is not None and is_name:
+            yield base, key, [last]
+        elif base == "raise" and last.endswith("raise"):
+            yield base, "raise", []
+    key = _ending(last, _RETURN_KEYWORDS)
+    if key is not None:
+        yield "return", key, []
+
+    # The arguments of other meta are names up to the colon, so its keyword
+    # ends the word before the last run of names, or is one of those names.
+    candidates = [len(words) - 1]
+    if is_name:
+        first = len(words) - 1
+        while first > 0 and _NAME_REGEX.fullmatch(words[first - 1]):
+            first -= 1
+        candidates = range(max(first - 1, 0), len(words))
+    for index in candidates:
+        match = _KEY_REGEX.search(words[index])
+        if match:
+            yield "meta", match.group(1), words[index + 1 :]
+            return
+
+
+def _match_field(
+    chunk: str,
+) -> T.Optional[T.Tuple[str, str, T.List[str], int]]:
+    """Classify a field like searching anywhere in it for each kind of field
+    in turn, in one pass over its text.
+
+    Each kind of field is named by words right before a colon, so only the
+    words between consecutive colons are tried, each once.
+
+    :param chunk: text of the field
+    :returns: the kind, keyword and arguments of the field, and where its
+        description starts, or None if it names no kind of field
+    """
+    found: T.Dict[str, T.Tuple[str, T.List[str], int]] = {}
+    start = 0
+    end = chunk.find(":")
+    while end != -1 and "param" not in found:
+        segment = chunk[start:end]
+        if segment and not segment[-1].isspace():
+            for base, key, args in _match_words(segment.split()):
+                found.setdefault(base, (key, args, end + 1))
+        start = end + 1
+        end = chunk.find(":", start)
+
+    for base in _BASES:
+        if base in found:
+            return (base,) + found[base]
+    return None
+
+
+def has_meta(text: T.Optional[str]) -> bool:
+    """Check cheaply whether the docstring may contain epydoc-style meta
+    information.
+
+    :param text: docstring text, not necessarily cleaned
+    :returns: False if parsing the docstring surely results in a bare
+        description, True otherwise
+    """
+    return bool(text) and "@" in text and _has_meta_hint(text)
+
+
+def parse(
+    text: T.Optional[str], lazy: bool = False, errors: str = "raise"
+) -> Docstring:
     """Parse the epydoc-style docstring into its components.
 
+    :param lazy: defer parsing the meta information until it's accessed
+    :param errors: "raise" to raise a ``ParseError`` on malformed meta
+        information, or "collect" to skip it and list the errors in the
+        diagnostics of the result
     :returns: parsed docstring
     """
+    if stats.ENABLED:
+        with stats.measure("style_parse", DocstringStyle.EPYDOC, text):
+            return parse_prepared(PreparedText(text), lazy=lazy, errors=errors)
+    return parse_prepared(PreparedText(text), lazy=lazy, errors=errors)
+
+
+def parse_prepared(
+    prepared: PreparedText, lazy: bool = False, errors: str = "raise"
+) -> Docstring:
+    """Parse the epydoc-style docstring into its components, reusing the text
+    already prepared for other styles.
+
+    :param prepared: docstring text prepared for parsing
+    :param lazy: defer parsing the meta information until it's accessed
+    :param errors: "raise" or "collect", as in ``parse``
+    :returns: parsed docstring
+    """
+    diagnostics = _diagnostics_list(errors)
     ret = Docstring(style=DocstringStyle.EPYDOC)
+    if diagnostics is not None:
+        ret.diagnostics = diagnostics
+    text = prepared.text
     if not text:
         return ret
 
-    text = inspect.cleandoc(text)
     match = re.search("^@", text, flags=re.M)
-    if match:
-        desc_chunk = text[: match.start()]
-        meta_chunk = text[match.start() :]
+    meta_start = match.start() if match else len(text)
+    prepared.describe(ret, meta_start)
+    meta_chunk = text[meta_start:]
+
+    if lazy:
+        ret.defer_meta(functools.partial(_parse_meta, meta_chunk, diagnostics))
     else:
-        desc_chunk = text
-        meta_chunk = ""
-
-    parts = desc_chunk.split("\n", 1)
-    ret.short_description = parts[0] or None
-    if len(parts) > 1:
-        long_desc_chunk = parts[1] or ""
-        ret.blank_after_short_description = long_desc_chunk.startswith("\n")
-        ret.blank_after_long_description = long_desc_chunk.endswith("\n\n")
-        ret.long_description = long_desc_chunk.strip() or None
-
-    param_pattern = re.compile(
-        r"(param|keyword|type)(\s+[_A-z][_A-z0-9]*\??):"
-    )
-    attribute_pattern = re.compile(r"(ivar|cvar|var)(\s+[_A-z][_A-z0-9]*\??):")
-    raise_pattern = re.compile(r"(raise)(\s+[_A-z][_A-z0-9]*\??)?:")
-    return_pattern = re.compile(r"(return|rtype|yield|ytype):")
-    meta_pattern = re.compile(
-        r"([_A-z][_A-z0-9]+)((\s+[_A-z][_A-z0-9]*\??)*):"
-    )
-
-    # tokenize
-    stream: T.List[T.Tuple[str, str, T.List[str], str]] = []
-    for match in re.finditer(
-        r"(^@.*?)(?=^@|\Z)", meta_chunk, flags=re.S | re.M
-    ):
-        chunk = match.group(0)
-        if not chunk:
-            continue
+        ret.meta.extend(_parse_meta(meta_chunk, diagnostics))
+
+    return ret
+
 
-        param_match = re.search(param_pattern, chunk)
-        attribute_match = re.search(attribute_pattern, chunk)
-        raise_match = re.search(raise_pattern, chunk)
-        return_match = re.search(return_pattern, chunk)
-        meta_match = re.search(meta_pattern, chunk)
-
-        match = (
-            param_match
-            or attribute_match
-            or raise_match
-            or return_match
-            or meta_match
-        )
+def _parse_meta(
+    meta_chunk: str, diagnostics: T.Optional[T.List[str]]
+) -> T.List[DocstringMeta]:
+    ret: T.List[DocstringMeta] = []
+
+    # Params and return values may be described by several fields, so they
+    # are added where first mentioned, and completed once all are read.
+    params: T.Dict[str, T.Dict[str, T.Any]] = {}
+    combined: T.List[T.Tuple[DocstringMeta, T.Dict[str, T.Any]]] = []
+    conflicts: T.List[str] = []
+    for chunk in _iter_fields(meta_chunk, "@"):
+        _check_deadline()
+        match = _match_field(chunk)
         if not match:
-            raise ParseError(f'Error parsing meta information near "{chunk}".')
-
-        desc_chunk = chunk[match.end() :]
-        if param_match:
-            base = "param"
-            key: str = match.group(1)
-            args = [match.group(2).strip()]
-        elif attribute_match:
-            base = "attribute"
-            key: str = match.group(1)
-            args = [match.group(2).strip()]
-        elif raise_match:
-            base = "raise"
-            key: str = match.group(1)
-            args = [] if match.group(2) is None else [match.group(2).strip()]
-        elif return_match:
-            base = "return"
-            key: str = match.group(1)
-            args = []
-        else:
-            base = "meta"
-            key: str = match.group(1)
-            token = _clean_str(match.group(2).strip())
-            args = [] if token is None else re.split(r"\s+", token)
-
-            # Make sure we didn't match some existing keyword in an incorrect
-            # way here:
-            if key in [
-                "param",
-                "ivar",
-                "cvar",
-                "var",
-                "keyword",
-                "type",
-                "return",
-                "rtype",
-                "yield",
-                "ytype",
-            ]:
-                raise ParseError(
-                    f'Error parsing meta information near "{chunk}".'
-                )
+            _report(
+                diagnostics, f'Error parsing meta information near "{chunk}".'
+            )
+            continue
 
-        desc = desc_chunk.strip()
+        base, key, args, desc_start = match
+        # Make sure we didn't match some existing keyword in an incorrect
+        # way here:
+        if base == "meta" and key in _RESERVED_KEYWORDS:
+            _report(
+                diagnostics, f'Error parsing meta information near "{chunk}".'
+            )
+            continue
+
+        desc = chunk[desc_start:].strip()
         if "\n" in desc:
             first_line, rest = desc.split("\n", 1)
-            desc = first_line + "\n" + inspect.cleandoc(rest)
-        stream.append((base, key, args, desc))
+            desc = first_line + "\n" + _cleandoc(rest)
 
-    # Combine type_name, arg_name, and description information
-    params: T.Dict[str, T.Dict[str, T.Any]] = {}
-    for base, key, args, desc in stream:
-        if base not in ["param", "attribute", "return"]:
-            continue  # nothing to do
+        if base == "raise":
+            (type_name,) = args or (None,)
+            ret.append(
+                DocstringRaises(
+                    args=[key] + args, description=desc, type_name=type_name
+                )
+            )
+            continue
+        if base == "meta":
+            ret.append(DocstringMeta(args=[key] + args, description=desc))
+            continue
 
+        # Combine type_name, arg_name, and description information
         (arg_name,) = args or ("return",)
-        info = params.setdefault(arg_name, {})
+        info = params.get(arg_name)
+        if info is None:
+            info = params[arg_name] = {}
+            if base == "return":
+                meta_item: DocstringMeta = DocstringReturns(
+                    args=[key],
+                    description=None,
+                    type_name=None,
+                    is_generator=False,
+                )
+            else:
+                meta_item = DocstringParam(
+                    args=[key, arg_name],
+                    description=None,
+                    arg_name=arg_name,
+                    type_name=None,
+                    is_optional=False,
+                    default=_described_default(desc),
+                )
+            ret.append(meta_item)
+            combined.append((meta_item, info))
         info_key = "type_name" if "type" in key else "description"
         info[info_key] = desc
 
         if base == "return":
             is_generator = key in {"ytype", "yield"}
             if info.setdefault("is_generator", is_generator) != is_generator:
-                raise ParseError(
+                conflicts.append(
                     f'Error parsing meta information for "{arg_name}".'
                 )
 
-    is_done: T.Dict[str, bool] = {}
-    for base, key, args, desc in stream:
-        if base in ["param", "attribute"] and not is_done.get(args[0], False):
-            (arg_name,) = args
-            info = params[arg_name]
-            type_name = info.get("type_name")
+    for message in conflicts:
+        _report(diagnostics, message)
 
+    for meta_item, info in combined:
+        meta_item.description = info.get("description")
+        type_name = info.get("type_name")
+        if isinstance(meta_item, DocstringParam):
             if type_name and type_name.endswith("?"):
-                is_optional = True
+                meta_item.is_optional = True
                 type_name = type_name[:-1]
-            else:
-                is_optional = False
-
-            match = re.match(r".*defaults to (.+)", desc, flags=re.DOTALL)
-            default = match.group(1).rstrip(".") if match else None
-
-            meta_item = DocstringParam(
-                args=[key, arg_name],
-                description=info.get("description"),
-                arg_name=arg_name,
-                type_name=type_name,
-                is_optional=is_optional,
-                default=default,
-            )
-            is_done[arg_name] = True
-        elif base == "return" and not is_done.get("return", False):
-            info = params["return"]
-            meta_item = DocstringReturns(
-                args=[key],
-                description=info.get("description"),
-                type_name=info.get("type_name"),
-                is_generator=info.get("is_generator", False),
-            )
-            is_done["return"] = True
-        elif base == "raise":
-            (type_name,) = args or (None,)
-            meta_item = DocstringRaises(
-                args=[key] + args,
-                description=desc,
-                type_name=type_name,
-            )
-        elif base == "meta":
-            meta_item = DocstringMeta(
-                args=[key] + args,
-                description=desc,
-            )
+            meta_item.type_name = type_name
         else:
-            (key, *_) = args or ("return",)
-            assert is_done.get(key, False)
-            continue  # don't append
-
-        ret.meta.append(meta_item)
+            meta_item.type_name = type_name
+            meta_item.is_generator = info.get("is_generator", False)
 
     return ret
 
@@ -0,0 +1,120 @@
+"""Extraction of docstrings from source code, without importing it."""
+
+import ast
+import os
+import textwrap
+import tokenize
+import typing as T
+from collections import namedtuple
+
+from .attrdoc import AttributeDocstrings, add_attribute_params
+from .common import Docstring, DocstringStyle
+from .parser import parse
+
+ExtractedDocstring = namedtuple(
+    "ExtractedDocstring", "qualname kind docstring"
+)
+
+_FUNCTION_DEFS = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+def _parse_node(
+    node: ast.AST, style: DocstringStyle, errors: str
+) -> Docstring:
+    return parse(
+        ast.get_docstring(node, clean=False), style=style, errors=errors
+    )
+
+
+def _extract_attributes(
+    node: ast.AST, qualname: str, style: DocstringStyle, errors: str
+) -> T.Iterator[ExtractedDocstring]:
+    prefix = f"{qualname}." if qualname else ""
+    for name, (description, _type_name, _default) in (
+        AttributeDocstrings().collect(node, nested=False).items()
+    ):
+        yield ExtractedDocstring(
+            prefix + name,
+            "attribute",
+            parse(description, style=style, errors=errors),
+        )
+
+
+def _extract_children(
+    node: ast.AST,
+    scope: T.List[str],
+    in_class: bool,
+    style: DocstringStyle,
+    errors: str,
+) -> T.Iterator[ExtractedDocstring]:
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, ast.ClassDef):
+            qualname = ".".join(scope + [child.name])
+            docstring = _parse_node(child, style, errors)
+            add_attribute_params(
+                docstring, AttributeDocstrings().collect(child)
+            )
+            yield ExtractedDocstring(qualname, "class", docstring)
+            yield from _extract_attributes(child, qualname, style, errors)
+            yield from _extract_children(
+                child, scope + [child.name], True, style, errors
+            )
+        elif isinstance(child, _FUNCTION_DEFS):
+            yield ExtractedDocstring(
+                ".".join(scope + [child.name]),
+                "method" if in_class else "function",
+                _parse_node(child, style, errors),
+            )
+            yield from _extract_children(
+                child, scope + [child.name, "<locals>"], False, style, errors
+            )
+        elif not isinstance(child, ast.expr):
+            # Definitions nested in compound statements, like if or try.
+            yield from _extract_children(child, scope, in_class, style, errors)
+
+
+def _is_path(source: str) -> bool:
+    return "\n" not in source and (
+        source.endswith(".py") or os.path.isfile(source)
+    )
+
+
+def extract_from_source(
+    source: T.Union[str, "os.PathLike[str]"],
+    style: DocstringStyle = DocstringStyle.AUTO,
+    errors: str = "raise",
+) -> T.Iterator[ExtractedDocstring]:
+    """Parse the docstrings of a module and everything defined in it.
+
+    In contrast to the ``parse_from_object`` function, the module isn't
+    imported. Its source code is parsed instead, and its docstrings are
+    yielded in the order of definition as tuples of:
+
+    - qualname: the qualified name, as in ``__qualname__``; empty for the
+      module itself
+    - kind: one of "module", "class", "function", "method" and "attribute"
+    - docstring: the parsed docstring, empty if the object has none
+
+    As with ``parse_from_object``, the attribute docstrings of the module and
+    of the classes are also added to their docstrings as params.
+
+    A string is taken for a path if it's a single line naming an existing
+    file or ending with ".py", and for the source code otherwise.
+
+    :param source: path to the source file, or the source code itself
+    :param style: docstring style
+    :param errors: "raise" or "collect", as in ``parse``
+    :returns: iterator of the extracted docstrings
+    :raises OSError: if the source file can't be read
+    :raises SyntaxError: if the source code is invalid
+    """
+    if isinstance(source, os.PathLike) or _is_path(source):
+        with tokenize.open(source) as handle:
+            source = handle.read()
+    tree = ast.parse(textwrap.dedent(source))
+
+    docstring = _parse_node(tree, style, errors)
+    add_attribute_params(docstring, AttributeDocstrings().collect(tree))
+    yield ExtractedDocstring("", "module", docstring)
+    yield from _extract_attributes(tree, "", style, errors)
+    yield from _extract_children(tree, [], False, style, errors)
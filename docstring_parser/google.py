@@ -1,11 +1,13 @@
 """Google-style docstring parsing."""
 
-import inspect
+import functools
 import re
 import typing as T
 from collections import OrderedDict, namedtuple
 from enum import IntEnum
+from types import MappingProxyType
 
+from . import stats
 from .common import (
     EXAMPLES_KEYWORDS,
     PARAM_KEYWORDS,
@@ -19,8 +21,13 @@ from .common import (
     DocstringRaises,
     DocstringReturns,
     DocstringStyle,
-    ParseError,
+    PreparedText,
     RenderingStyle,
+    _check_deadline,
+    _cleandoc,
+    _diagnostics_list,
+    _meta_hint_search,
+    _report,
 )
 
 
@@ -41,10 +48,18 @@ class Section(namedtuple("SectionBase", "title key type")):
     """A docstring section."""
 
 
+# Matches a typed argument like "name (type)". The parser splits them with
+# _split_typed_arg instead, which gives the same groups in linear time.
 GOOGLE_TYPED_ARG_REGEX = re.compile(r"\s*(.+?)\s*\(\s*(.*[^\s]+)\s*\)")
 GOOGLE_ARG_DESC_REGEX = re.compile(r".*\. Defaults to (.+)\.")
+TITLE_LINE_REGEX = re.compile(r"^[^\n]*$", flags=re.M)
+TITLE_COLON_REGEX = re.compile(r":[ \t\r\f\v]*$", flags=re.M)
+UNKNOWN_META_REGEX = re.compile(r"\n\S")
 MULTIPLE_PATTERN = re.compile(r"(\s*[^:\s]+:)|([^:]*\]:.*)")
 
+# Titles containing any of these can only be matched as regexes.
+_TITLE_SYNTAX_REGEX = re.compile(r"[.^$*+?{}\[\]\\|()\n]|[ \t\r\f\v]$")
+
 DEFAULT_SECTIONS = [
     Section("Arguments", "param", SectionType.MULTIPLE),
     Section("Args", "param", SectionType.MULTIPLE),
@@ -61,6 +76,103 @@ DEFAULT_SECTIONS = [
 ]
 
 
+def _skip_space(text: str, pos: int) -> int:
+    end = len(text)
+    while pos < end and text[pos].isspace():
+        pos += 1
+    return pos
+
+
+def _split_typed_arg(text: str) -> T.Optional[T.Tuple[str, str]]:
+    """Split a typed argument like "name (type)" into its name and type.
+
+    The result is the same as the groups of ``GOOGLE_TYPED_ARG_REGEX``, but
+    the opening parentheses are tried in turn without backtracking, as
+    whether one can start the type depends only on the line after it.
+
+    :param text: argument specification, before the colon
+    :returns: name and type, or None if there's no type
+    """
+    name_start = _skip_space(text, 0)
+    if name_start == len(text):
+        return None
+    name_line_end = text.find("\n", name_start)
+    if name_line_end < 0:
+        name_line_end = len(text)
+    # Last non-space character and closing parenthesis of the lines that
+    # types start on, and whether a parenthesis follows the line.
+    lines: T.Dict[int, T.Tuple[int, int, bool]] = {}
+
+    def find_type(paren: int) -> T.Optional[T.Tuple[int, int]]:
+        start = _skip_space(text, paren + 1)
+        if start == len(text):
+            return None
+        if start < name_line_end:
+            line_end = name_line_end
+        else:
+            line_end = text.find("\n", start)
+            if line_end < 0:
+                line_end = len(text)
+        if line_end not in lines:
+            last = line_end - 1
+            while text[last].isspace():
+                last -= 1
+            after = _skip_space(text, last + 1)
+            lines[line_end] = (
+                last,
+                text.rfind(")", 0, last + 1),
+                after < len(text) and text[after] == ")",
+            )
+        last, close, closed = lines[line_end]
+        # The type is as long as possible, without line breaks, ending with
+        # a non-space character followed by the closing parenthesis.
+        if closed:
+            return start, last + 1
+        if close <= start:
+            return None
+        end = close
+        while text[end - 1].isspace():
+            end -= 1
+        return start, end
+
+    def space_before(pos: int) -> int:
+        while pos > name_start and text[pos - 1].isspace():
+            pos -= 1
+        return pos
+
+    # Opening parentheses on the line of the name, or right after it.
+    parens = []
+    paren = text.find("(", name_start + 1, name_line_end)
+    while paren >= 0:
+        parens.append(paren)
+        paren = text.find("(", paren + 1, name_line_end)
+    paren = _skip_space(text, name_line_end)
+    if paren < len(text) and text[paren] == "(":
+        parens.append(paren)
+
+    for paren in parens:
+        found = find_type(paren)
+        if found is not None:
+            name_end = max(name_start + 1, space_before(paren))
+            return text[name_start:name_end], text[found[0] : found[1]]
+
+    # Otherwise the name may be the last space, other than a line break,
+    # before a parenthesis starting the text.
+    if text[name_start] == "(" and name_start > 0:
+        space = name_start - 1
+        while space >= 0 and text[space] == "\n":
+            space -= 1
+        found = find_type(name_start) if space >= 0 else None
+        if found is not None:
+            return text[space], text[found[0] : found[1]]
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def _item_start_regex(indent: str) -> T.Pattern[str]:
+    return re.compile("^" + indent + r"(?=\S)", flags=re.M)
+
+
 class GoogleParser:
     """Parser for Google-style docstrings."""
 
@@ -76,6 +188,7 @@ class GoogleParser:
             sections = DEFAULT_SECTIONS
         self.sections = {s.title: s for s in sections}
         self.title_colon = title_colon
+        self.frozen = False
         self._setup()
 
     def _setup(self):
@@ -83,20 +196,67 @@ class GoogleParser:
             colon = ":"
         else:
             colon = ""
-        self.titles_re = re.compile(
+        # Drop the regex compiled for the previous sections.
+        self.__dict__.pop("titles_re", None)
+        # Plain titles are looked up among the sections line by line, which
+        # doesn't get slower with more sections, unlike the regex.
+        self._plain_titles = not any(
+            map(_TITLE_SYNTAX_REGEX.search, self.sections)
+        )
+        self._has_meta_hint = _meta_hint_search(
+            "(?:"
+            + "|".join(f"(?:{t})" for t in self.sections)
+            + ")"
+            + colon
+            + "[ \t\r\f\v]*$"
+        )
+
+    @functools.cached_property
+    def titles_re(self) -> T.Pattern[str]:
+        """Regex matching the lines with section titles."""
+        return re.compile(
             "^("
             + "|".join(f"({t})" for t in self.sections)
             + ")"
-            + colon
+            + (":" if self.title_colon else "")
             + "[ \t\r\f\v]*$",
             flags=re.M,
         )
 
-    def _build_meta(self, text: str, title: str) -> DocstringMeta:
+    def _iter_titles(self, text: str) -> T.Iterator[T.Tuple[str, int, int]]:
+        """Find the lines with section titles.
+
+        :param text: cleaned docstring text
+        :returns: iterator of the titles, along with the positions where
+            their lines start and end
+        """
+        if not self._plain_titles:
+            for match in self.titles_re.finditer(text):
+                yield match.group(1), match.start(), match.end()
+        elif self.title_colon:
+            # Only the lines ending with a colon are candidates, and finding
+            # the colons first is much faster than matching every line.
+            sections = self.sections
+            for match in TITLE_COLON_REGEX.finditer(text):
+                colon = match.start()
+                start = text.rfind("\n", 0, colon) + 1
+                if text[start:colon] in sections:
+                    yield text[start:colon], start, match.end()
+        else:
+            sections = self.sections
+            for match in TITLE_LINE_REGEX.finditer(text):
+                title = match.group().rstrip(" \t\r\f\v")
+                if title in sections:
+                    yield title, match.start(), match.end()
+
+    def _build_meta(
+        self, text: str, title: str, diagnostics: T.Optional[T.List[str]]
+    ) -> T.Optional[DocstringMeta]:
         """Build docstring element.
 
         :param text: docstring element text
         :param title: title of section containing element
+        :param diagnostics: list collecting the errors or None to raise them
         :return:
         """
 
@@ -106,10 +266,11 @@ class GoogleParser:
             section.type == SectionType.SINGULAR_OR_MULTIPLE
             and not MULTIPLE_PATTERN.match(text)
         ) or section.type == SectionType.SINGULAR:
-            return self._build_single_meta(section, text)
+            return self._build_single_meta(section, text, diagnostics)
 
         if ":" not in text:
-            raise ParseError(f"Expected a colon in {text!r}.")
+            _report(diagnostics, f"Expected a colon in {text!r}.")
+            return None
 
         # Split spec and description
         before, desc = text.split(":", 1)
@@ -117,19 +278,21 @@ class GoogleParser:
         if before and "\n" in before:
             # If there is a newline in the first line, clean it up
             first_line, rest = before.split("\n", 1)
-            before = first_line + inspect.cleandoc(rest)
+            before = first_line + _cleandoc(rest)
 
         if desc:
             desc = desc[1:] if desc[0] == " " else desc
             if "\n" in desc:
                 first_line, rest = desc.split("\n", 1)
-                desc = first_line + "\n" + inspect.cleandoc(rest)
+                desc = first_line + "\n" + _cleandoc(rest)
             desc = desc.strip("\n")
 
         return self._build_multi_meta(section, before, desc)
 
     @staticmethod
-    def _build_single_meta(section: Section, desc: str) -> DocstringMeta:
+    def _build_single_meta(
+        section: Section, desc: str, diagnostics: T.Optional[T.List[str]]
+    ) -> T.Optional[DocstringMeta]:
         if section.key in RETURNS_KEYWORDS | YIELDS_KEYWORDS:
             return DocstringReturns(
                 args=[section.key],
@@ -146,7 +309,8 @@ class GoogleParser:
                 args=[section.key], snippet=None, description=desc
             )
         if section.key in PARAM_KEYWORDS:
-            raise ParseError("Expected paramenter name.")
+            _report(diagnostics, "Expected paramenter name.")
+            return None
         return DocstringMeta(args=[section.key], description=desc)
 
     @staticmethod
@@ -154,9 +318,9 @@ class GoogleParser:
         section: Section, before: str, desc: str
     ) -> DocstringMeta:
         if section.key in PARAM_KEYWORDS:
-            match = GOOGLE_TYPED_ARG_REGEX.match(before)
-            if match:
-                arg_name, type_name = match.group(1, 2)
+            typed_arg = _split_typed_arg(before)
+            if typed_arg:
+                arg_name, type_name = typed_arg
                 if type_name.endswith(", optional"):
                     is_optional = True
                     type_name = type_name[:-10]
@@ -199,106 +363,217 @@ class GoogleParser:
         :param section: The new section.
         """
 
+        if self.frozen:
+            raise TypeError("Cannot add sections to a frozen parser.")
         self.sections[section.title] = section
         self._setup()
 
-    def parse(self, text: T.Optional[str]) -> Docstring:
+    def freeze(self) -> "GoogleParser":
+        """Prevent further changes to the recognized sections, so that the
+        parser can be safely shared.
+
+        :returns: the parser itself
+        """
+        self.sections = MappingProxyType(self.sections)
+        self.frozen = True
+        return self
+
+    def has_meta(self, text: T.Optional[str]) -> bool:
+        """Check cheaply whether the docstring may contain any of the
+        recognized sections.
+
+        :param text: docstring text, not necessarily cleaned
+        :returns: False if parsing the docstring surely results in a bare
+            description, True otherwise
+        """
+        if not text or (self.title_colon and ":" not in text):
+            return False
+        return self._has_meta_hint(text)
+
+    def parse(
+        self, text: T.Optional[str], lazy: bool = False, errors: str = "raise"
+    ) -> Docstring:
         """Parse the Google-style docstring into its components.
 
+        :param lazy: defer parsing the meta information until it's accessed
+        :param errors: "raise" to raise a ``ParseError`` on malformed meta
+            information, or "collect" to skip it and list the errors in the
+            diagnostics of the result
+        :returns: parsed docstring
+        """
+        if stats.ENABLED:
+            with stats.measure("style_parse", DocstringStyle.GOOGLE, text):
+                return self.parse_prepared(
+                    PreparedText(text), lazy=lazy, errors=errors
+                )
+        return self.parse_prepared(
+            PreparedText(text), lazy=lazy, errors=errors
+        )
+
+    def parse_prepared(
+        self,
+        prepared: PreparedText,
+        lazy: bool = False,
+        errors: str = "raise",
+    ) -> Docstring:
+        """Parse the Google-style docstring into its components, reusing the
+        text already prepared for other styles.
+
+        :param prepared: docstring text prepared for parsing
+        :param lazy: defer parsing the meta information until it's accessed
+        :param errors: "raise" or "collect", as in ``parse``
         :returns: parsed docstring
         """
+        diagnostics = _diagnostics_list(errors)
         ret = Docstring(style=DocstringStyle.GOOGLE)
+        if diagnostics is not None:
+            ret.diagnostics = diagnostics
+        text = prepared.text
         if not text:
             return ret
 
-        # Clean according to PEP-0257
-        text = inspect.cleandoc(text)
-
         # Find first title and split on its position
-        match = self.titles_re.search(text)
-        if match:
-            desc_chunk = text[: match.start()]
-            meta_chunk = text[match.start() :]
-        else:
-            desc_chunk = text
-            meta_chunk = ""
-
-        # Break description into short and long parts
-        parts = desc_chunk.split("\n", 1)
-        ret.short_description = parts[0] or None
-        if len(parts) > 1:
-            long_desc_chunk = parts[1] or ""
-            ret.blank_after_short_description = long_desc_chunk.startswith(
-                "\n"
+        title = next(self._iter_titles(text), None)
+        meta_start = title[1] if title else len(text)
+        prepared.describe(ret, meta_start)
+        meta_chunk = text[meta_start:]
+
+        if lazy:
+            ret.defer_meta(
+                functools.partial(self._parse_meta, meta_chunk, diagnostics)
             )
-            ret.blank_after_long_description = long_desc_chunk.endswith("\n\n")
-            ret.long_description = long_desc_chunk.strip() or None
+        else:
+            ret.meta.extend(self._parse_meta(meta_chunk, diagnostics))
+
+        return ret
+
+    def _parse_meta(
+        self, meta_chunk: str, diagnostics: T.Optional[T.List[str]]
+    ) -> T.List[DocstringMeta]:
+        ret: T.List[DocstringMeta] = []
 
         # Split by sections determined by titles
-        matches = list(self.titles_re.finditer(meta_chunk))
-        if not matches:
+        titles = list(self._iter_titles(meta_chunk))
+        if not titles:
             return ret
-        splits = []
-        for j in range(len(matches) - 1):
-            splits.append((matches[j].end(), matches[j + 1].start()))
-        splits.append((matches[-1].end(), len(meta_chunk)))
+        ends = [start for _title, start, _end in titles[1:]]
+        ends.append(len(meta_chunk))
 
         chunks = OrderedDict()  # type: T.Mapping[str,str]
-        for j, (start, end) in enumerate(splits):
-            title = matches[j].group(1)
+        for (title, _start, start), end in zip(titles, ends):
             if title not in self.sections:
                 continue
 
             # Clear Any Unknown Meta
             # Ref: https://github.com/rr-/docstring_parser/issues/29
-            meta_details = meta_chunk[start:end]
-            unknown_meta = re.search(r"\n\S", meta_details)
+            unknown_meta = UNKNOWN_META_REGEX.search(meta_chunk, start, end)
             if unknown_meta is not None:
-                meta_details = meta_details[: unknown_meta.start()]
+                end = unknown_meta.start()
 
-            chunks[title] = meta_details.strip("\n")
+            chunks[title] = meta_chunk[start:end].strip("\n")
         if not chunks:
             return ret
 
         # Add elements from each chunk
         for title, chunk in chunks.items():
+            _check_deadline()
             # Determine indent
-            indent_match = re.search(r"^\s*", chunk)
-            if not indent_match:
-                raise ParseError(f'Can\'t infer indent from "{chunk}"')
-            indent = indent_match.group()
+            indent = chunk[: len(chunk) - len(chunk.lstrip())]
 
             # Check for singular elements
             if self.sections[title].type in [
                 SectionType.SINGULAR,
                 SectionType.SINGULAR_OR_MULTIPLE,
             ]:
-                part = inspect.cleandoc(chunk)
-                ret.meta.append(self._build_meta(part, title))
+                part = _cleandoc(chunk)
+                meta = self._build_meta(part, title, diagnostics)
+                if meta is not None:
+                    ret.append(meta)
                 continue
 
             # Split based on lines which have exactly that indent
-            _re = "^" + indent + r"(?=\S)"
-            c_matches = list(re.finditer(_re, chunk, flags=re.M))
+            c_matches = list(_item_start_regex(indent).finditer(chunk))
             if not c_matches:
-                raise ParseError(f'No specification for "{title}": "{chunk}"')
+                _report(
+                    diagnostics, f'No specification for "{title}": "{chunk}"'
+                )
+                continue
             c_splits = []
             for j in range(len(c_matches) - 1):
                 c_splits.append((c_matches[j].end(), c_matches[j + 1].start()))
             c_splits.append((c_matches[-1].end(), len(chunk)))
             for j, (start, end) in enumerate(c_splits):
+                _check_deadline()
                 part = chunk[start:end].strip("\n")
-                ret.meta.append(self._build_meta(part, title))
+                meta = self._build_meta(part, title, diagnostics)
+                if meta is not None:
+                    ret.append(meta)
 
         return ret
 
 
-def parse(text: T.Optional[str]) -> Docstring:
+_DEFAULT_PARSER = GoogleParser().freeze()
+
+
+@functools.lru_cache(maxsize=32)
+def _get_custom_parser(
+    sections: T.Tuple[Section, ...], title_colon: bool
+) -> GoogleParser:
+    return GoogleParser(list(sections), title_colon=title_colon).freeze()
+
+
+def get_parser(
+    sections: T.Optional[T.Iterable[Section]] = None, title_colon=True
+) -> GoogleParser:
+    """Return a frozen parser for the given configuration.
+
+    Parsers are compiled once per configuration and shared between callers.
+
+    :param sections: Recognized sections or None to defaults.
+    :param title_colon: require colon after section title.
+    :returns: the shared parser
+    """
+    if sections is None and title_colon:
+        return _DEFAULT_PARSER
+    return _get_custom_parser(tuple(sections or ()), title_colon)
+
+
+def has_meta(text: T.Optional[str]) -> bool:
+    """Check cheaply whether the docstring may contain Google-style sections.
+
+    :param text: docstring text, not necessarily cleaned
+    :returns: False if parsing the docstring surely results in a bare
+        description, True otherwise
+    """
+    return _DEFAULT_PARSER.has_meta(text)
+
+
+def parse(
+    text: T.Optional[str], lazy: bool = False, errors: str = "raise"
+) -> Docstring:
     """Parse the Google-style docstring into its components.
 
+    :param lazy: defer parsing the meta information until it's accessed
+    :param errors: "raise" to raise a ``ParseError`` on malformed meta
+        information, or "collect" to skip it and list the errors in the
+        diagnostics of the result
+    :returns: parsed docstring
+    """
+    return _DEFAULT_PARSER.parse(text, lazy=lazy, errors=errors)
+
+
+def parse_prepared(
+    prepared: PreparedText, lazy: bool = False, errors: str = "raise"
+) -> Docstring:
+    """Parse the Google-style docstring into its components, reusing the text
+    already prepared for other styles.
+
+    :param prepared: docstring text prepared for parsing
+    :param lazy: defer parsing the meta information until it's accessed
+    :param errors: "raise" or "collect", as in ``parse``
     :returns: parsed docstring
     """
-    return GoogleParser().parse(text)
+    return _DEFAULT_PARSER.parse_prepared(prepared, lazy=lazy, errors=errors)
 
 
 def compose(
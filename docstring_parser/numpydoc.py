@@ -3,12 +3,15 @@
 :see: https://numpydoc.readthedocs.io/en/latest/format.html
 """
 
-import inspect
+import functools
+import heapq
 import itertools
 import re
 import typing as T
 from textwrap import dedent
+from types import MappingProxyType
 
+from . import stats
 from .common import (
     Docstring,
     DocstringDeprecated,
@@ -18,7 +21,12 @@ from .common import (
     DocstringRaises,
     DocstringReturns,
     DocstringStyle,
+    PreparedText,
     RenderingStyle,
+    _check_deadline,
+    _cleandoc,
+    _diagnostics_list,
+    _meta_hint_search,
 )
 
 
@@ -36,7 +44,11 @@ def _clean_str(string: str) -> T.Optional[str]:
 
 
 KV_REGEX = re.compile(r"^[^\s].*$", flags=re.M)
-PARAM_KEY_REGEX = re.compile(r"^(?P<name>.*?)(?:\s*:\s*(?P<type>.*?))?$")
+# The names end right before the spaces preceding the colon, so whitespace
+# in the middle of them isn't scanned over and over again.
+PARAM_KEY_REGEX = re.compile(
+    r"^(?P<name>.*?)(?:(?<!\s)\s*:\s*(?P<type>.*?))?$"
+)
 PARAM_OPTIONAL_REGEX = re.compile(r"(?P<type>.*?)(?:, optional|\(optional\))$")
 
 # Ideally, default value will be specified in the type declaration,
@@ -47,17 +59,29 @@ PARAM_OPTIONAL_REGEX = re.compile(r"(?P<type>.*?)(?:, optional|\(optional\))$")
 #   copy : bool, default: True
 #
 PARAM_DEFAULT_REGEX = re.compile(
-    r"(?P<type>.*?)(?:, default|\(default\))(?: | |=| = |= |: |)*(?P<value>.*)$"  # pylint: disable=C0301
+    r"(?P<type>.*?)(?:, default|\(default\))(?:[ =]|: )*(?P<value>.*)$"
 )
 
 # If the default value isn't specified in the type declaration,
 # it might be in the description. There isn't any formal grammar for this
 # in numpydoc, but we can make some educated guesses.
 PARAM_DEFAULT_REGEX_IN_DESC = re.compile(
-    r"(?<!\S)[Dd]efault(?:s to |(?:\s*(?:is|[=:])\s*|\s+))(?P<value>(?:['\"]).*?(?:['\"])|[\w\-\.]*\w)"  # pylint: disable=C0301
+    r"(?<!\S)[Dd]efault(?:s to |(?:\s*(?:is|[=:])\s*|\s+))"
+    r"(?P<value>['\"][^'\"\n]*['\"]|[\w\-\.]*\w)"
+)
+
+RETURN_KEY_REGEX = re.compile(
+    r"^(?:(?P<name>.*?)(?<!\s)\s*:\s*)?(?P<type>.*?)$"
 )
 
-RETURN_KEY_REGEX = re.compile(r"^(?:(?P<name>.*?)\s*:\s*)?(?P<type>.*?)$")
+# Underlines of the section headers, and sphinx-style directives.
+_has_meta_hint = _meta_hint_search(r"-|\.\.")
+
+# Lines of dashes, which may underline a section header.
+UNDERLINE_REGEX = re.compile(r"\n(-+)\s*$", flags=re.M)
+
+# Titles containing any of these can only be matched as regexes.
+_TITLE_SYNTAX_REGEX = re.compile(r"^\s|^$|[.^$*+?{}\[\]\\|()]|\s$")
 
 
 class Section:
@@ -112,9 +136,8 @@ class _KVSection(Section):
             start = match.end()
             end = next_match.start() if next_match is not None else None
             value = text[start:end]
-            yield self._parse_item(
-                key=match.group(), value=inspect.cleandoc(value)
-            )
+            _check_deadline()
+            yield self._parse_item(key=match.group(), value=_cleandoc(value))
 
 
 class _SphinxSection(Section):
@@ -237,7 +260,7 @@ class DeprecationSection(_SphinxSection):
         version, desc, *_ = text.split(sep="\n", maxsplit=1) + [None, None]
 
         if desc is not None:
-            desc = _clean_str(inspect.cleandoc(desc))
+            desc = _clean_str(_cleandoc(desc))
 
         yield DocstringDeprecated(
             args=[self.key], description=desc, version=_clean_str(version)
@@ -264,21 +287,23 @@ class ExamplesSection(Section):
                      ``inspect.cleandoc`` before parsing.
         """
         lines = dedent(text).strip().splitlines()
-        while lines:
-            snippet_lines = []
-            description_lines = []
-            while lines:
-                if not lines[0].startswith(">>>"):
-                    break
-                snippet_lines.append(lines.pop(0))
-            while lines:
-                if lines[0].startswith(">>>"):
-                    break
-                description_lines.append(lines.pop(0))
+        end = len(lines)
+        i = 0
+        while i < end:
+            start = i
+            while i < end and lines[i].startswith(">>>"):
+                i += 1
+            snippet_end = i
+            while i < end and not lines[i].startswith(">>>"):
+                i += 1
             yield DocstringExample(
                 [self.key],
-                snippet="\n".join(snippet_lines) if snippet_lines else None,
-                description="\n".join(description_lines),
+                snippet=(
+                    "\n".join(lines[start:snippet_end])
+                    if snippet_end > start
+                    else None
+                ),
+                description="\n".join(lines[snippet_end:i]),
             )
 
 
@@ -327,74 +352,255 @@ class NumpydocParser:
         """
         sections = sections or DEFAULT_SECTIONS
         self.sections = {s.title: s for s in sections}
+        self.frozen = False
         self._setup()
 
     def _setup(self):
-        self.titles_re = re.compile(
+        # Drop the regex compiled for the previous sections.
+        self.__dict__.pop("titles_re", None)
+        # Headers of custom patterns could start with anything.
+        self._custom_titles = any(
+            type(s).title_pattern
+            not in (Section.title_pattern, _SphinxSection.title_pattern)
+            for s in self.sections.values()
+        )
+        # Unless some titles are regexes, the underlined headers are found
+        # by their underlines and looked up by their titles, so that adding
+        # sections doesn't slow down the parsing.
+        self._plain_titles = not self._custom_titles and not any(
+            map(_TITLE_SYNTAX_REGEX.search, self.sections)
+        )
+        self._underlined_titles = {
+            title: section
+            for title, section in self.sections.items()
+            if type(section).title_pattern is Section.title_pattern
+        }
+        sphinx_titles = [
+            title
+            for title in self.sections
+            if title not in self._underlined_titles
+        ]
+        # Looking for the directives anywhere, rather than at the start of
+        # lines, is much faster when there are none.
+        self._sphinx_re = (
+            re.compile(r"\.\.\s*(" + "|".join(sphinx_titles) + r")\s*::")
+            if sphinx_titles
+            else None
+        )
+
+    @functools.cached_property
+    def titles_re(self) -> T.Pattern[str]:
+        """Regex matching the section headers."""
+        return re.compile(
             r"|".join(s.title_pattern for s in self.sections.values()),
             flags=re.M,
         )
 
+    def _iter_underlined(
+        self, text: str
+    ) -> T.Iterator[T.Tuple[str, int, int]]:
+        titles = self._underlined_titles
+        for match in UNDERLINE_REGEX.finditer(text):
+            # The title comes right before the underline, save for some
+            # whitespace, and is exactly as long as it.
+            end = match.start()
+            while end and text[end - 1].isspace():
+                end -= 1
+            start = end - len(match.group(1))
+            if start < 0 or (start and text[start - 1] != "\n"):
+                continue
+            if text[start:end] in titles:
+                yield text[start:end], start, match.end()
+
+    def _iter_titles(self, text: str) -> T.Iterator[T.Tuple[str, int, int]]:
+        """Find the section headers.
+
+        :param text: cleaned docstring text
+        :returns: iterator of the section titles, along with the positions
+            where their headers start and end
+        """
+        if not self._plain_titles:
+            for match in self.titles_re.finditer(text):
+                # One of the groups of the matching section took part.
+                title = [g for g in match.groups() if g is not None][0]
+                yield title, match.start(), match.end()
+            return
+        directives = [
+            (match.group(1), match.start(), match.end())
+            for match in (
+                self._sphinx_re.finditer(text) if self._sphinx_re else ()
+            )
+            if not match.start() or text[match.start() - 1] == "\n"
+        ]
+        if directives:
+            yield from heapq.merge(
+                self._iter_underlined(text), directives, key=lambda h: h[1]
+            )
+        else:
+            yield from self._iter_underlined(text)
+
     def add_section(self, section: Section):
         """Add or replace a section.
 
         :param section: The new section.
         """
 
+        if self.frozen:
+            raise TypeError("Cannot add sections to a frozen parser.")
         self.sections[section.title] = section
         self._setup()
 
-    def parse(self, text: T.Optional[str]) -> Docstring:
+    def freeze(self) -> "NumpydocParser":
+        """Prevent further changes to the recognized sections, so that the
+        parser can be safely shared.
+
+        :returns: the parser itself
+        """
+        self.sections = MappingProxyType(self.sections)
+        self.frozen = True
+        return self
+
+    def has_meta(self, text: T.Optional[str]) -> bool:
+        """Check cheaply whether the docstring may contain any of the
+        recognized sections, that is an underlined header or a sphinx-style
+        directive.
+
+        :param text: docstring text, not necessarily cleaned
+        :returns: False if parsing the docstring surely results in a bare
+            description, True otherwise
+        """
+        if not text:
+            return False
+        if self._custom_titles:
+            return True
+        return ("-" in text or ".." in text) and _has_meta_hint(text)
+
+    def parse(
+        self, text: T.Optional[str], lazy: bool = False, errors: str = "raise"
+    ) -> Docstring:
         """Parse the numpy-style docstring into its components.
 
+        :param lazy: defer parsing the meta information until it's accessed
+        :param errors: "raise" or "collect"; accepted for compatibility with
+            the other styles, as numpydoc parsing never fails
+        :returns: parsed docstring
+        """
+        if stats.ENABLED:
+            with stats.measure("style_parse", DocstringStyle.NUMPYDOC, text):
+                return self.parse_prepared(
+                    PreparedText(text), lazy=lazy, errors=errors
+                )
+        return self.parse_prepared(
+            PreparedText(text), lazy=lazy, errors=errors
+        )
+
+    def parse_prepared(
+        self,
+        prepared: PreparedText,
+        lazy: bool = False,
+        errors: str = "raise",
+    ) -> Docstring:
+        """Parse the numpy-style docstring into its components, reusing the
+        text already prepared for other styles.
+
+        :param prepared: docstring text prepared for parsing
+        :param lazy: defer parsing the meta information until it's accessed
+        :param errors: "raise" or "collect", as in ``parse``
         :returns: parsed docstring
         """
+        _diagnostics_list(errors)
         ret = Docstring(style=DocstringStyle.NUMPYDOC)
+        text = prepared.text
         if not text:
             return ret
 
-        # Clean according to PEP-0257
-        text = inspect.cleandoc(text)
-
         # Find first title and split on its position
-        match = self.titles_re.search(text)
-        if match:
-            desc_chunk = text[: match.start()]
-            meta_chunk = text[match.start() :]
+        title = next(self._iter_titles(text), None)
+        meta_start = title[1] if title else len(text)
+        prepared.describe(ret, meta_start)
+        meta_chunk = text[meta_start:]
+
+        if lazy:
+            ret.defer_meta(functools.partial(self._parse_meta, meta_chunk))
         else:
-            desc_chunk = text
-            meta_chunk = ""
-
-        # Break description into short and long parts
-        parts = desc_chunk.split("\n", 1)
-        ret.short_description = parts[0] or None
-        if len(parts) > 1:
-            long_desc_chunk = parts[1] or ""
-            ret.blank_after_short_description = long_desc_chunk.startswith(
-                "\n"
-            )
-            ret.blank_after_long_description = long_desc_chunk.endswith("\n\n")
-            ret.long_description = long_desc_chunk.strip() or None
+            ret.meta.extend(self._parse_meta(meta_chunk))
+
+        return ret
 
-        for match, nextmatch in _pairwise(self.titles_re.finditer(meta_chunk)):
-            title = next(g for g in match.groups() if g is not None)
+    def _parse_meta(self, meta_chunk: str) -> T.List[DocstringMeta]:
+        ret: T.List[DocstringMeta] = []
+        titles = self._iter_titles(meta_chunk)
+        for (title, _start, start), next_title in _pairwise(titles):
+            _check_deadline()
             factory = self.sections[title]
 
             # section chunk starts after the header,
             # ends at the start of the next header
-            start = match.end()
-            end = nextmatch.start() if nextmatch is not None else None
-            ret.meta.extend(factory.parse(meta_chunk[start:end]))
+            end = next_title[1] if next_title is not None else None
+            ret.extend(factory.parse(meta_chunk[start:end]))
 
         return ret
 
 
-def parse(text: T.Optional[str]) -> Docstring:
+_DEFAULT_PARSER = NumpydocParser().freeze()
+
+
+@functools.lru_cache(maxsize=32)
+def _get_custom_parser(sections: T.Tuple[Section, ...]) -> NumpydocParser:
+    return NumpydocParser(list(sections)).freeze()
+
+
+def get_parser(
+    sections: T.Optional[T.Iterable[Section]] = None,
+) -> NumpydocParser:
+    """Return a frozen parser for the given configuration.
+
+    Parsers are compiled once per configuration and shared between callers.
+
+    :param sections: Recognized sections or None to defaults.
+    :returns: the shared parser
+    """
+    if sections is None:
+        return _DEFAULT_PARSER
+    return _get_custom_parser(tuple(sections))
+
+
+def has_meta(text: T.Optional[str]) -> bool:
+    """Check cheaply whether the docstring may contain numpydoc-style
+    sections.
+
+    :param text: docstring text, not necessarily cleaned
+    :returns: False if parsing the docstring surely results in a bare
+        description, True otherwise
+    """
+    return _DEFAULT_PARSER.has_meta(text)
+
+
+def parse(
+    text: T.Optional[str], lazy: bool = False, errors: str = "raise"
+) -> Docstring:
     """Parse the numpy-style docstring into its components.
 
+    :param lazy: defer parsing the meta information until it's accessed
+    :param errors: "raise" or "collect"; accepted for compatibility with the
+        other styles, as numpydoc parsing never fails
+    :returns: parsed docstring
+    """
+    return _DEFAULT_PARSER.parse(text, lazy=lazy, errors=errors)
+
+
+def parse_prepared(
+    prepared: PreparedText, lazy: bool = False, errors: str = "raise"
+) -> Docstring:
+    """Parse the numpy-style docstring into its components, reusing the text
+    already prepared for other styles.
+
+    :param prepared: docstring text prepared for parsing
+    :param lazy: defer parsing the meta information until it's accessed
+    :param errors: "raise" or "collect", as in ``parse``
     :returns: parsed docstring
     """
-    return NumpydocParser().parse(text)
+    return _DEFAULT_PARSER.parse_prepared(prepared, lazy=lazy, errors=errors)
 
 
 def compose(
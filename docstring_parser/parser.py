@@ -1,15 +1,24 @@
 """The main parsing routine."""
 
 import inspect
+import re
+import time
 import typing as T
 
-from docstring_parser import epydoc, google, numpydoc, rest
+from docstring_parser import epydoc, google, numpydoc, rest, stats
 from docstring_parser.attrdoc import add_attribute_docstrings
+from docstring_parser.cache import BaseParseCache
 from docstring_parser.common import (
+    _DEADLINE,
     Docstring,
     DocstringStyle,
+    InputTooLongError,
     ParseError,
+    ParseLimitError,
+    PreparedText,
     RenderingStyle,
+    _check_deadline,
+    _diagnostics_list,
 )
 
 _STYLE_MAP = {
@@ -19,33 +28,260 @@ _STYLE_MAP = {
     DocstringStyle.EPYDOC: epydoc,
 }
 
+_PARSE_CACHE: T.Optional[BaseParseCache] = None
+
+# Lines that may start meta information in each of the styles, counted to
+# guess the style of lazily parsed docstrings. The patterns are applied to
+# the raw (not yet cleaned) text, hence the optional leading whitespace.
+_STYLE_HINTS_REGEX = re.compile(
+    r"^[^\S\n]*(?:"
+    r"(?P<REST>:)"
+    r"|(?P<EPYDOC>@)"
+    r"|(?P<NUMPYDOC>-+[^\S\n]*$|\.\.\s*deprecated\s*::)"
+    r"|(?P<GOOGLE>(?:"
+    + "|".join(re.escape(section.title) for section in google.DEFAULT_SECTIONS)
+    + r"):[ \t\r\f\v]*$)"
+    r")",
+    flags=re.M,
+)
+
+
+def _detect_styles(text: str) -> T.Dict[DocstringStyle, int]:
+    """Score how likely the text is written in each of the styles.
+
+    :param text: docstring text to examine
+    :returns: number of lines hinting at each style
+    """
+    scores = dict.fromkeys(_STYLE_MAP, 0)
+    for match in _STYLE_HINTS_REGEX.finditer(text):
+        scores[DocstringStyle[match.lastgroup]] += 1
+    return scores
+
+
+def set_parse_cache(cache: T.Optional[BaseParseCache]) -> None:
+    """Memoize the results of ``parse`` and ``parse_from_object``.
+
+    :param cache: cache to use or None to disable caching
+    """
+    global _PARSE_CACHE  # pylint: disable=global-statement
+    _PARSE_CACHE = cache
+
+
+def get_parse_cache() -> T.Optional[BaseParseCache]:
+    """Return the cache used to memoize parsed docstrings.
+
+    :returns: the cache or None if caching is disabled
+    """
+    return _PARSE_CACHE
+
 
 def parse(
-    text: T.Optional[str], style: DocstringStyle = DocstringStyle.AUTO
+    text: T.Optional[str],
+    style: DocstringStyle = DocstringStyle.AUTO,
+    lazy: bool = False,
+    errors: str = "raise",
+    max_length: T.Optional[int] = None,
+    deadline: T.Optional[float] = None,
+    on_limit: str = "raise",
 ) -> Docstring:
     """Parse the docstring into its components.
 
+    With ``lazy``, only the description is parsed up front and the meta
+    information is parsed when it's first accessed, raising any
+    ``ParseError`` at that point. In that case the automatic style detection
+    trusts the hints found in the text instead of comparing the results of
+    every parser. To settle the style of the result before it's returned,
+    the meta information is then parsed up front in the style they hint at,
+    and the results of every parser are compared after all if it turns out
+    to be malformed in that style.
+
+    With ``errors="collect"``, malformed meta information is skipped instead
+    of raising a ``ParseError``, and the error messages are listed in the
+    ``diagnostics`` of the result.
+
+    Texts longer than ``max_length`` aren't parsed at all, and parsing stops
+    once it takes longer than ``deadline``. With ``on_limit="raise"``, going
+    over either limit raises an ``InputTooLongError`` or a
+    ``DeadlineExceededError``. With ``on_limit="truncate"``, the result has
+    only the description, made of the text cut to ``max_length``, and the
+    error message is listed in its ``diagnostics``. The deadline doesn't
+    apply to the meta information parsed lazily after the call.
+
     :param text: docstring text to parse
     :param style: docstring style
+    :param lazy: defer parsing the meta information until it's accessed
+    :param errors: "raise" or "collect"
+    :param max_length: maximum number of characters of the text, or None
+    :param deadline: maximum number of seconds spent parsing, or None
+    :param on_limit: "raise" or "truncate"
     :returns: parsed docstring representation
+    :raises ParseLimitError: if the text goes over the limits and they're
+        raised
     """
-    if style != DocstringStyle.AUTO:
-        return _STYLE_MAP[style].parse(text)
+    if stats.ENABLED:
+        with stats.measure("parse", style, text):
+            return _parse_limited(
+                text, style, lazy, errors, max_length, deadline, on_limit
+            )
+    return _parse_limited(
+        text, style, lazy, errors, max_length, deadline, on_limit
+    )
 
-    exc: T.Optional[Exception] = None
-    rets = []
-    for module in _STYLE_MAP.values():
+
+def _parse_limited(
+    text: T.Optional[str],
+    style: DocstringStyle,
+    lazy: bool,
+    errors: str,
+    max_length: T.Optional[int],
+    deadline: T.Optional[float],
+    on_limit: str,
+) -> Docstring:
+    if on_limit not in ("raise", "truncate"):
+        raise ValueError(f"Unknown on_limit mode: {on_limit!r}.")
+    try:
+        if max_length is not None and text and len(text) > max_length:
+            raise InputTooLongError(
+                f"Docstring of {len(text)} characters is longer than the "
+                f"limit of {max_length}."
+            )
+        if deadline is None:
+            return _parse_cached(text, style, lazy, errors)
+        token = _DEADLINE.set((time.monotonic() + deadline, deadline))
         try:
-            ret = module.parse(text)
-        except ParseError as ex:
-            exc = ex
-        else:
-            rets.append(ret)
+            return _parse_cached(text, style, lazy, errors)
+        finally:
+            _DEADLINE.reset(token)
+    except ParseLimitError as ex:
+        if on_limit == "raise":
+            raise
+        return _truncated((text or "")[:max_length], style, str(ex))
 
-    if not rets:
-        raise exc
 
-    return sorted(rets, key=lambda d: len(d.meta), reverse=True)[0]
+def _truncated(text: str, style: DocstringStyle, message: str) -> Docstring:
+    """Make a docstring of the description alone, for a text that went over
+    the limits of its parsing.
+
+    :param text: docstring text, already cut to the maximum length
+    :param style: docstring style, guessed from the text if AUTO
+    :param message: error message listed in the diagnostics
+    :returns: docstring without any meta information
+    """
+    if style == DocstringStyle.AUTO:
+        scores = _detect_styles(text)
+        style = max(scores, key=scores.__getitem__)
+    ret = Docstring(style=style)
+    prepared = PreparedText(text)
+    prepared.describe(ret, len(prepared.text))
+    ret.diagnostics = [message]
+    return ret
+
+
+def _parse_cached(
+    text: T.Optional[str], style: DocstringStyle, lazy: bool, errors: str
+) -> Docstring:
+    cache = _PARSE_CACHE
+    if cache is None or not text:
+        return _parse(text, style, lazy, errors)
+
+    # Deferred results aren't cached, but can be served from the cache.
+    key = (text, style, errors)
+    ret = cache.get(key)
+    if ret is None:
+        ret = _parse(text, style, lazy, errors)
+        if not ret.is_meta_deferred:
+            cache.put(key, ret)
+    return ret
+
+
+def _parse(
+    text: T.Optional[str], style: DocstringStyle, lazy: bool, errors: str
+) -> Docstring:
+    if style != DocstringStyle.AUTO:
+        return _STYLE_MAP[style].parse(text, lazy=lazy, errors=errors)
+
+    _diagnostics_list(errors)
+    if lazy:
+        scores = _detect_styles(text or "")
+        likely_style = max(scores, key=scores.__getitem__)
+        # The meta information is parsed up front, since falling back to the
+        # comparison below may change the style and the descriptions.
+        ret = _STYLE_MAP[likely_style].parse(text, errors="collect")
+        if not ret.diagnostics:
+            if stats.ENABLED:
+                stats.record_auto(likely_style, {})
+            return ret
+
+    # Pick the style that finds the most meta information without any
+    # errors, preferring the earlier styles in case of a tie. The errors are
+    # collected rather than raised, which is much cheaper for the styles
+    # that don't fit, and the text is cleaned only once for all of them.
+    prepared = PreparedText(text)
+    _check_deadline()
+    failed: T.Optional[Docstring] = None
+    best: T.Any = None
+    best_meta = -1
+    # Time spent on each style, if the statistics are recorded.
+    seconds: T.Optional[T.Dict[DocstringStyle, float]] = (
+        {} if stats.ENABLED else None
+    )
+    for candidate, module in _STYLE_MAP.items():
+        start = time.perf_counter() if seconds is not None else 0.0
+        if module.has_meta(text):
+            _check_deadline()
+            ret = _parse_prepared(candidate, prepared, text, "collect")
+            if ret.diagnostics:
+                failed = ret
+            elif len(ret.meta) > best_meta:
+                best, best_meta = ret, len(ret.meta)
+        elif best_meta < 0:
+            # Without any meta the style can only produce a bare
+            # description, so defer parsing until it's known to win.
+            best, best_meta = candidate, 0
+        if seconds is not None:
+            seconds[candidate] = time.perf_counter() - start
+
+    if best is None:
+        assert failed is not None
+        if seconds is not None:
+            stats.record_auto(None, seconds)
+        if errors == "raise":
+            raise ParseError(failed.diagnostics[0])
+        return failed
+
+    if not isinstance(best, Docstring):
+        start = time.perf_counter() if seconds is not None else 0.0
+        best = _parse_prepared(best, prepared, text, errors)
+        if seconds is not None:
+            seconds[best.style] += time.perf_counter() - start
+    if seconds is not None:
+        stats.record_auto(best.style, seconds)
+    return best
+
+
+def _parse_prepared(
+    style: DocstringStyle,
+    prepared: PreparedText,
+    text: T.Optional[str],
+    errors: str,
+) -> Docstring:
+    """Parse the prepared text in a style, recorded in the statistics like
+    the ``parse`` function of that style.
+
+    :param style: docstring style
+    :param prepared: docstring text prepared for parsing
+    :param text: docstring text, as given to ``parse``
+    :param errors: "raise" or "collect"
+    :returns: parsed docstring
+    """
+    module = _STYLE_MAP[style]
+    if not stats.ENABLED:
+        return module.parse_prepared(prepared, errors=errors)
+    with stats.measure("style_parse", style, text) as measurement:
+        ret = module.parse_prepared(prepared, errors=errors)
+        if ret.diagnostics:
+            measurement.mark_error()
+        return ret
 
 
 def parse_from_object(
@@ -71,6 +307,13 @@ def parse_from_object(
     :param style: docstring style
     :returns: parsed docstring representation
     """
+    if stats.ENABLED:
+        with stats.measure("parse_from_object", style, obj.__doc__):
+            return _parse_from_object(obj, style)
+    return _parse_from_object(obj, style)
+
+
+def _parse_from_object(obj: T.Any, style: DocstringStyle) -> Docstring:
     docstring = parse(obj.__doc__, style=style)
 
     if inspect.isclass(obj) or inspect.ismodule(obj):
@@ -92,9 +335,16 @@ def compose(
     :param indent: the characters used as indentation in the docstring string
     :returns: docstring text
     """
-    module = _STYLE_MAP[
-        docstring.style if style == DocstringStyle.AUTO else style
-    ]
+    if style == DocstringStyle.AUTO:
+        style = docstring.style
+    module = _STYLE_MAP[style]
+    if stats.ENABLED:
+        with stats.measure("compose", style) as measurement:
+            ret = module.compose(
+                docstring, rendering_style=rendering_style, indent=indent
+            )
+            measurement.set_text(ret)
+            return ret
     return module.compose(
         docstring, rendering_style=rendering_style, indent=indent
     )
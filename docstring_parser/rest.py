@@ -1,9 +1,10 @@
 """ReST-style docstring parsing."""
 
-import inspect
+import functools
 import re
 import typing as T
 
+from . import stats
 from .common import (
     DEPRECATION_KEYWORDS,
     PARAM_KEYWORDS,
@@ -17,53 +18,72 @@ from .common import (
     DocstringRaises,
     DocstringReturns,
     DocstringStyle,
-    ParseError,
+    PreparedText,
     RenderingStyle,
+    _check_deadline,
+    _cleandoc,
+    _described_default,
+    _diagnostics_list,
+    _iter_fields,
+    _meta_hint_search,
+    _report,
 )
 
 
-def _build_meta(args: T.List[str], desc: str) -> DocstringMeta:
-    key = args[0]
-
-    if key in PARAM_KEYWORDS:
-        if len(args) == 3:
-            key, type_name, arg_name = args
-            if type_name.endswith("?"):
-                is_optional = True
-                type_name = type_name[:-1]
-            else:
-                is_optional = False
-        elif len(args) == 2:
-            key, arg_name = args
-            type_name = None
-            is_optional = None
+def _build_param(
+    args: T.List[str], desc: str, diagnostics: T.Optional[T.List[str]]
+) -> T.Optional[DocstringParam]:
+    if len(args) == 3:
+        _key, type_name, arg_name = args
+        if type_name.endswith("?"):
+            is_optional = True
+            type_name = type_name[:-1]
         else:
-            raise ParseError(
-                f"Expected one or two arguments for a {key} keyword."
-            )
+            is_optional = False
+    elif len(args) == 2:
+        _key, arg_name = args
+        type_name = None
+        is_optional = None
+    else:
+        _report(
+            diagnostics,
+            f"Expected one or two arguments for a {args[0]} keyword.",
+        )
+        return None
 
-        match = re.match(r".*defaults to (.+)", desc, flags=re.DOTALL)
-        default = match.group(1).rstrip(".") if match else None
+    default = _described_default(desc)
 
-        return DocstringParam(
-            args=args,
-            description=desc,
-            arg_name=arg_name,
-            type_name=type_name,
-            is_optional=is_optional,
-            default=default,
-        )
+    return DocstringParam(
+        args=args,
+        description=desc,
+        arg_name=arg_name,
+        type_name=type_name,
+        is_optional=is_optional,
+        default=default,
+    )
 
-    if key in RETURNS_KEYWORDS | YIELDS_KEYWORDS:
-        if len(args) == 2:
-            type_name = args[1]
-        elif len(args) == 1:
-            type_name = None
-        else:
-            raise ParseError(
-                f"Expected one or no arguments for a {key} keyword."
+
+def _build_meta(
+    args: T.List[str], desc: str, diagnostics: T.Optional[T.List[str]]
+) -> T.Optional[DocstringMeta]:
+    key = args[0]
+
+    if key in PARAM_KEYWORDS:
+        return _build_param(args, desc, diagnostics)
+
+    if key in RETURNS_KEYWORDS | YIELDS_KEYWORDS | RAISES_KEYWORDS:
+        if len(args) > 2:
+            _report(
+                diagnostics,
+                f"Expected one or no arguments for a {key} keyword.",
             )
+            return None
+        type_name = args[1] if len(args) == 2 else None
 
+        if key in RAISES_KEYWORDS:
+            return DocstringRaises(
+                args=args, description=desc, type_name=type_name
+            )
         return DocstringReturns(
             args=args,
             description=desc,
@@ -83,68 +103,35 @@ def _build_meta(args: T.List[str], desc: str) -> DocstringMeta:
             description=match.group("desc") if match else desc,
         )
 
-    if key in RAISES_KEYWORDS:
-        if len(args) == 2:
-            type_name = args[1]
-        elif len(args) == 1:
-            type_name = None
-        else:
-            raise ParseError(
-                f"Expected one or no arguments for a {key} keyword."
-            )
-        return DocstringRaises(
-            args=args, description=desc, type_name=type_name
-        )
-
     return DocstringMeta(args=args, description=desc)
 
 
-def parse(text: T.Optional[str]) -> Docstring:
-    """Parse the ReST-style docstring into its components.
-
-    :returns: parsed docstring
-    """
-    ret = Docstring(style=DocstringStyle.REST)
-    if not text:
-        return ret
-
-    text = inspect.cleandoc(text)
-    match = re.search("^:", text, flags=re.M)
-    if match:
-        desc_chunk = text[: match.start()]
-        meta_chunk = text[match.start() :]
-    else:
-        desc_chunk = text
-        meta_chunk = ""
-
-    parts = desc_chunk.split("\n", 1)
-    ret.short_description = parts[0] or None
-    if len(parts) > 1:
-        long_desc_chunk = parts[1] or ""
-        ret.blank_after_short_description = long_desc_chunk.startswith("\n")
-        ret.blank_after_long_description = long_desc_chunk.endswith("\n\n")
-        ret.long_description = long_desc_chunk.strip() or None
-
+def _parse_meta(
+    meta_chunk: str, diagnostics: T.Optional[T.List[str]]
+) -> T.List[DocstringMeta]:
+    ret: T.List[DocstringMeta] = []
     types = {}
     rtypes = {}
-    for match in re.finditer(
-        r"(^:.*?)(?=^:|\Z)", meta_chunk, flags=re.S | re.M
-    ):
-        chunk = match.group(0)
-        if not chunk:
+    for chunk in _iter_fields(meta_chunk, ":"):
+        _check_deadline()
+        parts = chunk.lstrip(":").split(":", 1)
+        if len(parts) != 2:
+            _report(
+                diagnostics, f'Error parsing meta information near "{chunk}".'
+            )
             continue
-        try:
-            args_chunk, desc_chunk = chunk.lstrip(":").split(":", 1)
-        except ValueError as ex:
-            raise ParseError(
-                f'Error parsing meta information near "{chunk}".'
-            ) from ex
+        args_chunk, desc_chunk = parts
         args = args_chunk.split()
+        if not args:
+            _report(
+                diagnostics, f'Error parsing meta information near "{chunk}".'
+            )
+            continue
         desc = desc_chunk.strip()
 
         if "\n" in desc:
             first_line, rest = desc.split("\n", 1)
-            desc = first_line + "\n" + inspect.cleandoc(rest)
+            desc = first_line + "\n" + _cleandoc(rest)
 
         # Add special handling for :type a: typename
         if len(args) == 2 and args[0] == "type":
@@ -152,17 +139,19 @@ def parse(text: T.Optional[str]) -> Docstring:
         elif len(args) in [1, 2] and args[0] == "rtype":
             rtypes[None if len(args) == 1 else args[1]] = desc
         else:
-            ret.meta.append(_build_meta(args, desc))
+            meta = _build_meta(args, desc, diagnostics)
+            if meta is not None:
+                ret.append(meta)
 
-    for meta in ret.meta:
+    for meta in ret:
         if isinstance(meta, DocstringParam):
             meta.type_name = meta.type_name or types.get(meta.arg_name)
         elif isinstance(meta, DocstringReturns):
             meta.type_name = meta.type_name or rtypes.get(meta.return_name)
 
-    if not any(isinstance(m, DocstringReturns) for m in ret.meta) and rtypes:
+    if not any(isinstance(m, DocstringReturns) for m in ret) and rtypes:
         for return_name, type_name in rtypes.items():
-            ret.meta.append(
+            ret.append(
                 DocstringReturns(
                     args=[],
                     type_name=type_name,
@@ -175,6 +164,69 @@ def parse(text: T.Optional[str]) -> Docstring:
     return ret
 
 
+_has_meta_hint = _meta_hint_search(":")
+
+
+def has_meta(text: T.Optional[str]) -> bool:
+    """Check cheaply whether the docstring may contain ReST-style meta
+    information.
+
+    :param text: docstring text, not necessarily cleaned
+    :returns: False if parsing the docstring surely results in a bare
+        description, True otherwise
+    """
+    return bool(text) and ":" in text and _has_meta_hint(text)
+
+
+def parse(
+    text: T.Optional[str], lazy: bool = False, errors: str = "raise"
+) -> Docstring:
+    """Parse the ReST-style docstring into its components.
+
+    :param lazy: defer parsing the meta information until it's accessed
+    :param errors: "raise" to raise a ``ParseError`` on malformed meta
+        information, or "collect" to skip it and list the errors in the
+        diagnostics of the result
+    :returns: parsed docstring
+    """
+    if stats.ENABLED:
+        with stats.measure("style_parse", DocstringStyle.REST, text):
+            return parse_prepared(PreparedText(text), lazy=lazy, errors=errors)
+    return parse_prepared(PreparedText(text), lazy=lazy, errors=errors)
+
+
+def parse_prepared(
+    prepared: PreparedText, lazy: bool = False, errors: str = "raise"
+) -> Docstring:
+    """Parse the ReST-style docstring into its components, reusing the text
+    already prepared for other styles.
+
+    :param prepared: docstring text prepared for parsing
+    :param lazy: defer parsing the meta information until it's accessed
+    :param errors: "raise" or "collect", as in ``parse``
+    :returns: parsed docstring
+    """
+    diagnostics = _diagnostics_list(errors)
+    ret = Docstring(style=DocstringStyle.REST)
+    if diagnostics is not None:
+        ret.diagnostics = diagnostics
+    text = prepared.text
+    if not text:
+        return ret
+
+    match = re.search("^:", text, flags=re.M)
+    meta_start = match.start() if match else len(text)
+    prepared.describe(ret, meta_start)
+    meta_chunk = text[meta_start:]
+
+    if lazy:
+        ret.defer_meta(functools.partial(_parse_meta, meta_chunk, diagnostics))
+    else:
+        ret.meta.extend(_parse_meta(meta_chunk, diagnostics))
+
+    return ret
+
+
 def compose(
     docstring: Docstring,
     rendering_style: RenderingStyle = RenderingStyle.COMPACT,
@@ -0,0 +1,104 @@
+"""Compact serialization of parsed docstrings.
+
+Many docstrings are encoded together into nested tuples of integers, which
+refer to a table of the values shared by the whole batch, so that repeated
+strings such as type names and keywords are stored once. The result is
+smaller and faster to pickle than the docstrings themselves, and can also be
+stored as JSON.
+"""
+
+import typing as T
+
+from .common import (
+    META_KINDS,
+    Docstring,
+    DocstringStyle,
+    _meta_kind,
+    _slot_names,
+)
+
+FORMAT_VERSION = 2
+
+_KIND_CLASSES = list(META_KINDS.values())
+_KIND_CODES = {cls: code for code, cls in enumerate(_KIND_CLASSES)}
+_FIELDS = [tuple(_slot_names(cls)[1:]) for cls in _KIND_CLASSES]
+_STYLES = {style.name: style for style in DocstringStyle}
+
+Payload = T.Tuple[int, T.List[T.Any], T.List[T.Tuple[T.Any, ...]]]
+
+
+class _ValueTable(dict):
+    """Index of the values of a batch, assigning new values the next index."""
+
+    def __missing__(self, key: T.Any) -> int:
+        index = self[key] = len(self)
+        return index
+
+
+def encode(docstrings: T.Iterable[Docstring]) -> Payload:
+    """Encode many docstrings at once.
+
+    :param docstrings: docstrings to encode
+    :returns: compact representation of the docstrings, made of tuples,
+        lists, strings, integers, booleans and None
+    """
+    table = _ValueTable()
+    index = table.__getitem__
+    rows = []
+    for docstring in docstrings:
+        meta_rows = []
+        for meta in docstring.meta:
+            code = _KIND_CODES[_meta_kind(type(meta))]
+            meta_rows.append(
+                (
+                    code,
+                    tuple(map(index, meta.args)),
+                    *[index(getattr(meta, name)) for name in _FIELDS[code]],
+                )
+            )
+        rows.append(
+            (
+                index(docstring.style.name if docstring.style else None),
+                index(docstring.short_description),
+                index(docstring.long_description),
+                index(docstring.blank_after_short_description),
+                index(docstring.blank_after_long_description),
+                meta_rows,
+                tuple(map(index, docstring.diagnostics)),
+            )
+        )
+    return FORMAT_VERSION, list(table), rows
+
+
+def decode(payload: T.Sequence[T.Any]) -> T.List[Docstring]:
+    """Decode docstrings encoded with ``encode``.
+
+    :param payload: compact representation of the docstrings
+    :returns: the docstrings, in the order they were encoded
+    :raises ValueError: if the payload comes from an unknown format version
+    """
+    version, values, rows = payload
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unknown serialization format: {version!r}.")
+
+    value = values.__getitem__
+    ret = []
+    for row in rows:
+        style, short, long, blank_short, blank_long, meta_rows, diags = row
+        docstring = Docstring(style=_STYLES.get(value(style)))
+        docstring.short_description = value(short)
+        docstring.long_description = value(long)
+        docstring.blank_after_short_description = value(blank_short)
+        docstring.blank_after_long_description = value(blank_long)
+        metas = []
+        for code, args, *fields in meta_rows:
+            cls = _KIND_CLASSES[code]
+            meta = cls.__new__(cls)
+            meta.args = list(map(value, args))
+            for name, field in zip(_FIELDS[code], fields):
+                setattr(meta, name, value(field))
+            metas.append(meta)
+        docstring.meta = metas
+        docstring.diagnostics = list(map(value, diags))
+        ret.append(docstring)
+    return ret
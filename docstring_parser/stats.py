@@ -0,0 +1,237 @@
+"""Opt-in statistics of parsing and composing docstrings.
+
+The statistics are recorded once enabled, either by calling ``enable`` or by
+setting the ``DOCSTRING_PARSER_STATS`` environment variable to a value other
+than "0" before importing the package. While disabled, the instrumented
+functions only check a flag.
+
+For each operation and docstring style, the statistics count the calls, the
+calls raising a ``ParseError``, the bytes of text parsed or composed, and
+keep a histogram of the latencies. The operations are:
+
+- ``parse``: the ``parse`` function, by requested style;
+- ``style_parse``: the ``parse`` function or method of each style;
+- ``compose``: the ``compose`` function, by rendered style;
+- ``parse_from_object``: the ``parse_from_object`` function.
+
+The operations are nested, so parsing in a specific style is counted both
+under ``parse`` and ``style_parse``. The automatic style detection counts
+each style it tries under ``style_parse``, as an error if the meta
+information is malformed in that style. It also counts the styles it picks
+and the time it spends on the other styles.
+
+The statistics are kept per process.
+"""
+
+import bisect
+import os
+import threading
+import time
+import typing as T
+
+from .common import DocstringStyle, ParseError
+
+# Upper bounds of the latency histogram buckets, in seconds. The last bucket
+# counts the calls slower than all of them.
+LATENCY_BUCKETS = (
+    0.00001,
+    0.00003,
+    0.0001,
+    0.0003,
+    0.001,
+    0.003,
+    0.01,
+    0.03,
+    0.1,
+    0.3,
+    1.0,
+    3.0,
+)
+
+# Whether the statistics are being recorded, changed with ``enable`` and
+# ``disable``.
+ENABLED = os.environ.get("DOCSTRING_PARSER_STATS", "0") not in ("", "0")
+
+_LOCK = threading.Lock()
+
+
+class _Counters:
+    """Statistics of an operation in a docstring style."""
+
+    __slots__ = ("calls", "errors", "bytes", "latency_sum", "latency_counts")
+
+    def __init__(self) -> None:
+        """Initialize self."""
+        self.calls = 0
+        self.errors = 0
+        self.bytes = 0
+        self.latency_sum = 0.0
+        self.latency_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def to_dict(self) -> T.Dict[str, T.Any]:
+        """Convert to a JSON-serializable dictionary.
+
+        :returns: dictionary with the counts, the bytes and the latencies
+        """
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "latency": {
+                "buckets": list(LATENCY_BUCKETS),
+                "counts": list(self.latency_counts),
+                "sum": self.latency_sum,
+            },
+        }
+
+
+_COUNTERS: T.Dict[T.Tuple[str, str], _Counters] = {}
+_AUTO_WINS: T.Dict[str, int] = {}
+_AUTO_LOSING_SECONDS: T.Dict[str, float] = {}
+
+
+def _style_name(style: T.Optional[DocstringStyle]) -> str:
+    return style.name if style is not None else "NONE"
+
+
+def _text_bytes(text: T.Optional[str]) -> int:
+    return len(text.encode("utf-8", "surrogatepass")) if text else 0
+
+
+class _Measurement:
+    """Context manager recording a call to an instrumented operation."""
+
+    __slots__ = ("_operation", "_style", "_text", "_start", "_error")
+
+    def __init__(
+        self,
+        operation: str,
+        style: T.Optional[DocstringStyle],
+        text: T.Optional[str] = None,
+    ) -> None:
+        """Initialize self.
+
+        :param operation: name of the operation
+        :param style: docstring style of the operation
+        :param text: text parsed, if known up front
+        """
+        self._operation = operation
+        self._style = style
+        self._text = text
+        self._start = 0.0
+        self._error = False
+
+    def __enter__(self) -> "_Measurement":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: T.Any, exc_value: T.Any, tb: T.Any) -> None:
+        elapsed = time.perf_counter() - self._start
+        size = _text_bytes(self._text)
+        key = (self._operation, _style_name(self._style))
+        with _LOCK:
+            counters = _COUNTERS.get(key)
+            if counters is None:
+                counters = _COUNTERS[key] = _Counters()
+            counters.calls += 1
+            if self._error or (
+                exc_type is not None and issubclass(exc_type, ParseError)
+            ):
+                counters.errors += 1
+            counters.bytes += size
+            counters.latency_sum += elapsed
+            counters.latency_counts[
+                bisect.bisect_left(LATENCY_BUCKETS, elapsed)
+            ] += 1
+
+    def set_text(self, text: T.Optional[str]) -> None:
+        """Set the text counted in the bytes, once known.
+
+        :param text: text parsed or composed
+        """
+        self._text = text
+
+    def mark_error(self) -> None:
+        """Count the call as an error, even though it doesn't raise."""
+        self._error = True
+
+
+def measure(
+    operation: str,
+    style: T.Optional[DocstringStyle],
+    text: T.Optional[str] = None,
+) -> _Measurement:
+    """Record a call to an instrumented operation, as a context manager
+    wrapping the call.
+
+    The call is counted as an error if it raises a ``ParseError``, or if
+    ``mark_error`` is called on the context manager.
+
+    :param operation: name of the operation
+    :param style: docstring style of the operation
+    :param text: text parsed, if known up front
+    :returns: context manager measuring the call
+    """
+    return _Measurement(operation, style, text)
+
+
+def record_auto(
+    winner: T.Optional[DocstringStyle],
+    seconds: T.Mapping[DocstringStyle, float],
+) -> None:
+    """Record the outcome of the automatic style detection.
+
+    :param winner: style picked or None if all of them failed
+    :param seconds: time spent on each of the styles tried
+    """
+    with _LOCK:
+        name = _style_name(winner)
+        _AUTO_WINS[name] = _AUTO_WINS.get(name, 0) + 1
+        for style, elapsed in seconds.items():
+            if style != winner:
+                name = style.name
+                _AUTO_LOSING_SECONDS[name] = (
+                    _AUTO_LOSING_SECONDS.get(name, 0.0) + elapsed
+                )
+
+
+def enable() -> None:
+    """Start recording the statistics."""
+    global ENABLED  # pylint: disable=global-statement
+    ENABLED = True
+
+
+def disable() -> None:
+    """Stop recording the statistics, keeping the ones recorded so far."""
+    global ENABLED  # pylint: disable=global-statement
+    ENABLED = False
+
+
+def snapshot() -> T.Dict[str, T.Any]:
+    """Return the statistics recorded so far.
+
+    :returns: JSON-serializable dictionary with the statistics of each
+        operation by style name under "operations", and the styles picked by
+        the automatic detection along with the seconds spent on the styles
+        not picked under "auto"
+    """
+    with _LOCK:
+        operations: T.Dict[str, T.Dict[str, T.Any]] = {}
+        for (operation, style), counters in sorted(_COUNTERS.items()):
+            operations.setdefault(operation, {})[style] = counters.to_dict()
+        return {
+            "enabled": ENABLED,
+            "operations": operations,
+            "auto": {
+                "wins": dict(_AUTO_WINS),
+                "losing_seconds": dict(_AUTO_LOSING_SECONDS),
+            },
+        }
+
+
+def reset() -> None:
+    """Discard the statistics recorded so far."""
+    with _LOCK:
+        _COUNTERS.clear()
+        _AUTO_WINS.clear()
+        _AUTO_LOSING_SECONDS.clear()
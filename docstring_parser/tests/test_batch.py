@@ -0,0 +1,113 @@
+"""Tests for parsing of many docstrings at once."""
+
+import typing as T
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from docstring_parser import batch
+from docstring_parser.batch import parse_many, parse_many_unordered
+from docstring_parser.common import Docstring, DocstringStyle, ParseError
+from docstring_parser.parser import parse
+
+TEXTS = [
+    None,
+    "Short description",
+    "Short description\n:param spam: spam desc",
+    "Short description\nArgs:\n    spam: spam desc\n    eggs: eggs desc",
+    "Short description\nParameters\n----------\nspam\n    spam desc",
+    "Short description\n@param spam: spam desc",
+] * 5
+
+
+def _summary(docstring: Docstring) -> T.Tuple[T.Any, ...]:
+    return (
+        docstring.style,
+        docstring.short_description,
+        [(p.arg_name, p.description) for p in docstring.params],
+    )
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread", "process"])
+def test_parse_many(executor: str) -> None:
+    """Test parsing docstrings in order."""
+    docstrings = parse_many(
+        TEXTS, executor=executor, chunksize=4, max_workers=2
+    )
+
+    assert [_summary(d) for d in docstrings] == [
+        _summary(parse(text)) for text in TEXTS
+    ]
+    assert [d.style for d in docstrings[:6]] == [
+        DocstringStyle.REST,
+        DocstringStyle.REST,
+        DocstringStyle.REST,
+        DocstringStyle.GOOGLE,
+        DocstringStyle.NUMPYDOC,
+        DocstringStyle.EPYDOC,
+    ]
+    assert [len(d.params) for d in docstrings[:6]] == [0, 0, 1, 2, 1, 1]
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread", "process"])
+def test_parse_many_unordered(executor: str) -> None:
+    """Test parsing docstrings in the order of completion."""
+    results = list(
+        parse_many_unordered(
+            iter(TEXTS), executor=executor, chunksize=4, max_workers=2
+        )
+    )
+
+    assert sorted(i for i, _ in results) == list(range(len(TEXTS)))
+    for i, docstring in results:
+        assert _summary(docstring) == _summary(parse(TEXTS[i]))
+
+
+def test_parse_many_existing_executor() -> None:
+    """Test parsing docstrings with an executor managed by the caller."""
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        docstrings = parse_many(
+            TEXTS, style=DocstringStyle.GOOGLE, executor=pool, chunksize=3
+        )
+        assert pool.submit(lambda: 42).result() == 42
+
+    assert all(d.style == DocstringStyle.GOOGLE for d in docstrings)
+    assert [len(d.params) for d in docstrings[:6]] == [0, 0, 0, 2, 0, 0]
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread"])
+def test_parse_many_error(executor: str) -> None:
+    """Test that parsing errors are propagated."""
+    with pytest.raises(ParseError):
+        parse_many(
+            ["Short description", ":param 3 + 3 a: a param"],
+            style=DocstringStyle.REST,
+            executor=executor,
+        )
+
+
+def test_parse_many_invalid_arguments() -> None:
+    """Test rejecting invalid arguments."""
+    with pytest.raises(ValueError):
+        parse_many(TEXTS, executor="fibers")
+    with pytest.raises(ValueError):
+        parse_many_unordered(TEXTS, chunksize=0)
+
+
+def test_parse_many_unordered_closed() -> None:
+    """Test that closing the iterator early shuts down its pool."""
+    pools = []
+    new_executor = batch._new_executor  # pylint: disable=protected-access
+
+    def record_executor(*args: T.Any) -> T.Any:
+        pools.append(new_executor(*args))
+        return pools[-1]
+
+    with patch.object(batch, "_new_executor", side_effect=record_executor):
+        results = parse_many_unordered(TEXTS, executor="thread", chunksize=1)
+        next(results)
+        results.close()
+
+    assert len(pools) == 1
+    with pytest.raises(RuntimeError):
+        pools[0].submit(parse, "Short description")
@@ -0,0 +1,104 @@
+"""Smoke tests for the benchmarks."""
+
+import copy
+import json
+import pathlib
+
+from docstring_parser.benchmarks import compare, run_benchmarks
+from docstring_parser.benchmarks.__main__ import main
+from docstring_parser.benchmarks.corpus import synthetic_docstring
+from docstring_parser.common import DocstringStyle
+from docstring_parser.parser import parse
+
+ARGS = ["--rounds", "1", "--limit", "5", "--sizes", "1,3"]
+
+
+def test_synthetic_docstrings() -> None:
+    """Test that the synthetic docstrings parse as intended."""
+    for style in DocstringStyle:
+        if style == DocstringStyle.AUTO:
+            continue
+        docstring = parse(synthetic_docstring(style, 3))
+        assert docstring.style == style
+        assert [p.arg_name for p in docstring.params] == [
+            "arg0",
+            "arg1",
+            "arg2",
+        ]
+        assert docstring.params[2].default == "2"
+        assert docstring.returns
+        assert docstring.raises
+
+
+def test_run_benchmarks() -> None:
+    """Test that every benchmark runs and reports its statistics."""
+    results = run_benchmarks(
+        rounds=1, stdlib_limit=5, sizes=[1, 3], memory=True
+    )
+
+    json.dumps(results)
+    assert set(results["benchmarks"]) >= {
+        "parse.rest",
+        "parse.google",
+        "parse.numpydoc",
+        "parse.epydoc",
+        "parse.auto",
+        "compose.rest.compact",
+        "compose.numpydoc.expanded",
+        "parse_from_object",
+        "combine_docstrings",
+    }
+    assert len(results["benchmarks"]) == 4 + 1 + 4 * 3 + 2
+    for result in results["benchmarks"].values():
+        assert result["items"] > 0
+        assert result["p50_us"] <= result["p90_us"] <= result["p99_us"]
+        assert result["ops_per_s"] > 0
+    assert results["benchmarks"]["parse.auto"]["bytes_per_s"] > 0
+    assert results["benchmarks"]["combine_docstrings"]["bytes_per_s"] is None
+    assert results["memory"]["parse.auto"]["bytes_per_docstring"] > 0
+
+
+def test_compare() -> None:
+    """Test finding the benchmarks that got slower."""
+    baseline = {
+        "benchmarks": {
+            "fast": {"ops_per_s": 100.0},
+            "slow": {"ops_per_s": 100.0},
+            "gone": {"ops_per_s": 100.0},
+        }
+    }
+    current = copy.deepcopy(baseline)
+    del current["benchmarks"]["gone"]
+    current["benchmarks"]["fast"]["ops_per_s"] = 95.0
+    current["benchmarks"]["slow"]["ops_per_s"] = 50.0
+    current["benchmarks"]["new"] = {"ops_per_s": 1.0}
+
+    regressions = compare(baseline, current, threshold=0.1)
+
+    assert [r.name for r in regressions] == ["slow"]
+    assert regressions[0].slowdown == 1.0
+
+
+def test_main(tmp_path: pathlib.Path) -> None:
+    """Test saving the results and comparing them with a baseline."""
+    baseline_path = tmp_path / "baseline.json"
+    assert main(ARGS + ["--select", "parse.", "-o", str(baseline_path)]) == 0
+    baseline = json.loads(baseline_path.read_text())
+    assert "parse.rest" in baseline["benchmarks"]
+    assert "compose.rest.compact" not in baseline["benchmarks"]
+
+    for result in baseline["benchmarks"].values():
+        result["ops_per_s"] *= 1000
+    baseline_path.write_text(json.dumps(baseline))
+    output_path = tmp_path / "current.json"
+    assert (
+        main(
+            ARGS
+            + ["-k", "parse.rest", "-b", str(baseline_path)]
+            + ["-o", str(output_path)]
+        )
+        == 1
+    )
+    assert list(json.loads(output_path.read_text())["benchmarks"]) == [
+        "parse.rest"
+    ]
@@ -0,0 +1,316 @@
+"""Tests for caching of parsed docstrings."""
+
+import multiprocessing
+import pathlib
+import subprocess
+import sys
+import typing as T
+from unittest.mock import patch
+
+import pytest
+from docstring_parser import rest
+from docstring_parser.cache import (
+    BaseParseCache,
+    CacheInfo,
+    ParseCache,
+    SqliteParseCache,
+)
+from docstring_parser.common import DocstringStyle
+from docstring_parser.parser import (
+    get_parse_cache,
+    parse,
+    parse_from_object,
+    set_parse_cache,
+)
+
+SOURCE = """
+Short description
+
+:param int spam: spam desc
+:raises ValueError: exc desc
+"""
+
+
+@pytest.fixture(name="cache")
+def fixture_cache() -> T.Iterator[ParseCache]:
+    """Enable caching for the duration of a test."""
+    cache = ParseCache(maxsize=2)
+    set_parse_cache(cache)
+    yield cache
+    set_parse_cache(None)
+
+
+def test_cache_disabled_by_default() -> None:
+    """Test that parsing doesn't memoize anything unless asked to."""
+    assert get_parse_cache() is None
+
+
+def test_cache_hit(cache: ParseCache) -> None:
+    """Test that repeated parses are served from the cache."""
+    assert get_parse_cache() is cache
+
+    with patch.object(rest, "parse", wraps=rest.parse) as rest_parse:
+        docstring1 = parse(SOURCE, DocstringStyle.REST)
+        docstring2 = parse(SOURCE, DocstringStyle.REST)
+
+    rest_parse.assert_called_once()
+    assert docstring1 is not docstring2
+    assert docstring2.short_description == "Short description"
+    assert docstring2.params[0].arg_name == "spam"
+    assert docstring2.params[0].type_name == "int"
+    assert docstring2.raises[0].type_name == "ValueError"
+    assert cache.info() == CacheInfo(
+        hits=1, misses=1, evictions=0, maxsize=2, currsize=1
+    )
+
+
+def test_cache_key_includes_style(cache: ParseCache) -> None:
+    """Test that the same text parsed in different styles is cached
+    separately.
+    """
+    docstring1 = parse(SOURCE, DocstringStyle.REST)
+    docstring2 = parse(SOURCE, DocstringStyle.GOOGLE)
+
+    assert docstring1.style == DocstringStyle.REST
+    assert docstring2.style == DocstringStyle.GOOGLE
+    assert cache.info().misses == 2
+
+
+def test_cache_returns_copies(cache: ParseCache) -> None:
+    """Test that modifying parsed docstrings doesn't corrupt the cache."""
+    docstring = parse(SOURCE)
+    docstring.short_description = "Modified"
+    docstring.meta[0].args.append("modified")
+    docstring.meta[0].arg_name = "modified"
+    docstring.meta.pop()
+
+    docstring = parse(SOURCE)
+    docstring.meta.clear()
+
+    docstring = parse(SOURCE)
+    assert docstring.short_description == "Short description"
+    assert len(docstring.meta) == 2
+    assert docstring.meta[0].args == ["param", "int", "spam"]
+    assert docstring.meta[0].arg_name == "spam"
+    assert cache.info().hits == 2
+
+
+def test_cache_eviction(cache: ParseCache) -> None:
+    """Test that the least recently used docstrings are evicted."""
+    parse("First")
+    parse("Second")
+    parse("First")
+    parse("Third")
+
+    assert cache.info() == CacheInfo(
+        hits=1, misses=3, evictions=1, maxsize=2, currsize=2
+    )
+    assert parse("First").short_description == "First"
+    assert cache.info().hits == 2
+    assert parse("Second").short_description == "Second"
+    assert cache.info().misses == 4
+
+
+def test_cache_clear(cache: ParseCache) -> None:
+    """Test clearing the cache."""
+    parse("First")
+    parse("First")
+    cache.clear()
+
+    assert cache.info() == CacheInfo(
+        hits=0, misses=0, evictions=0, maxsize=2, currsize=0
+    )
+
+
+def test_cache_parse_from_object(cache: ParseCache) -> None:
+    """Test that attribute docstrings don't leak into the cache."""
+
+    class WithAttributes:
+        """Short description"""
+
+        attr_one: str
+        """Description for attr_one"""
+
+    assert len(parse_from_object(WithAttributes).params) == 1
+    assert len(parse_from_object(WithAttributes).params) == 1
+    assert not parse("Short description").params
+    assert cache.info().hits == 2
+
+
+def test_cache_invalid_size() -> None:
+    """Test that the cache refuses to be useless."""
+    with pytest.raises(ValueError):
+        ParseCache(maxsize=0)
+
+
+def test_cache_interface() -> None:
+    """Test that the caches must implement the whole interface."""
+
+    class IncompleteCache(BaseParseCache):
+        """Cache that never stores anything."""
+
+        def get(self, key):
+            return None
+
+        def put(self, key, docstring):
+            pass
+
+    with pytest.raises(TypeError):
+        IncompleteCache()  # pylint: disable=abstract-class-instantiated
+
+
+def test_cache_lazy(cache: ParseCache) -> None:
+    """Test that deferred parses are served from the cache, but not stored
+    in it.
+    """
+    docstring = parse(SOURCE, DocstringStyle.REST, lazy=True)
+    assert docstring.is_meta_deferred
+    assert cache.info().currsize == 0
+
+    parse(SOURCE, DocstringStyle.REST)
+    docstring = parse(SOURCE, DocstringStyle.REST, lazy=True)
+    assert not docstring.is_meta_deferred
+    assert docstring.params[0].arg_name == "spam"
+    assert cache.info() == CacheInfo(
+        hits=1, misses=2, evictions=0, maxsize=2, currsize=1
+    )
+
+
+def _fill_sqlite_cache(path: str, start: int) -> None:
+    cache = SqliteParseCache(path)
+    for i in range(start, start + 20):
+        cache.put((f"text {i}", DocstringStyle.REST), parse(f"text {i}"))
+    cache.close()
+
+
+def test_sqlite_cache_round_trip(tmp_path: pathlib.Path) -> None:
+    """Test that parsed docstrings survive being stored in the database and
+    reopening it.
+    """
+    path = tmp_path / "cache.db"
+    cache = SqliteParseCache(path)
+    set_parse_cache(cache)
+    try:
+        docstring = parse(SOURCE, DocstringStyle.REST)
+        assert parse(SOURCE, DocstringStyle.GOOGLE).params == []
+    finally:
+        set_parse_cache(None)
+    assert cache.info() == CacheInfo(
+        hits=0, misses=2, evictions=0, maxsize=1_000_000, currsize=2
+    )
+    cache.close()
+
+    cache = SqliteParseCache(path)
+    cached = cache.get((SOURCE, DocstringStyle.REST, "raise"))
+    assert cached is not None
+    assert cached.to_dict() == docstring.to_dict()
+    assert cached.params[0].type_name == "int"
+    assert cache.get((SOURCE, DocstringStyle.NUMPYDOC)) is None
+    assert cache.info()[:2] == (1, 1)
+
+    cache.clear()
+    assert cache.get((SOURCE, DocstringStyle.REST)) is None
+    assert cache.info().currsize == 0
+
+
+def test_sqlite_cache_version(tmp_path: pathlib.Path) -> None:
+    """Test that the entries stored by other library versions are dropped."""
+    path = tmp_path / "cache.db"
+    key = (SOURCE, DocstringStyle.REST)
+    SqliteParseCache(path).put(key, parse(SOURCE))
+    assert SqliteParseCache(path).get(key) is not None
+
+    with patch.object(SqliteParseCache, "SCHEMA_VERSION", -1):
+        cache = SqliteParseCache(path)
+        assert cache.info().currsize == 0
+        assert cache.get(key) is None
+
+
+def test_sqlite_cache_pruning(tmp_path: pathlib.Path) -> None:
+    """Test that the least recently used entries are pruned."""
+    cache = SqliteParseCache(tmp_path / "cache.db", maxsize=10)
+    for i in range(10):
+        cache.put((f"text {i}", DocstringStyle.REST), parse(f"text {i}"))
+    assert cache.get(("text 0", DocstringStyle.REST)) is not None
+
+    cache.put(("text 10", DocstringStyle.REST), parse("text 10"))
+
+    info = cache.info()
+    assert info.currsize == 9
+    assert info.evictions == 2
+    assert cache.get(("text 0", DocstringStyle.REST)) is not None
+    assert cache.get(("text 1", DocstringStyle.REST)) is None
+    assert cache.get(("text 2", DocstringStyle.REST)) is None
+    assert cache.get(("text 10", DocstringStyle.REST)) is not None
+
+
+def test_sqlite_cache_shared_size(tmp_path: pathlib.Path) -> None:
+    """Test that the size counts the entries of every instance once."""
+    path = tmp_path / "cache.db"
+    caches = [SqliteParseCache(path, maxsize=10) for _ in range(2)]
+    for _ in range(10):
+        for cache in caches:
+            cache.put(("text 0", DocstringStyle.REST), parse("text 0"))
+    assert caches[0].info().currsize == 1
+    assert caches[0].info().evictions == 0
+
+    for i in range(11):
+        caches[i % 2].put(
+            (f"text {i}", DocstringStyle.REST), parse(f"text {i}")
+        )
+    assert caches[0].info().currsize == 9
+    assert caches[0].info().evictions == 2
+    assert caches[1].info().evictions == 0
+
+
+def test_sqlite_cache_processes(tmp_path: pathlib.Path) -> None:
+    """Test that many processes can share the database."""
+    path = str(tmp_path / "cache.db")
+    SqliteParseCache(path).close()
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=_fill_sqlite_cache, args=(path, start))
+        for start in (0, 10, 20)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+    cache = SqliteParseCache(path)
+    assert cache.info().currsize == 40
+    assert cache.get(("text 35", DocstringStyle.REST)).short_description == (
+        "text 35"
+    )
+
+
+def test_sqlite_cache_invalid_size(tmp_path: pathlib.Path) -> None:
+    """Test that the database must be able to hold some docstrings."""
+    with pytest.raises(ValueError):
+        SqliteParseCache(tmp_path / "cache.db", maxsize=0)
+
+
+def test_lazy_imports() -> None:
+    """Test that importing the package doesn't import the modules used only
+    by the persistent cache and the process pools.
+    """
+    modules = [
+        "sqlite3",
+        "hashlib",
+        "importlib.metadata",
+        "json",
+        "multiprocessing",
+        "concurrent.futures.process",
+    ]
+    code = (
+        "import sys, docstring_parser; "
+        f"print([m for m in {modules!r} if m in sys.modules])"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    assert output == "[]\n"
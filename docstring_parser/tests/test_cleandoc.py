@@ -0,0 +1,70 @@
+"""Tests for the equivalence of the fast cleandoc with inspect.cleandoc."""
+
+import inspect
+import random
+
+import pytest
+from docstring_parser.benchmarks.corpus import (
+    stdlib_docstrings,
+    synthetic_docstrings,
+)
+from docstring_parser.common import DocstringStyle, _cleandoc
+
+# Characters that cleandoc treats specially, along with some plain text.
+ALPHABET = [" ", "  ", "\t", "\n", "\n", "\r", "\f", "\v", "\x1c", "\xa0"]
+ALPHABET += [" ", " ", "x", "yz", ":"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        " ",
+        "\n",
+        "\n\n\n",
+        "Short",
+        "   Short   ",
+        "Short\n",
+        "\n  Short\n  ",
+        "Short\n    Long\n      indented\n    end",
+        "Short\n\n    Long\n\n\n",
+        "    Short\n  Long\n    more",
+        "Short\n\tTabbed\n\t  more",
+        "Short\n  \t mixed\n    spaces",
+        "\n\n    Short\n\n    Long\n    ",
+        "Short\n    \n        \n    Long",
+        "Short\nLong\n  indented",
+        "Short\n   \r\n   Long",
+        "Short\n \f Long\n  more",
+        "Short\n\xa0\xa0Long\n\xa0\xa0more",
+        "  \nShort",
+        "a\n\n\n  b\n  c\n\n\n",
+    ],
+)
+def test_cleandoc(text: str) -> None:
+    """Test that cleaning docstrings matches the standard library."""
+    assert _cleandoc(text) == inspect.cleandoc(text)
+
+
+def test_cleandoc_random() -> None:
+    """Test that cleaning random docstrings matches the standard library."""
+    rng = random.Random(0)
+    for _ in range(5000):
+        text = "".join(rng.choices(ALPHABET, k=rng.randrange(30)))
+        assert _cleandoc(text) == inspect.cleandoc(text), repr(text)
+
+
+def test_cleandoc_corpus() -> None:
+    """Test that cleaning real and synthetic docstrings matches the standard
+    library.
+    """
+    texts = stdlib_docstrings()
+    for style in DocstringStyle:
+        if style != DocstringStyle.AUTO:
+            texts += synthetic_docstrings(style)
+    for text in texts:
+        assert _cleandoc(text) == inspect.cleandoc(text)
+        # As found within the parsed docstrings, after the first line.
+        lines = text.split("\n", 1)
+        if len(lines) > 1:
+            assert _cleandoc(lines[1]) == inspect.cleandoc(lines[1])
@@ -0,0 +1,159 @@
+"""Tests for the command line interface."""
+
+import json
+import pathlib
+import typing as T
+
+import pytest
+from docstring_parser.__main__ import find_sources, main
+
+
+@pytest.fixture(name="package")
+def fixture_package(tmp_path: pathlib.Path) -> pathlib.Path:
+    """Write a package with a few modules."""
+    package = tmp_path / "cli_package"
+    (package / "sub").mkdir(parents=True)
+    (package / "__init__.py").write_text('"""Package docstring."""\n')
+    (package / "sub" / "__init__.py").write_text("")
+    (package / "sub" / "module.py").write_text(
+        '"""Module docstring."""\n'
+        "\n"
+        "class Class:\n"
+        '    """Class docstring.\n'
+        "\n"
+        "    :param attr: attribute\n"
+        '    """\n'
+        "\n"
+        "    def method(self):\n"
+        '        """Method docstring."""\n'
+    )
+    (package / "other.py").write_text("def function():\n    pass\n")
+    return package
+
+
+def _run(
+    capsys: pytest.CaptureFixture, args: T.List[str], code: int = 0
+) -> T.List[T.Dict[str, T.Any]]:
+    assert main(args) == code
+    out = capsys.readouterr().out
+    if "--format=json" in args:
+        return json.loads(out)
+    return [json.loads(line) for line in out.splitlines()]
+
+
+def test_find_sources(
+    package: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test finding the source files by path and by module name."""
+    expected = [
+        (package / "__init__.py", "cli_package"),
+        (package / "other.py", "cli_package.other"),
+        (package / "sub" / "__init__.py", "cli_package.sub"),
+        (package / "sub" / "module.py", "cli_package.sub.module"),
+    ]
+    assert find_sources(str(package)) == expected
+
+    # Hidden directories, virtualenvs and installed packages are skipped.
+    for directory in (
+        package / ".git",
+        package / ".venv" / "lib",
+        package / "env",
+        package / "sub" / "site-packages" / "dependency",
+        package / "__pycache__",
+    ):
+        directory.mkdir(parents=True)
+        (directory / "skipped.py").write_text("")
+    (package / "env" / "pyvenv.cfg").write_text("")
+    assert find_sources(str(package)) == expected
+
+    monkeypatch.syspath_prepend(str(package.parent))
+    assert find_sources("cli_package") == expected
+    assert find_sources("cli_package.sub.module") == expected[-1:]
+    assert find_sources(str(package / "other.py")) == [
+        (package / "other.py", "other")
+    ]
+    with pytest.raises(ValueError):
+        find_sources("cli_package.missing")
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_main(
+    capsys: pytest.CaptureFixture, package: pathlib.Path, jobs: str
+) -> None:
+    """Test printing the docstrings as JSON lines."""
+    records = _run(capsys, [str(package), "--jobs", jobs, "--style", "rest"])
+
+    assert [
+        (record["module"], record["qualname"], record["kind"])
+        for record in records
+    ] == [
+        ("cli_package", "", "module"),
+        ("cli_package.other", "", "module"),
+        ("cli_package.other", "function", "function"),
+        ("cli_package.sub", "", "module"),
+        ("cli_package.sub.module", "", "module"),
+        ("cli_package.sub.module", "Class", "class"),
+        ("cli_package.sub.module", "Class.method", "method"),
+    ]
+    docstring = records[5]["docstring"]
+    assert docstring["style"] == "REST"
+    assert docstring["meta"][0]["kind"] == "param"
+    assert docstring["short_description"] == "Class docstring."
+    assert docstring["meta"][0]["arg_name"] == "attr"
+    assert docstring["meta"][0]["description"] == "attribute"
+
+
+def test_main_json_unordered(
+    capsys: pytest.CaptureFixture, package: pathlib.Path
+) -> None:
+    """Test printing the docstrings as a JSON array, in any order."""
+    records = _run(
+        capsys, [str(package), "-j", "2", "--unordered", "--format=json"]
+    )
+    ordered = _run(capsys, [str(package), "-j", "1"])
+
+    assert sorted(map(json.dumps, records)) == sorted(map(json.dumps, ordered))
+
+
+def test_main_errors(
+    capsys: pytest.CaptureFixture, package: pathlib.Path
+) -> None:
+    """Test reporting files that can't be parsed."""
+    (package / "broken.py").write_text("def function(:\n")
+
+    records = _run(capsys, [str(package), "-j", "1"], code=1)
+
+    assert records[1]["module"] == "cli_package.broken"
+    assert records[1]["error"].startswith("SyntaxError: ")
+    assert len(records) == 8
+    assert main(["cli_package.missing"]) == 2
+
+
+def test_main_malformed_docstring(
+    capsys: pytest.CaptureFixture, tmp_path: pathlib.Path
+) -> None:
+    """Test that malformed docstrings don't prevent printing the others."""
+    path = tmp_path / "malformed.py"
+    path.write_text(
+        "def good(x):\n"
+        '    """Good.\n'
+        "\n"
+        "    Args:\n"
+        "        x (int): desc\n"
+        '    """\n'
+        "\n"
+        "def bad(x):\n"
+        '    """Bad.\n'
+        "\n"
+        "    Args:\n"
+        "        x (int) missing colon\n"
+        '    """\n'
+    )
+
+    records = _run(capsys, [str(path), "-s", "google", "-j", "1"])
+
+    assert [record["qualname"] for record in records] == ["", "good", "bad"]
+    assert not records[1]["docstring"]["diagnostics"]
+    assert records[1]["docstring"]["meta"][0]["arg_name"] == "x"
+    assert records[2]["docstring"]["short_description"] == "Bad."
+    assert records[2]["docstring"]["diagnostics"]
@@ -0,0 +1,181 @@
+"""Tests for the common docstring representation."""
+
+import copy
+import pickle
+
+import pytest
+from docstring_parser.common import (
+    Docstring,
+    DocstringDeprecated,
+    DocstringExample,
+    DocstringMeta,
+    DocstringParam,
+    DocstringRaises,
+    DocstringReturns,
+    DocstringStyle,
+)
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        Docstring(),
+        DocstringMeta(["meta"], "desc"),
+        DocstringParam(["param", "x"], "desc", "x", "int", False, "1"),
+        DocstringReturns(["returns"], "desc", "int", False, "ret"),
+        DocstringRaises(["raises"], "desc", "ValueError"),
+        DocstringDeprecated(["deprecation"], "desc", "1.0"),
+        DocstringExample(["examples"], ">>> x", "desc"),
+    ],
+)
+def test_slots(obj: object) -> None:
+    """Test that the representation doesn't carry per-instance dicts."""
+    assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        obj.unknown_attribute = 1  # type: ignore
+
+    for clone in (copy.copy(obj), pickle.loads(pickle.dumps(obj))):
+        for cls in type(obj).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                assert getattr(clone, name) == getattr(obj, name)
+
+
+def test_subclass() -> None:
+    """Test that the representation can be subclassed."""
+
+    class CustomParam(DocstringParam):
+        """A parameter with extra information."""
+
+        def __init__(self, *args, unit: str) -> None:
+            super().__init__(*args)
+            self.unit = unit
+
+    param = CustomParam(
+        ["param", "x"], "desc", "x", "float", False, None, unit="m"
+    )
+    docstring = Docstring(style=DocstringStyle.REST)
+    docstring.meta.append(param)
+
+    assert docstring.params == [param]
+    assert docstring.params[0].arg_name == "x"
+    assert docstring.params[0].unit == "m"
+
+
+def _make_docstring() -> Docstring:
+    docstring = Docstring(style=DocstringStyle.REST)
+    docstring.meta = [
+        DocstringParam(["param", "x"], "desc x", "x", "int", False, None),
+        DocstringRaises(["raises"], "desc", "ValueError"),
+        DocstringParam(["param", "y"], "desc y", "y", None, None, None),
+        DocstringReturns(["returns"], "desc", "int", False),
+        DocstringParam(["param", "x"], "again x", "x", None, None, None),
+    ]
+    return docstring
+
+
+def test_index() -> None:
+    """Test looking up meta information by kind and name."""
+    docstring = _make_docstring()
+
+    assert [p.description for p in docstring.params] == [
+        "desc x",
+        "desc y",
+        "again x",
+    ]
+    assert docstring.raises == [docstring.meta[1]]
+    assert docstring.returns is docstring.meta[3]
+    assert docstring.many_returns == [docstring.meta[3]]
+    assert docstring.deprecation is None
+    assert not docstring.examples
+    assert docstring.param("x") is docstring.meta[0]
+    assert docstring.param("y") is docstring.meta[2]
+    assert docstring.param("z") is None
+    assert list(docstring.params_by_name) == ["x", "y"]
+    with pytest.raises(TypeError):
+        docstring.params_by_name["z"] = docstring.meta[0]  # type: ignore
+
+
+def test_index_returns_copies() -> None:
+    """Test that modifying the returned lists doesn't affect the index."""
+    docstring = _make_docstring()
+
+    docstring.params.clear()
+    docstring.raises.append(DocstringRaises(["raises"], "desc", "OSError"))
+
+    assert len(docstring.params) == 3
+    assert len(docstring.raises) == 1
+
+
+@pytest.mark.parametrize(
+    "mutate, expected",
+    [
+        (lambda meta: meta.pop(0), ["y", "x"]),
+        (lambda meta: meta.remove(meta[2]), ["x", "x"]),
+        (lambda meta: meta.clear(), []),
+        (lambda meta: meta.reverse(), ["x", "y", "x"]),
+        (lambda meta: meta.sort(key=lambda m: m.args), ["x", "x", "y"]),
+        (lambda meta: meta.__delitem__(slice(0, 3)), ["x"]),
+        (lambda meta: meta.__setitem__(0, meta[1]), ["y", "x"]),
+        (lambda meta: meta.__imul__(2), ["x", "y", "x"] * 2),
+        (
+            lambda meta: meta.append(
+                DocstringParam(["param", "z"], None, "z", None, None, None)
+            ),
+            ["x", "y", "x", "z"],
+        ),
+        (
+            lambda meta: meta.insert(
+                0, DocstringParam(["param", "z"], None, "z", None, None, None)
+            ),
+            ["z", "x", "y", "x"],
+        ),
+        (
+            lambda meta: meta.extend(
+                [DocstringParam(["param", "z"], None, "z", None, None, None)]
+            ),
+            ["x", "y", "x", "z"],
+        ),
+    ],
+)
+def test_index_follows_changes(mutate, expected) -> None:
+    """Test that the index stays correct when meta is modified."""
+    docstring = _make_docstring()
+    assert docstring.params
+
+    mutate(docstring.meta)
+
+    names = [p.arg_name for p in docstring.params]
+    assert names == expected
+    assert list(docstring.params_by_name) == list(dict.fromkeys(names))
+    assert docstring.param("z") is (
+        next((p for p in docstring.params if p.arg_name == "z"), None)
+    )
+
+
+def test_index_after_assignment() -> None:
+    """Test that the index follows a newly assigned meta list."""
+    docstring = _make_docstring()
+    assert docstring.param("x")
+
+    docstring.meta = docstring.meta[3:]
+    docstring.meta += [DocstringRaises(["raises"], "desc", "OSError")]
+
+    assert docstring.param("x") is docstring.meta[1]
+    assert docstring.param("y") is None
+    assert [r.type_name for r in docstring.raises] == ["OSError"]
+
+
+@pytest.mark.parametrize(
+    "clone",
+    [copy.copy, copy.deepcopy, lambda d: pickle.loads(pickle.dumps(d))],
+)
+def test_index_clone(clone) -> None:
+    """Test copying and pickling docstrings."""
+    docstring = _make_docstring()
+    assert docstring.param("x")
+
+    docstring = clone(docstring)
+    docstring.meta.pop(0)
+
+    assert docstring.param("x") is docstring.meta[3]
+    assert [p.arg_name for p in docstring.params] == ["y", "x"]
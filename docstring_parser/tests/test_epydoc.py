@@ -480,6 +480,59 @@ def test_broken_meta() -> None:
     parse("@sthstrange: desc")
 
 
+def test_combined_meta() -> None:
+    """Test parsing params and return values described by several fields."""
+    docstring = parse(
+        """
+        Short description
+
+        @type a: int?
+        @raise ValueError: if a is negative
+        @param a: description a, defaults to 1
+        @rtype: str
+        @param b: description b
+        @foo bar baz: other meta
+        @type b: float
+        @return: the result
+        @type a: bool?
+        """
+    )
+    assert [meta.args for meta in docstring.meta] == [
+        ["type", "a"],
+        ["raise", "ValueError"],
+        ["rtype"],
+        ["param", "b"],
+        ["foo", "bar", "baz"],
+    ]
+    assert docstring.params[0].description == "description a, defaults to 1"
+    assert docstring.params[0].type_name == "bool"
+    assert docstring.params[0].is_optional
+    # The default comes from the first field describing the param.
+    assert docstring.params[0].default is None
+    assert docstring.params[1].description == "description b"
+    assert docstring.params[1].type_name == "float"
+    assert not docstring.params[1].is_optional
+    assert docstring.returns is not None
+    assert docstring.returns.description == "the result"
+    assert docstring.returns.type_name == "str"
+    assert not docstring.returns.is_generator
+    assert docstring.raises[0].type_name == "ValueError"
+
+
+def test_generator_conflict() -> None:
+    """Test parsing return values and yields at once."""
+    source = "@return: result\n@ytype: int\n@foo"
+    with pytest.raises(ParseError, match="near"):
+        parse(source)
+    docstring = parse(source, errors="collect")
+    assert docstring.diagnostics == [
+        'Error parsing meta information near "@foo".',
+        'Error parsing meta information for "return".',
+    ]
+    assert docstring.returns.description == "result"
+    assert docstring.returns.type_name == "int"
+
+
 @pytest.mark.parametrize(
     "source, expected",
     [
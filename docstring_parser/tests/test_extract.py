@@ -0,0 +1,203 @@
+"""Tests for extraction of docstrings from source code."""
+
+import importlib.util
+import pathlib
+import sys
+import typing as T
+
+import pytest
+from docstring_parser.common import DocstringStyle
+from docstring_parser.extract import extract_from_source
+from docstring_parser.parser import parse_from_object
+
+SOURCE = '''\
+"""Short description of the module.
+
+:param existing: already documented
+"""
+
+import sys
+
+existing: int = 1
+"""Description for existing"""
+
+module_attr: int = 1
+"""Description for module_attr"""
+
+
+class First:
+    """Short description of First."""
+
+    attr_one: str
+    """Description for attr_one"""
+
+    def method(self, param: int) -> None:
+        """Short description of method.
+
+        :param param: description of param
+        """
+
+        def local():
+            """Short description of local."""
+
+            class Local:
+                attr_two = 2
+                """Description for attr_two"""
+
+            return Local
+
+        return local
+
+    class Nested:
+        attr_three = "3"
+        """Description for attr_three"""
+
+    if sys.version_info >= (3,):
+
+        async def conditional(self):
+            pass
+
+
+def function():
+    """Short description of function."""
+'''
+
+
+def _summary(
+    qualname: str, kind: str, docstring: T.Any
+) -> T.Tuple[T.Any, ...]:
+    return (
+        qualname,
+        kind,
+        docstring.short_description,
+        [(p.arg_name, p.description) for p in docstring.params],
+    )
+
+
+def test_extract_from_source() -> None:
+    """Test extracting all docstrings of a module."""
+    assert [_summary(*item) for item in extract_from_source(SOURCE)] == [
+        (
+            "",
+            "module",
+            "Short description of the module.",
+            [
+                ("existing", "already documented"),
+                ("module_attr", "Description for module_attr"),
+                ("attr_one", "Description for attr_one"),
+                ("attr_three", "Description for attr_three"),
+            ],
+        ),
+        ("existing", "attribute", "Description for existing", []),
+        ("module_attr", "attribute", "Description for module_attr", []),
+        (
+            "First",
+            "class",
+            "Short description of First.",
+            [
+                ("attr_one", "Description for attr_one"),
+                ("attr_three", "Description for attr_three"),
+            ],
+        ),
+        ("First.attr_one", "attribute", "Description for attr_one", []),
+        (
+            "First.method",
+            "method",
+            "Short description of method.",
+            [("param", "description of param")],
+        ),
+        (
+            "First.method.<locals>.local",
+            "function",
+            "Short description of local.",
+            [],
+        ),
+        (
+            "First.method.<locals>.local.<locals>.Local",
+            "class",
+            None,
+            [("attr_two", "Description for attr_two")],
+        ),
+        (
+            "First.method.<locals>.local.<locals>.Local.attr_two",
+            "attribute",
+            "Description for attr_two",
+            [],
+        ),
+        (
+            "First.Nested",
+            "class",
+            None,
+            [("attr_three", "Description for attr_three")],
+        ),
+        (
+            "First.Nested.attr_three",
+            "attribute",
+            "Description for attr_three",
+            [],
+        ),
+        ("First.conditional", "method", None, []),
+        ("function", "function", "Short description of function.", []),
+    ]
+
+
+def test_extract_from_path(tmp_path: pathlib.Path) -> None:
+    """Test that the extracted docstrings match the imported objects."""
+    path = tmp_path / "extract_module.py"
+    path.write_text(SOURCE)
+    spec = importlib.util.spec_from_file_location("extract_module", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["extract_module"] = module
+    try:
+        spec.loader.exec_module(module)
+        objects = {
+            "": module,
+            "First": module.First,
+            "First.method": module.First.method,
+            "First.method.<locals>.local": module.First.method(None, 1),
+            "First.method.<locals>.local.<locals>.Local": (
+                module.First.method(None, 1)()
+            ),
+            "First.Nested": module.First.Nested,
+            "First.conditional": module.First.conditional,
+            "function": module.function,
+        }
+
+        items = list(extract_from_source(path, style=DocstringStyle.REST))
+        for qualname, kind, docstring in items:
+            if kind != "attribute":
+                assert _summary(qualname, kind, docstring) == _summary(
+                    qualname, kind, parse_from_object(objects[qualname])
+                )
+    finally:
+        del sys.modules["extract_module"]
+
+    assert len(items) == 13
+    assert {item.docstring.style for item in items} == {DocstringStyle.REST}
+
+
+def test_extract_from_invalid_source() -> None:
+    """Test extracting docstrings from invalid source code."""
+    with pytest.raises(SyntaxError):
+        list(extract_from_source("def function(:\n    pass"))
+
+
+def test_extract_from_path_string(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test extracting docstrings from paths given as strings."""
+    path = tmp_path / "extract_module.py"
+    path.write_text(SOURCE)
+    monkeypatch.chdir(tmp_path)
+    expected = [_summary(*item) for item in extract_from_source(SOURCE)]
+
+    for source in (str(path), "extract_module.py"):
+        assert [
+            _summary(*item) for item in extract_from_source(source)
+        ] == expected
+    with pytest.raises(FileNotFoundError):
+        list(extract_from_source("missing.py"))
+    # Single lines of source code are still parsed as such.
+    assert [_summary(*item) for item in extract_from_source('"""Doc."""')] == [
+        ("", "module", "Doc.", [])
+    ]
@@ -9,6 +9,7 @@ from docstring_parser.google import (
     Section,
     SectionType,
     compose,
+    get_parser,
     parse,
 )
 
@@ -100,6 +101,115 @@ def test_google_parser_custom_sections() -> None:
     assert docstring.meta[5].description == "Many examples\nMore examples"
 
 
+def test_google_parser_shared() -> None:
+    """Test getting shared, frozen GoogleParser instances."""
+    sections = [Section("Note", "note", SectionType.SINGULAR)]
+    parser = get_parser()
+    custom_parser = get_parser(sections, title_colon=False)
+
+    assert get_parser() is parser
+    assert get_parser(tuple(sections), title_colon=False) is custom_parser
+    assert get_parser(sections) is not custom_parser
+    assert parser.frozen
+    assert custom_parser.frozen
+    assert list(custom_parser.sections) == ["Note"]
+
+    with pytest.raises(TypeError):
+        parser.add_section(Section("Note", "note", SectionType.SINGULAR))
+    with pytest.raises(TypeError):
+        parser.sections["Note"] = sections[0]  # type: ignore
+    assert "Note" not in parser.sections
+
+    docstring = custom_parser.parse(
+        """
+        short description
+
+        Note
+            a note
+        """
+    )
+    assert docstring.meta[0].args == ["note"]
+    assert docstring.meta[0].description == "a note"
+
+
+def test_google_parser_regex_titles() -> None:
+    """Test parsing sections whose titles are regexes."""
+    parser = GoogleParser(
+        [
+            Section("Args", "param", SectionType.MULTIPLE),
+            Section("See also.", "see", SectionType.SINGULAR),
+        ]
+    )
+    docstring = parser.parse(
+        """
+        short description
+
+        Args:
+            a: first
+            b: second
+
+        See also.:
+            something else
+        """
+    )
+    assert docstring.short_description == "short description"
+    assert docstring.long_description is None
+    assert [meta.args for meta in docstring.meta] == [
+        ["param", "a"],
+        ["param", "b"],
+        ["see"],
+    ]
+    assert docstring.meta[2].description == "something else"
+
+
+@pytest.mark.parametrize("title_colon", [True, False])
+def test_google_parser_plain_titles(title_colon: bool) -> None:
+    """Test that looking up plain section titles agrees with matching them
+    as a regex.
+    """
+    sections = [
+        Section("Args", "param", SectionType.MULTIPLE),
+        Section("Returns", "returns", SectionType.SINGULAR_OR_MULTIPLE),
+        Section("Note:", "note", SectionType.SINGULAR),
+        Section("", "empty", SectionType.SINGULAR),
+        Section(" Indented", "indented", SectionType.SINGULAR),
+    ]
+    colon = ":" if title_colon else ""
+    text = f"""
+        short description
+
+        Args{colon} \t
+            a (int): first
+            b: second
+        Args{colon}
+            c: replaced
+          Returns{colon}
+            not: a title
+        Note:{colon}
+            a note
+        Unknown{colon}
+            unknown
+        {colon}
+            empty title
+         Indented{colon}
+            indented
+        Returns{colon}
+            int: result
+        not a section
+        """
+    plain_parser = GoogleParser(sections, title_colon=title_colon)
+    regex_parser = GoogleParser(
+        sections + [Section("Foo|Bar", "foobar", SectionType.SINGULAR)],
+        title_colon=title_colon,
+    )
+    assert plain_parser._plain_titles  # pylint: disable=protected-access
+    assert not regex_parser._plain_titles  # pylint: disable=protected-access
+
+    docstring = plain_parser.parse(text)
+    assert docstring.meta
+    assert docstring.to_dict() == regex_parser.parse(text).to_dict()
+
+
 def test_google_parser_custom_sections_after() -> None:
     """Test parsing an unknown section with custom GoogleParser configuration
     that was set at a runtime.
@@ -12,6 +12,7 @@ from docstring_parser.numpydoc import (
     NumpydocParser,
     Section,
     compose,
+    get_parser,
     parse,
 )
 
@@ -1241,3 +1242,105 @@ def test_compose(source: str, expected: str, expected_num_metas: int) -> None:
     assert len(docstring.meta) == expected_num_metas
 
     assert compose(docstring) == expected
+
+
+def test_numpydoc_parser_shared() -> None:
+    """Test getting shared, frozen NumpydocParser instances."""
+    sections = DEFAULT_SECTIONS + [Section("Meta", "meta")]
+    parser = get_parser()
+    custom_parser = get_parser(sections)
+
+    assert get_parser() is parser
+    assert get_parser(tuple(sections)) is custom_parser
+    assert parser.frozen
+    assert custom_parser.frozen
+    assert "Meta" not in parser.sections
+    assert "Meta" in custom_parser.sections
+
+    with pytest.raises(TypeError):
+        parser.add_section(Section("Meta", "meta"))
+    assert "Meta" not in parser.sections
+
+    source = """
+    Short description
+
+    Meta
+    ----
+    meta desc
+    """
+    assert not parse(source).meta
+    docstring = custom_parser.parse(source)
+    assert docstring.meta[0].args == ["meta"]
+    assert docstring.meta[0].description == "meta desc"
+
+
+def test_regex_titles() -> None:
+    """Test parsing sections whose titles are regexes."""
+    parser = NumpydocParser(DEFAULT_SECTIONS + [Section("e.g.", "example")])
+    docstring = parser.parse(
+        """
+        Short description
+
+        e.g.
+        ----
+        an example
+        """
+    )
+    assert docstring.long_description is None
+    assert len(docstring.meta) == 1
+    assert docstring.meta[0].args == ["example"]
+    assert docstring.meta[0].description == "an example"
+
+
+def test_underlined_titles() -> None:
+    """Test that finding the headers by their underlines agrees with
+    matching them as a regex.
+    """
+    source = """
+    Short description
+    ----------
+    Parameters  \t
+
+    ----------
+
+    x : int
+        description
+    Notes
+    ----
+    Other Notes
+    -----
+    Notes
+    -----
+     Returns
+    -------
+    .. deprecated:: 1.0
+        some version
+    Returns
+    --------
+    See Also
+    --------
+
+
+    Raises
+    ------
+    ValueError
+    """
+    plain_parser = NumpydocParser()
+    regex_parser = NumpydocParser(DEFAULT_SECTIONS + [Section("a|b", "a")])
+    assert plain_parser._plain_titles  # pylint: disable=protected-access
+    assert not regex_parser._plain_titles  # pylint: disable=protected-access
+
+    docstring = plain_parser.parse(source)
+    assert docstring.short_description == "Short description"
+    assert [meta.args for meta in docstring.meta] == [
+        ["param", "x"],
+        ["param", "Notes"],
+        ["param", "----"],
+        ["param", "Other Notes"],
+        ["param", "-----"],
+        ["notes"],
+        ["deprecation"],
+        ["see_also"],
+        ["raises", "ValueError"],
+    ]
+    assert docstring.to_dict() == regex_parser.parse(source).to_dict()
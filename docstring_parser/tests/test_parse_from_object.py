@@ -1,8 +1,18 @@
 """Tests for parse_from_object function and attribute docstrings."""
 
+import ast
+import importlib.util
+import inspect
+import os
+import pathlib
+import sys
+import textwrap
+import typing as T
 from unittest.mock import patch
 
+import pytest
 from docstring_parser import parse_from_object
+from docstring_parser.attrdoc import clear_cache
 
 module_attr: int = 1
 """Description for module_attr"""
@@ -75,9 +85,8 @@ def test_from_class_without_source() -> None:
         attr_one: str
         """Description for attr_one"""
 
-    with patch(
-        "inspect.getsource", side_effect=OSError("could not get source code")
-    ):
+    clear_cache()
+    with patch("linecache.getlines", return_value=[]):
         docstring = parse_from_object(WithoutSource)
 
     assert docstring.short_description == "Short description"
@@ -108,3 +117,137 @@ def test_from_function() -> None:
     assert docstring.params[1].arg_name == "param2"
     assert docstring.params[1].type_name is None
     assert docstring.params[1].description == "Description for param2"
+
+
+@pytest.fixture(name="write_module")
+def fixture_write_module(
+    tmp_path: pathlib.Path,
+) -> T.Iterator[T.Callable[[str], T.Any]]:
+    """Import modules written to a temporary directory."""
+    names = []
+
+    def write_module(source: str) -> T.Any:
+        name = f"attrdoc_module_{len(names)}"
+        path = tmp_path / f"{name}.py"
+        path.write_text(textwrap.dedent(source))
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        names.append(name)
+        spec.loader.exec_module(module)
+        return module
+
+    yield write_module
+    for name in names:
+        del sys.modules[name]
+
+
+def test_source_parsed_once(write_module) -> None:
+    """Test that the source file is parsed only once for all its classes."""
+    module = write_module(
+        """
+        class First:
+            attr_one: int
+            \"\"\"Description for attr_one\"\"\"
+
+        class Second:
+            attr_two: str = "2"
+            \"\"\"Description for attr_two\"\"\"
+
+            class Nested:
+                attr_three = 3
+                \"\"\"Description for attr_three
+                on two lines\"\"\"
+
+        def function():
+            class Local:
+                attr_four = 4
+                \"\"\"Description for attr_four\"\"\"
+
+            return Local
+        """
+    )
+
+    with patch("ast.parse", wraps=ast.parse) as ast_parse:
+        docstrings = [
+            parse_from_object(cls)
+            for cls in (
+                module,
+                module.First,
+                module.Second,
+                module.Second.Nested,
+                module.function(),
+                module.First,
+            )
+        ]
+
+    assert ast_parse.call_count == 5
+    assert [[p.arg_name for p in d.params] for d in docstrings] == [
+        ["attr_one", "attr_two", "attr_three"],
+        ["attr_one"],
+        ["attr_two", "attr_three"],
+        ["attr_three"],
+        ["attr_four"],
+        ["attr_one"],
+    ]
+    assert docstrings[2].params[0].default == "'2'"
+    assert (
+        docstrings[3].params[0].description
+        == "Description for attr_three\n    on two lines"
+    )
+
+
+def test_source_changed(write_module) -> None:
+    """Test that changes of the source file are picked up."""
+    module = write_module(
+        """
+        class First:
+            attr_one: int
+            \"\"\"Description for attr_one\"\"\"
+        """
+    )
+    assert parse_from_object(module.First).params[0].arg_name == "attr_one"
+
+    path = pathlib.Path(module.__file__)
+    source = path.read_text(encoding="utf-8")
+    path.write_text(source.replace("attr_one", "attr_two"), encoding="utf-8")
+    os.utime(path, ns=(0, 0))
+
+    assert parse_from_object(module.First).params[0].arg_name == "attr_two"
+
+
+def test_duplicate_class_names(write_module) -> None:
+    """Test classes that can't be told apart by their qualified names."""
+    module = write_module(
+        """
+        class First:
+            attr_one: int
+            \"\"\"Description for attr_one\"\"\"
+
+        OldFirst = First
+
+        class First:
+            attr_two: int
+            \"\"\"Description for attr_two\"\"\"
+        """
+    )
+
+    with patch("inspect.getsource", wraps=inspect.getsource) as getsource:
+        params = parse_from_object(module.OldFirst).params
+
+    getsource.assert_called_once_with(module.OldFirst)
+    assert len(params) == 1
+
+
+def test_class_defined_elsewhere(write_module) -> None:
+    """Test a class whose definition isn't in its module's source file."""
+    module = write_module(
+        """
+        class First:
+            attr_one: int
+            \"\"\"Description for attr_one\"\"\"
+        """
+    )
+    dynamic = type("Dynamic", (), {"__module__": module.__name__})
+
+    assert not parse_from_object(dynamic).params
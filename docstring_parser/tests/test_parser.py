@@ -1,10 +1,22 @@
 """Tests for generic docstring routines."""
 
+import itertools
+import pickle
+import re
 import typing as T
+from unittest.mock import patch
 
 import pytest
-from docstring_parser.common import DocstringStyle, ParseError
-from docstring_parser.parser import parse
+from docstring_parser import common, epydoc, google, numpydoc, rest
+from docstring_parser.common import (
+    DeadlineExceededError,
+    Docstring,
+    DocstringStyle,
+    InputTooLongError,
+    ParseError,
+    PreparedText,
+)
+from docstring_parser.parser import _detect_styles, parse
 
 
 @pytest.mark.parametrize(
@@ -245,3 +257,546 @@ def test_autodetection_error_detection() -> None:
 
     assert docstring
     assert docstring.style == DocstringStyle.GOOGLE
+
+
+def test_autodetection_field_without_arguments() -> None:
+    """Test autodetection when ReST-style fields have no arguments, after
+    another error.
+    """
+    source = "Short.\n\n:bad\n: : oops"
+
+    with pytest.raises(ParseError):
+        parse(source, DocstringStyle.REST)
+    docstring = parse(source, DocstringStyle.REST, errors="collect")
+    assert docstring.diagnostics == [
+        'Error parsing meta information near ":bad\n".',
+        'Error parsing meta information near ": : oops".',
+    ]
+
+    docstring = parse(source)
+    assert docstring.style == DocstringStyle.GOOGLE
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("Short description", []),
+        (
+            """
+            Short description
+
+            :param spam: spam desc
+            :returns: ret desc
+            """,
+            [DocstringStyle.REST, DocstringStyle.REST],
+        ),
+        (
+            """
+            Short description
+
+            Args:
+                spam: spam desc
+            """,
+            [DocstringStyle.GOOGLE],
+        ),
+        (
+            """
+            Short description
+
+            Parameters
+            ----------
+            spam
+                spam desc
+
+            .. deprecated:: 1.0
+            """,
+            [DocstringStyle.NUMPYDOC, DocstringStyle.NUMPYDOC],
+        ),
+        (
+            """
+            Short description
+
+            @param spam: spam desc
+            """,
+            [DocstringStyle.EPYDOC],
+        ),
+    ],
+)
+def test_detect_styles(source: str, expected: T.List[DocstringStyle]) -> None:
+    """Test scoring the docstring styles."""
+    scores = _detect_styles(source)
+    assert scores == {
+        style: expected.count(style)
+        for style in DocstringStyle
+        if style != DocstringStyle.AUTO
+    }
+
+
+def test_autodetection_skips_unlikely_styles() -> None:
+    """Test that autodetection only runs parsers of the likely styles."""
+    source = """
+    Short description
+
+    Args:
+        spam: spam desc
+    """
+
+    with patch.object(rest, "parse_prepared") as rest_parse:
+        with patch.object(numpydoc, "parse_prepared") as numpydoc_parse:
+            with patch.object(epydoc, "parse_prepared") as epydoc_parse:
+                docstring = parse(source)
+
+    assert docstring.style == DocstringStyle.GOOGLE
+    assert len(docstring.params) == 1
+    rest_parse.assert_not_called()
+    numpydoc_parse.assert_not_called()
+    epydoc_parse.assert_not_called()
+
+
+def test_autodetection_without_hints() -> None:
+    """Test autodetection for a docstring without any meta information."""
+    with patch.object(
+        rest, "parse_prepared", wraps=rest.parse_prepared
+    ) as rest_parse:
+        with patch.object(google, "parse_prepared") as google_parse:
+            docstring = parse("Short description\n\nLong description")
+
+    assert docstring.style == DocstringStyle.REST
+    assert docstring.short_description == "Short description"
+    assert docstring.long_description == "Long description"
+    rest_parse.assert_called_once()
+    google_parse.assert_not_called()
+
+
+def test_autodetection_fallback_after_error() -> None:
+    """Test autodetection falling back to a style without hints when the
+    only likely style fails to parse.
+    """
+    source = """
+    Does something useless
+
+    :param 3 + 3 a: a param
+    """
+
+    docstring = parse(source)
+
+    assert docstring.style == DocstringStyle.GOOGLE
+    assert docstring.short_description == "Does something useless"
+    assert docstring.long_description == ":param 3 + 3 a: a param"
+    assert not docstring.meta
+
+
+@pytest.mark.parametrize(
+    "source, style",
+    [
+        (
+            """
+            Short description
+
+            :param spam: spam desc
+            :raises ValueError: exc desc
+            """,
+            DocstringStyle.REST,
+        ),
+        (
+            """
+            Short description
+
+            Args:
+                spam: spam desc
+
+            Raises:
+                ValueError: exc desc
+            """,
+            DocstringStyle.GOOGLE,
+        ),
+        (
+            """
+            Short description
+
+            Parameters
+            ----------
+            spam
+                spam desc
+
+            Raises
+            ------
+            ValueError
+                exc desc
+            """,
+            DocstringStyle.NUMPYDOC,
+        ),
+        (
+            """
+            Short description
+
+            @param spam: spam desc
+            @raise ValueError: exc desc
+            """,
+            DocstringStyle.EPYDOC,
+        ),
+    ],
+)
+@pytest.mark.parametrize("auto", [True, False])
+def test_lazy(source: str, style: DocstringStyle, auto: bool) -> None:
+    """Test deferring parsing of the meta information."""
+    module = {
+        DocstringStyle.REST: rest,
+        DocstringStyle.GOOGLE: google,
+        DocstringStyle.NUMPYDOC: numpydoc,
+        DocstringStyle.EPYDOC: epydoc,
+    }[style]
+
+    with patch.object(module, "parse", wraps=module.parse) as style_parse:
+        docstring = parse(
+            source, DocstringStyle.AUTO if auto else style, lazy=True
+        )
+    style_parse.assert_called_once()
+
+    assert docstring.style == style
+    assert docstring.short_description == "Short description"
+    # The automatic style detection parses the meta information up front.
+    assert docstring.is_meta_deferred is not auto
+
+    assert docstring.params[0].arg_name == "spam"
+    assert docstring.params[0].description == "spam desc"
+    assert docstring.raises[0].type_name == "ValueError"
+    assert not docstring.is_meta_deferred
+    assert len(docstring.meta) == len(parse(source).meta) == 2
+
+
+def test_lazy_error() -> None:
+    """Test that errors in deferred parsing surface on access."""
+    docstring = parse(
+        """
+        Short description
+
+        :param 3 + 3 a: a param
+        """,
+        DocstringStyle.REST,
+        lazy=True,
+    )
+    assert docstring.style == DocstringStyle.REST
+    assert docstring.short_description == "Short description"
+
+    with pytest.raises(ParseError):
+        assert docstring.params
+    with pytest.raises(ParseError):
+        assert docstring.meta
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        """
+        Short description
+
+        :param 3 + 3 a: a param
+        """,
+        # From difflib.HtmlDiff.__init__.
+        """HtmlDiff instance initializer
+
+        Arguments:
+        tabsize -- tab stop spacing, defaults to 8.
+        wrapcolumn -- column number where lines are broken and wrapped,
+            defaults to None where lines are not wrapped.
+        """,
+        "Short.\n\nArgs:\n    nocolon\nReturns:\n    int: x\n:param a: b",
+    ],
+)
+@pytest.mark.parametrize("errors", ["raise", "collect"])
+def test_lazy_autodetection_fallback(source: str, errors: str) -> None:
+    """Test that lazy autodetection falls back to comparing the results of
+    every style when the meta information is malformed in the hinted style.
+    """
+    docstring = parse(source, lazy=True, errors=errors)
+    expected = parse(source, errors=errors)
+
+    def dump(docstring: Docstring) -> T.List[T.Any]:
+        return [
+            docstring.style,
+            docstring.short_description,
+            docstring.long_description,
+            docstring.blank_after_short_description,
+            docstring.blank_after_long_description,
+            docstring.diagnostics,
+        ]
+
+    # Nothing read before the meta information changes once it's parsed.
+    before = dump(docstring)
+    assert [meta.to_dict() for meta in docstring.meta] == [
+        meta.to_dict() for meta in expected.meta
+    ]
+    assert dump(docstring) == before == dump(expected)
+    assert not expected.diagnostics
+
+
+def test_lazy_assignment() -> None:
+    """Test replacing deferred meta information."""
+    docstring = parse(
+        "Short description\n\n:param 3 + 3 a: a param",
+        DocstringStyle.REST,
+        lazy=True,
+    )
+    docstring.meta = []
+
+    assert not docstring.is_meta_deferred
+    assert not docstring.params
+
+
+def test_lazy_pickle() -> None:
+    """Test that pickling parses the deferred meta information."""
+    docstring = parse(
+        "Short description\n\n:param spam: spam desc",
+        DocstringStyle.REST,
+        lazy=True,
+    )
+    docstring = pickle.loads(pickle.dumps(docstring))
+
+    assert not docstring.is_meta_deferred
+    assert docstring.short_description == "Short description"
+    assert docstring.params[0].arg_name == "spam"
+
+
+@pytest.mark.parametrize(
+    "source, style, expected_meta, expected_diagnostics",
+    [
+        (
+            ":param a b c d: desc\n:raises: desc",
+            DocstringStyle.REST,
+            1,
+            ["Expected one or two arguments for a param keyword."],
+        ),
+        (
+            "Args:\n    x (int) desc\nReturns:\n    desc",
+            DocstringStyle.GOOGLE,
+            1,
+            ["Expected a colon in 'x (int) desc'."],
+        ),
+        (
+            "@param x: desc\n@return: desc\n@yield: desc",
+            DocstringStyle.EPYDOC,
+            2,
+            ['Error parsing meta information for "return".'],
+        ),
+        (
+            "Parameters\n----------\nx : int\n    desc",
+            DocstringStyle.NUMPYDOC,
+            1,
+            [],
+        ),
+    ],
+)
+def test_collect_errors(
+    source: str,
+    style: DocstringStyle,
+    expected_meta: int,
+    expected_diagnostics: T.List[str],
+) -> None:
+    """Test collecting the parse errors instead of raising them."""
+    docstring = parse(source, style, errors="collect")
+    assert docstring.style == style
+    assert len(docstring.meta) == expected_meta
+    assert docstring.diagnostics == expected_diagnostics
+
+    docstring = parse(source, style, lazy=True, errors="collect")
+    assert docstring.diagnostics == []
+    assert len(docstring.meta) == expected_meta
+    assert docstring.diagnostics == expected_diagnostics
+
+    if expected_diagnostics:
+        with pytest.raises(
+            ParseError, match=re.escape(expected_diagnostics[0])
+        ):
+            parse(source, style)
+    else:
+        assert parse(source, style).diagnostics == []
+
+
+def test_collect_errors_autodetection() -> None:
+    """Test that the automatic style detection skips the styles that fail,
+    without raising any errors.
+    """
+    source = "Short description\n\n:param 3 + 3 a: a param"
+    with patch.object(
+        rest, "parse_prepared", wraps=rest.parse_prepared
+    ) as rest_parse:
+        docstring = parse(source)
+
+    assert rest_parse.call_args.kwargs["errors"] == "collect"
+    assert docstring.style == DocstringStyle.GOOGLE
+    assert docstring.diagnostics == []
+    assert parse(source, errors="collect").style == DocstringStyle.GOOGLE
+
+
+def test_unknown_errors_mode() -> None:
+    """Test rejecting unknown modes of handling the errors."""
+    for style in DocstringStyle:
+        with pytest.raises(ValueError):
+            parse("Short description", style, errors="ignore")
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("", set()),
+        ("Short description\n\nLong: description", set()),
+        ("Short description\n\n    :param x: desc", {"rest"}),
+        ("Short description\r:param x: desc", set()),
+        ("@param x: desc\n@type x: int", {"epydoc"}),
+        ("Short description\n\n    Args:\n        x: desc", {"google"}),
+        ("Short description\n\nArgs:  \n\tx: desc", {"google"}),
+        ("Args:\rx: desc", set()),
+        ("Short description\n\nArgs: x", set()),
+        ("Parameters\n----------\nx : int", {"numpydoc"}),
+        (".. deprecated:: 1.0", {"numpydoc"}),
+    ],
+)
+def test_has_meta(source: str, expected: T.Set[str]) -> None:
+    """Test the quick checks for meta information of each style, which must
+    never rule out a style that finds meta information.
+    """
+    for name, module in [
+        ("rest", rest),
+        ("google", google),
+        ("numpydoc", numpydoc),
+        ("epydoc", epydoc),
+    ]:
+        assert module.has_meta(source) == (name in expected), name
+        if module.parse(source, errors="collect").meta:
+            assert module.has_meta(source), name
+
+
+def test_has_meta_custom_parsers() -> None:
+    """Test the quick checks for meta information of custom parsers."""
+    parser = google.GoogleParser(title_colon=False)
+    assert parser.has_meta("Short description\n\nArgs\n    x: desc")
+    assert not google.has_meta("Short description\n\nArgs\n    x: desc")
+
+    class CustomSection(numpydoc.Section):
+        """Section whose header is a line in angle brackets."""
+
+        @property
+        def title_pattern(self) -> str:
+            return rf"^<({self.title})>$"
+
+    parser = numpydoc.NumpydocParser([CustomSection("Notes", "notes")])
+    source = "Short description\n\n<Notes>\nnote"
+    assert parser.has_meta(source)
+    assert parser.parse(source).meta
+
+
+def test_autodetection_cleans_once() -> None:
+    """Test that autodetection prepares the text once for all the styles."""
+    source = """
+    Short description
+
+    :param spam: spam desc
+    @param spam: spam desc
+    """
+
+    wrapped = common._cleandoc  # pylint: disable=protected-access
+    with patch("docstring_parser.common._cleandoc", wraps=wrapped) as cleandoc:
+        docstring = parse(source)
+
+    assert docstring.style == DocstringStyle.REST
+    cleandoc.assert_called_once_with(source)
+
+
+def test_prepared_text() -> None:
+    """Test the text prepared for parsing in any style."""
+    prepared = PreparedText("\n    Short\n\n    Long\n    :param x: desc\n")
+    assert prepared.text == "Short\n\nLong\n:param x: desc"
+
+    for module in (rest, google, numpydoc, epydoc):
+        docstring = module.parse_prepared(prepared)
+        assert docstring.short_description == "Short"
+        assert docstring.blank_after_short_description
+        assert docstring.long_description == (
+            "Long" if module is rest else "Long\n:param x: desc"
+        )
+
+
+@pytest.mark.parametrize("style", list(DocstringStyle))
+def test_max_length(style: DocstringStyle) -> None:
+    """Test parsing texts longer than the limit."""
+    source = "Short description\n\nLong description\n"
+    assert parse(source, style, max_length=len(source)).long_description
+
+    with pytest.raises(InputTooLongError) as exc_info:
+        parse(source, style, max_length=21, errors="collect")
+    message = "Docstring of 36 characters is longer than the limit of 21."
+    assert str(exc_info.value) == message
+
+    docstring = parse(source, style, max_length=21, on_limit="truncate")
+    assert docstring.short_description == "Short description"
+    assert docstring.long_description == "Lo"
+    assert not docstring.meta
+    assert docstring.diagnostics == [message]
+    assert docstring.style != DocstringStyle.AUTO
+
+
+@pytest.mark.parametrize(
+    "source, style",
+    [
+        (":param x: desc\n:param y: desc", DocstringStyle.REST),
+        ("Args:\n    x: desc\n    y: desc", DocstringStyle.GOOGLE),
+        (
+            "Parameters\n----------\nx\n    desc\ny\n    desc",
+            DocstringStyle.NUMPYDOC,
+        ),
+        ("@param x: desc\n@param y: desc", DocstringStyle.EPYDOC),
+        (":param x: desc\n:param y: desc", DocstringStyle.AUTO),
+    ],
+)
+def test_deadline(source: str, style: DocstringStyle) -> None:
+    """Test parsing that takes longer than its deadline."""
+    source = "Short description\n\n" + source
+    assert len(parse(source, style, deadline=60).params) == 2
+
+    # Every reading of the clock is a second later than the previous one.
+    with patch("time.monotonic", side_effect=itertools.count()):
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            parse(source, style, deadline=1.5)
+    message = "Parsing took longer than 1.5 seconds."
+    assert str(exc_info.value) == message
+
+    with patch("time.monotonic", side_effect=itertools.count()):
+        docstring = parse(source, style, deadline=1.5, on_limit="truncate")
+    assert docstring.short_description == "Short description"
+    assert docstring.long_description == source.split("\n\n", 1)[1]
+    assert not docstring.meta
+    assert docstring.diagnostics == [message]
+
+
+@pytest.mark.parametrize("source", ["", None])
+@pytest.mark.parametrize("style", list(DocstringStyle))
+def test_deadline_empty(
+    source: T.Optional[str], style: DocstringStyle
+) -> None:
+    """Test parsing empty texts that take longer than their deadline."""
+    with patch("time.monotonic", side_effect=itertools.count()):
+        docstring = parse(source, style, deadline=0, on_limit="truncate")
+    assert docstring.short_description is None
+    assert docstring.long_description is None
+    assert not docstring.meta
+    assert docstring.style != DocstringStyle.AUTO
+    # Only the automatic style detection gets to check the deadline.
+    assert docstring.diagnostics in (
+        [],
+        ["Parsing took longer than 0 seconds."],
+    )
+
+
+def test_deadline_lazy() -> None:
+    """Test that the deadline doesn't apply after the call."""
+    source = "Short description\n\n:param x: desc"
+    with patch("time.monotonic", side_effect=itertools.count()):
+        docstring = parse(source, DocstringStyle.REST, lazy=True, deadline=1.5)
+        assert docstring.params[0].arg_name == "x"
+
+
+def test_unknown_on_limit_mode() -> None:
+    """Test parsing with an unknown mode of handling the limits."""
+    with pytest.raises(ValueError, match="Unknown on_limit mode"):
+        parse("Short description", on_limit="ignore")
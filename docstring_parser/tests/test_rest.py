@@ -329,6 +329,57 @@ def test_params() -> None:
     assert not docstring.params[0].is_optional
 
 
+@pytest.mark.parametrize(
+    "description, expected",
+    [
+        ("description", None),
+        ("defaults to", None),
+        ("defaults to ", None),
+        ("defaults to 1", "1"),
+        ("defaults to 1...", "1"),
+        ("defaults to .", ""),
+        ("Defaults to 1.", None),
+        ("defaults to 1, or\ndefaults to 2.", "2"),
+        (
+            "defaults to 1 unless\n\nit defaults to ",
+            "1 unless\nit defaults to",
+        ),
+        ("long\n\ndescription, defaults to\n'x'.", None),
+    ],
+)
+def test_param_default(description: str, expected: T.Optional[str]) -> None:
+    """Test finding the default values in the descriptions of params."""
+    docstring = parse(f":param name: {description}")
+    assert docstring.params[0].default == expected
+
+
+def test_multiline_meta() -> None:
+    """Test parsing meta spanning many lines."""
+    docstring = parse(
+        """
+        Short description
+
+        :param a: first line
+            second line: with a colon
+        :not a field: continued
+        :param b:
+            description b
+        :returns:"""
+    )
+    assert [meta.args for meta in docstring.meta] == [
+        ["param", "a"],
+        ["not", "a", "field"],
+        ["param", "b"],
+        ["returns"],
+    ]
+    assert docstring.params[0].description == (
+        "first line\nsecond line: with a colon"
+    )
+    assert docstring.meta[1].description == "continued"
+    assert docstring.params[1].description == "description b"
+    assert docstring.returns.description == ""
+
+
 def test_returns() -> None:
     """Test parsing returns."""
     docstring = parse(
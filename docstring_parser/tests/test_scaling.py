@@ -0,0 +1,123 @@
+"""Tests for the parsing time growing linearly with the size of the input.
+
+The tests compare timings, so they are left out of the default runs and
+only run with ``pytest -m scaling``.
+"""
+
+import functools
+import time
+import typing as T
+
+import pytest
+from docstring_parser.common import DocstringStyle
+from docstring_parser.numpydoc import parse as numpydoc_parse
+from docstring_parser.parser import parse
+
+# How much bigger the large input is than the small one.
+GROWTH = 16
+# Slack for timing noise; quadratic growth would be about GROWTH times worse.
+TOLERANCE = 3
+
+pytestmark = pytest.mark.scaling
+
+
+def _best_time(func: T.Callable[[str], T.Any], text: str) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _assert_linear(
+    func: T.Callable[[str], T.Any],
+    make_text: T.Callable[[int], str],
+    size: int,
+) -> None:
+    small = _best_time(func, make_text(size))
+    large = _best_time(func, make_text(size * GROWTH))
+    assert large < small * GROWTH * TOLERANCE, (small, large)
+
+
+def test_numpydoc_examples() -> None:
+    """Test parsing numpydoc examples sections with many lines."""
+
+    def make_text(size: int) -> str:
+        lines = ["Short description", "", "Examples", "--------"]
+        for i in range(size):
+            lines += [f">>> x = {i}", f">>> x + {i}", str(i * 2), ""]
+        return "\n".join(lines)
+
+    docstring = numpydoc_parse(make_text(3))
+    assert [meta.snippet for meta in docstring.examples] == [
+        ">>> x = 0\n>>> x + 0",
+        ">>> x = 1\n>>> x + 1",
+        ">>> x = 2\n>>> x + 2",
+    ]
+    assert [meta.description for meta in docstring.examples] == [
+        "0\n",
+        "2\n",
+        "4",
+    ]
+    _assert_linear(numpydoc_parse, make_text, 4000)
+
+
+@pytest.mark.parametrize(
+    "style, make_text",
+    [
+        # Types which never get closed, after many parentheses.
+        (
+            DocstringStyle.GOOGLE,
+            lambda size: "Short.\nArgs:\n    a" + "(" * size + ": desc",
+        ),
+        (
+            DocstringStyle.GOOGLE,
+            lambda size: "Short.\nArgs:\n    a" + " (x" * size + ": desc",
+        ),
+        # Long gaps in the names of params and return values.
+        (
+            DocstringStyle.NUMPYDOC,
+            lambda size: "Parameters\n----------\na" + " " * size + "b",
+        ),
+        (
+            DocstringStyle.NUMPYDOC,
+            lambda size: "Returns\n-------\na" + " " * size + "b",
+        ),
+        # Default values, in the types and in the descriptions.
+        (
+            DocstringStyle.NUMPYDOC,
+            lambda size: "Parameters\n----------\nx : int, default"
+            + " = " * size,
+        ),
+        (
+            DocstringStyle.NUMPYDOC,
+            lambda size: "Parameters\n----------\nx\n    "
+            + "default '" * size,
+        ),
+        (
+            DocstringStyle.REST,
+            lambda size: ":param x: " + "defaults to 1\n" * size,
+        ),
+        (
+            DocstringStyle.EPYDOC,
+            lambda size: "@param x: " + "defaults to 1\n" * size,
+        ),
+        # Long words that are never followed by a colon.
+        (DocstringStyle.EPYDOC, lambda size: "@" + "a" * size),
+        (DocstringStyle.EPYDOC, lambda size: "@" + "1a" * size),
+        (DocstringStyle.EPYDOC, lambda size: "@" + "ab " * size),
+        (DocstringStyle.AUTO, lambda size: "@" + "ab " * size),
+        # Long lists of arguments, before a colon.
+        (DocstringStyle.EPYDOC, lambda size: "@" + "ab " * size + "ab:"),
+    ],
+)
+def test_crafted_input(
+    style: DocstringStyle, make_text: T.Callable[[int], str]
+) -> None:
+    """Test parsing inputs crafted to make regexes backtrack."""
+    _assert_linear(
+        functools.partial(parse, style=style, errors="collect"),
+        make_text,
+        4000,
+    )
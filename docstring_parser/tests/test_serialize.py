@@ -0,0 +1,162 @@
+"""Tests for serialization of parsed docstrings."""
+
+import json
+import pickle
+import typing as T
+
+import pytest
+from docstring_parser.common import (
+    Docstring,
+    DocstringDeprecated,
+    DocstringExample,
+    DocstringMeta,
+    DocstringParam,
+    DocstringRaises,
+    DocstringReturns,
+    DocstringStyle,
+)
+from docstring_parser.parser import parse
+from docstring_parser.serialize import decode, encode
+
+
+def _make_docstrings() -> T.List[Docstring]:
+    docstring = Docstring(style=DocstringStyle.NUMPYDOC)
+    docstring.short_description = "Short description"
+    docstring.long_description = "Long description"
+    docstring.blank_after_short_description = True
+    docstring.meta = [
+        DocstringMeta(["custom", "1"], "desc"),
+        DocstringParam(["param", "x"], "desc x", "x", "int", True, "1"),
+        DocstringParam(["param", "y"], None, "y", None, None, None),
+        DocstringReturns(["returns"], "desc", "int", False, "ret"),
+        DocstringReturns(["yields"], None, None, True),
+        DocstringRaises(["raises", "ValueError"], "desc", "ValueError"),
+        DocstringDeprecated(["deprecation"], "desc", "1.0"),
+        DocstringExample(["examples"], ">>> x = 1", "desc"),
+    ]
+    empty = Docstring()
+    empty.blank_after_long_description = True
+    return [
+        docstring,
+        empty,
+        parse("Short\n\n:param int x: desc\n:returns: desc"),
+        parse("Short\n\nArgs:\n    x (int): desc. Defaults to 1."),
+        parse("Short\n\n@param x: desc\n@type x: int\n@return: desc"),
+        parse(
+            "Short\n\n:param: desc\n:returns: desc",
+            DocstringStyle.REST,
+            errors="collect",
+        ),
+    ]
+
+
+def _dump(docstring: Docstring) -> T.List[T.Any]:
+    return [
+        type(docstring),
+        docstring.style,
+        docstring.short_description,
+        docstring.long_description,
+        docstring.blank_after_short_description,
+        docstring.blank_after_long_description,
+        [
+            (type(meta), meta.to_dict(), type(meta.args))
+            for meta in docstring.meta
+        ],
+        docstring.diagnostics,
+    ]
+
+
+@pytest.mark.parametrize(
+    "round_trip",
+    [
+        lambda docstrings: [
+            Docstring.from_dict(d.to_dict()) for d in docstrings
+        ],
+        lambda docstrings: [
+            Docstring.from_dict(json.loads(json.dumps(d.to_dict())))
+            for d in docstrings
+        ],
+        lambda docstrings: decode(encode(docstrings)),
+        lambda docstrings: decode(json.loads(json.dumps(encode(docstrings)))),
+        lambda docstrings: decode(
+            pickle.loads(pickle.dumps(encode(docstrings)))
+        ),
+    ],
+)
+def test_round_trip(round_trip) -> None:
+    """Test that serialized docstrings come back the same."""
+    docstrings = _make_docstrings()
+
+    assert [_dump(d) for d in round_trip(docstrings)] == [
+        _dump(d) for d in docstrings
+    ]
+
+
+def test_to_dict() -> None:
+    """Test converting docstrings to dictionaries."""
+    docstring = parse(
+        "Short\n\n:param int x: desc\n:raises ValueError: oops", lazy=True
+    )
+
+    assert docstring.to_dict() == {
+        "short_description": "Short",
+        "long_description": None,
+        "blank_after_short_description": True,
+        "blank_after_long_description": False,
+        "style": "REST",
+        "meta": [
+            {
+                "kind": "param",
+                "args": ["param", "int", "x"],
+                "description": "desc",
+                "arg_name": "x",
+                "type_name": "int",
+                "is_optional": False,
+                "default": None,
+            },
+            {
+                "kind": "raises",
+                "args": ["raises", "ValueError"],
+                "description": "oops",
+                "type_name": "ValueError",
+            },
+        ],
+        "diagnostics": [],
+    }
+
+
+def test_subclass() -> None:
+    """Test serializing subclasses of the meta information."""
+
+    class CustomRaises(DocstringRaises):
+        """Custom exception information."""
+
+    docstring = Docstring()
+    docstring.meta.append(CustomRaises(["raises"], "desc", "ValueError"))
+
+    for clone in (
+        Docstring.from_dict(docstring.to_dict()),
+        decode(encode([docstring]))[0],
+    ):
+        assert isinstance(clone.meta[0], DocstringRaises)
+        assert not isinstance(clone.meta[0], CustomRaises)
+        assert clone.raises[0].type_name == "ValueError"
+
+
+def test_encode_shares_values() -> None:
+    """Test that repeated values are stored once per batch."""
+    docstrings = [parse(":param int x: desc"), parse(":param int y: desc")]
+
+    _version, values, _rows = encode(docstrings)
+
+    assert len(values) == len(set(map(repr, values)))
+    assert values.count("int") == 1
+    assert values.count("desc") == 1
+
+
+def test_decode_unknown_version() -> None:
+    """Test refusing payloads of other format versions."""
+    _version, values, rows = encode([parse("Short")])
+
+    with pytest.raises(ValueError):
+        decode((0, values, rows))
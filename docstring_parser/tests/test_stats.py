@@ -0,0 +1,158 @@
+"""Tests for the statistics of parsing and composing docstrings."""
+
+import importlib
+import json
+import typing as T
+
+import pytest
+from docstring_parser import google, rest, stats
+from docstring_parser.common import DocstringStyle, ParseError
+from docstring_parser.parser import compose, parse, parse_from_object
+
+SOURCE = """
+Short description
+
+:param int spam: spam desc
+:raises ValueError: exc desc
+"""
+
+
+@pytest.fixture(name="enabled", autouse=True)
+def fixture_enabled() -> T.Iterator[None]:
+    """Record the statistics from scratch for the duration of a test."""
+    stats.reset()
+    stats.enable()
+    yield
+    stats.disable()
+    stats.reset()
+
+
+def _counts(operation: str, style: str) -> T.Tuple[int, int, int]:
+    counters = stats.snapshot()["operations"][operation][style]
+    latency = counters["latency"]
+    assert sum(latency["counts"]) == counters["calls"]
+    assert len(latency["counts"]) == len(latency["buckets"]) + 1
+    assert latency["sum"] >= 0
+    return counters["calls"], counters["errors"], counters["bytes"]
+
+
+def test_parse() -> None:
+    """Test the statistics of parsing in a specific style."""
+    parse(SOURCE, DocstringStyle.REST)
+    parse("Short", DocstringStyle.REST)
+    rest.parse("Short é")
+
+    assert _counts("parse", "REST") == (2, 0, len(SOURCE) + 5)
+    assert _counts("style_parse", "REST") == (3, 0, len(SOURCE) + 13)
+    assert not stats.snapshot()["auto"]["wins"]
+
+
+def test_parse_errors() -> None:
+    """Test the statistics of parsing that fails."""
+    with pytest.raises(ParseError):
+        parse("Args:\n    spam", DocstringStyle.GOOGLE)
+    parse("Args:\n    spam", DocstringStyle.GOOGLE, errors="collect")
+    with pytest.raises(ParseError):
+        google.parse("Args:\n    spam")
+
+    assert _counts("parse", "GOOGLE") == (2, 1, 28)
+    assert _counts("style_parse", "GOOGLE") == (3, 2, 42)
+
+
+def test_autodetection() -> None:
+    """Test the statistics of the automatic style detection."""
+    parse(SOURCE)
+    parse("Short\n\nArgs:\n    spam: spam desc")
+    parse("Short")
+    parse(SOURCE, lazy=True)
+    # Malformed in the ReST style, but not in the Google one.
+    parse("Short\n\nArgs:\n    spam: spam desc\n:param 3 + 3 a: desc")
+
+    snapshot = stats.snapshot()
+    assert _counts("parse", "AUTO")[:2] == (5, 0)
+    # Every style tried is counted, as an error if the meta is malformed.
+    assert list(snapshot["operations"]["style_parse"]) == ["GOOGLE", "REST"]
+    assert _counts("style_parse", "REST")[:2] == (4, 1)
+    assert _counts("style_parse", "GOOGLE")[:2] == (2, 0)
+    assert snapshot["auto"]["wins"] == {"REST": 3, "GOOGLE": 2}
+    assert set(snapshot["auto"]["losing_seconds"]) == {
+        "REST",
+        "GOOGLE",
+        "NUMPYDOC",
+        "EPYDOC",
+    }
+
+
+def test_compose() -> None:
+    """Test the statistics of composing docstrings."""
+    docstring = parse(SOURCE)
+    text = compose(docstring)
+    compose(docstring, DocstringStyle.GOOGLE)
+
+    assert _counts("compose", "REST") == (1, 0, len(text))
+    assert _counts("compose", "GOOGLE")[:2] == (1, 0)
+
+
+def test_parse_from_object() -> None:
+    """Test the statistics of parsing the docstrings of objects."""
+
+    def func() -> None:
+        """Short description
+
+        :param int spam: spam desc
+        """
+
+    parse_from_object(func)
+
+    assert _counts("parse_from_object", "AUTO")[:2] == (1, 0)
+    assert _counts("parse", "AUTO")[:2] == (1, 0)
+
+
+def test_snapshot() -> None:
+    """Test that the snapshots are serializable copies of the statistics."""
+    parse(SOURCE)
+    snapshot = stats.snapshot()
+    assert snapshot["enabled"]
+    assert json.loads(json.dumps(snapshot)) == snapshot
+
+    snapshot["operations"]["parse"]["AUTO"]["calls"] = 10
+    assert _counts("parse", "AUTO")[0] == 1
+
+    stats.reset()
+    assert stats.snapshot() == {
+        "enabled": True,
+        "operations": {},
+        "auto": {"wins": {}, "losing_seconds": {}},
+    }
+
+
+def test_disabled() -> None:
+    """Test that nothing is recorded while disabled."""
+    stats.disable()
+    parse(SOURCE)
+    rest.parse(SOURCE)
+    compose(parse(SOURCE))
+    assert stats.snapshot() == {
+        "enabled": False,
+        "operations": {},
+        "auto": {"wins": {}, "losing_seconds": {}},
+    }
+
+
+@pytest.mark.parametrize(
+    "value, expected", [(None, False), ("0", False), ("", False), ("1", True)]
+)
+def test_environment_variable(
+    monkeypatch: pytest.MonkeyPatch, value: T.Optional[str], expected: bool
+) -> None:
+    """Test enabling the statistics with the environment variable."""
+    if value is None:
+        monkeypatch.delenv("DOCSTRING_PARSER_STATS", raising=False)
+    else:
+        monkeypatch.setenv("DOCSTRING_PARSER_STATS", value)
+    try:
+        importlib.reload(stats)
+        assert stats.ENABLED is expected
+    finally:
+        monkeypatch.delenv("DOCSTRING_PARSER_STATS", raising=False)
+        importlib.reload(stats)